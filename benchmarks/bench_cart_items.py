@@ -0,0 +1,110 @@
+"""Benchmark of cart_items normalization: original iterrows loop vs vectorized build.
+
+Usage: python benchmarks/bench_cart_items.py [--items 10000 100000 1000000]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.transform import build_cart_items  # noqa: E402
+
+ITEMS_PER_CART = 5
+
+
+def make_carts(n_items: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic dummyjson-shaped carts with n_items products in total."""
+    rng = random.Random(seed)
+    carts = []
+    for cart_id in range(1, n_items // ITEMS_PER_CART + 1):
+        products = []
+        for _ in range(ITEMS_PER_CART):
+            price = round(rng.uniform(1, 2000), 2)
+            quantity = rng.randint(1, 5)
+            discount = round(rng.uniform(0, 20), 2)
+            products.append(
+                {
+                    "id": rng.randint(1, 200),
+                    "title": f"Product {rng.randint(1, 200)}",
+                    "price": price,
+                    "quantity": quantity,
+                    "total": price * quantity,
+                    "discountPercentage": discount,
+                    "discountedTotal": round(
+                        price * quantity * (1 - discount / 100), 2
+                    ),
+                    "thumbnail": "https://cdn.dummyjson.com/products/thumbnail.png",
+                }
+            )
+        carts.append({"id": cart_id, "products": products, "userId": cart_id})
+    return pd.DataFrame(carts)
+
+
+def iterrows_cart_items(carts_df_raw: pd.DataFrame) -> pd.DataFrame:
+    """Original implementation (row iteration with nested python loop)."""
+    cart_items_list = []
+    for _, cart_row in carts_df_raw.iterrows():
+        cart_id = cart_row["id"]
+        if "products" in cart_row and isinstance(cart_row["products"], list):
+            for product in cart_row["products"]:
+                cart_items_list.append(
+                    {
+                        "cart_id": cart_id,
+                        "product_id": product.get("id"),
+                        "title": product.get("title"),
+                        "quantity": product.get("quantity"),
+                        "price": product.get("price"),
+                        "total": product.get("total"),
+                        "discount_percentage": product.get("discountPercentage"),
+                        "discounted_price": product.get("discountedTotal"),
+                    }
+                )
+    cart_items = pd.DataFrame(cart_items_list)
+    cart_items["product_id"] = pd.to_numeric(cart_items["product_id"]).astype("Int64")
+    cart_items["quantity"] = pd.to_numeric(cart_items["quantity"]).astype("Int64")
+    for column in ["price", "total", "discount_percentage", "discounted_price"]:
+        cart_items[column] = pd.to_numeric(cart_items[column])
+    return cart_items
+
+
+def best_of(func, carts_df, repeat) -> tuple[float, pd.DataFrame]:
+    """Best wall time of repeated calls and the last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(carts_df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--items", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    print(f"{'items':>10} {'iterrows [s]':>14} {'vectorized [s]':>16} {'speedup':>9}")
+    for n_items in args.items:
+        carts_df = make_carts(n_items)
+        old_time, old_items = best_of(iterrows_cart_items, carts_df, args.repeat)
+        new_time, new_items = best_of(build_cart_items, carts_df, args.repeat)
+        pd.testing.assert_frame_equal(old_items, new_items)
+        print(
+            f"{n_items:>10} {old_time:>14.3f} {new_time:>16.3f}"
+            f" {old_time / new_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""End-to-end benchmarks of conversion, transformations, SQLite load and full pipeline.
+
+Data are generated by benchmarks/datagen.py at named scales, the full pipeline
+extracts them from a local dummyjson-style server (benchmarks/dummy_api.py).
+Results are written as JSON, compare two result files with
+benchmarks/compare_results.py.
+
+Usage: python benchmarks/bench_etl.py [--scales small medium]
+       [--benchmarks convert transform load pipeline] [--repeat 3]
+       [--output benchmarks/results/etl.json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+# Add parent directory to path
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(BENCHMARKS_DIR))
+
+import config  # noqa: E402
+from datagen import generate_dataset  # noqa: E402
+from dummy_api import DummyJsonServer  # noqa: E402
+from src.load import create_db_engine  # noqa: E402
+from src.load import load_dataframe_to_db  # noqa: E402
+from src.migrations import MigrationManager  # noqa: E402
+from src.transform import (  # noqa: E402
+    convert_list_to_dataframe,
+    transform_carts,
+    transform_product_reviews,
+    transform_products,
+    transform_users,
+)
+
+# Numbers of generated users, products and carts
+SCALES = {
+    "small": {"users": 208, "products": 194, "carts": 50},
+    "medium": {"users": 10_000, "products": 5_000, "carts": 20_000},
+    "large": {"users": 100_000, "products": 50_000, "carts": 200_000},
+}
+BENCHMARKS = ["convert", "transform", "load", "pipeline"]
+# Tables in order respecting foreign keys
+LOAD_ORDER = ["users", "products", "product_reviews", "carts", "cart_items"]
+SQLITE_DDL_FILE = "schema_sqlite_ddl.sql"
+
+
+def measure(func, repeat: int, setup=None) -> dict:
+    """Wall times of repeated calls (setup is called before every call and
+    is not timed) and the last result."""
+    times, result = [], None
+    for _ in range(repeat):
+        args = setup() if setup is not None else ()
+        start = time.perf_counter()
+        result = func(*args)
+        times.append(time.perf_counter() - start)
+    return {
+        "best_s": min(times),
+        "mean_s": statistics.fmean(times),
+        "times_s": times,
+        "result": result,
+    }
+
+
+def _record(results, benchmark, name, scale, rows, timing):
+    """Append result of one benchmark and print it."""
+    timing.pop("result", None)
+    entry = {
+        "benchmark": benchmark,
+        "name": name,
+        "scale": scale,
+        "rows": rows,
+        **timing,
+        "rows_per_s": rows / timing["best_s"] if timing["best_s"] else None,
+    }
+    results.append(entry)
+    print(
+        f"{scale:>8} {name:<28} {rows:>10} {timing['best_s']:>10.3f}"
+        f" {timing['mean_s']:>10.3f}"
+    )
+
+
+def raw_frames(dataset: dict) -> dict:
+    return {
+        name: convert_list_to_dataframe(records, name)
+        for name, records in dataset.items()
+    }
+
+
+def cleaned_tables(frames: dict) -> dict:
+    carts, cart_items = transform_carts(frames["carts"])
+    return {
+        "users": transform_users(frames["users"]),
+        "products": transform_products(frames["products"]),
+        "product_reviews": transform_product_reviews(frames["products"]),
+        "carts": carts,
+        "cart_items": cart_items,
+    }
+
+
+def bench_convert(dataset, scale, repeat, results):
+    for name, records in dataset.items():
+        timing = measure(lambda: convert_list_to_dataframe(records, name), repeat)
+        _record(results, "convert", f"convert:{name}", scale, len(records), timing)
+
+
+def bench_transform(dataset, scale, repeat, results):
+    frames = raw_frames(dataset)
+    transforms = [
+        (transform_users, frames["users"]),
+        (transform_products, frames["products"]),
+        (transform_product_reviews, frames["products"]),
+        (transform_carts, frames["carts"]),
+    ]
+    for transform, df_raw in transforms:
+        timing = measure(lambda: transform(df_raw.copy()), repeat)
+        _record(results, "transform", transform.__name__, scale, len(df_raw), timing)
+
+
+def bench_load(dataset, scale, repeat, results, workdir):
+    tables = cleaned_tables(raw_frames(dataset))
+    engine = create_db_engine(f"sqlite:///{os.path.join(workdir, 'load.db')}")
+    try:
+        for table_name in LOAD_ORDER:
+            df = tables[table_name]
+
+            def setup():
+                # Fresh tables (DDL and migrations), parent rows are loaded untimed
+                MigrationManager(engine, config.SQL_DIR, "sqlite").migrate(
+                    SQLITE_DDL_FILE, force=True
+                )
+                for parent in LOAD_ORDER[: LOAD_ORDER.index(table_name)]:
+                    load_dataframe_to_db(tables[parent], parent, engine)
+                return ()
+
+            timing = measure(
+                lambda: load_dataframe_to_db(df, table_name, engine), repeat, setup
+            )
+            if not timing["result"]:
+                raise RuntimeError(f"Load of table '{table_name}' failed.")
+            _record(results, "load", f"load:{table_name}", scale, len(df), timing)
+    finally:
+        engine.dispose()
+
+
+def bench_pipeline(dataset, scale, repeat, results, workdir):
+    from src import pipeline  # pylint: disable=import-outside-toplevel
+
+    expected_rows = sum(len(df) for df in cleaned_tables(raw_frames(dataset)).values())
+    runs = iter(range(repeat))
+
+    def setup():
+        # Every run starts with empty data directory, cache and database
+        data_dir = os.path.join(workdir, f"pipeline_{next(runs)}")
+        os.makedirs(data_dir)
+        # Checkpoints and SQLite database are derived from DATA_DIR
+        config.DATA_DIR = data_dir
+        config.DB_TYPE = "sqlite"
+        config.LOAD_PRODUCT_REVIEWS = True
+        return (config.DB_CONNECTION_STRING.removeprefix("sqlite:///"),)
+
+    def run(db_path):
+        pipeline.run_pipeline()
+        with sqlite3.connect(db_path) as connection:
+            return sum(
+                connection.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+                for table_name in LOAD_ORDER
+            )
+
+    settings = {
+        name: getattr(config, name)
+        for name in (
+            "API_ENDPOINTS",
+            "DATA_DIR",
+            "DB_TYPE",
+            "LOAD_PRODUCT_REVIEWS",
+        )
+    }
+    try:
+        with DummyJsonServer(dataset) as server:
+            config.API_ENDPOINTS = server.endpoints
+            timing = measure(run, repeat, setup)
+    finally:
+        for name, value in settings.items():
+            setattr(config, name, value)
+    if timing["result"] != expected_rows:
+        raise RuntimeError(
+            f"Pipeline loaded {timing['result']} rows, expected {expected_rows}."
+        )
+    _record(results, "pipeline", "run_pipeline", scale, expected_rows, timing)
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=["small"])
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=BENCHMARKS, default=BENCHMARKS
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output",
+        default=os.path.join(
+            BENCHMARKS_DIR,
+            "results",
+            f"etl_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        ),
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    results = []
+    print(
+        f"{'scale':>8} {'benchmark':<28} {'rows':>10} {'best [s]':>10} {'mean [s]':>10}"
+    )
+    with tempfile.TemporaryDirectory(prefix="bench_etl_") as workdir:
+        for scale in args.scales:
+            dataset = generate_dataset(**SCALES[scale], seed=args.seed)
+            if "convert" in args.benchmarks:
+                bench_convert(dataset, scale, args.repeat, results)
+            if "transform" in args.benchmarks:
+                bench_transform(dataset, scale, args.repeat, results)
+            if "load" in args.benchmarks:
+                bench_load(dataset, scale, args.repeat, results, workdir)
+            if "pipeline" in args.benchmarks:
+                bench_pipeline(
+                    dataset,
+                    scale,
+                    args.repeat,
+                    results,
+                    os.path.join(workdir, scale),
+                )
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "scales": {scale: SCALES[scale] for scale in args.scales},
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare two benchmark result files of bench_etl.py and report regressions.
+
+Benchmarks are matched by name and scale, best times are compared. Exit code
+is 1 if any benchmark is slower than baseline by more than the threshold.
+
+Usage: python benchmarks/compare_results.py baseline.json current.json
+       [--threshold 0.10]
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_results(path: str) -> dict:
+    """Return (name, scale) -> result entry of result file."""
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    return {(entry["name"], entry["scale"]): entry for entry in report["results"]}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    """Return comparison of benchmarks present in both result sets."""
+    rows = []
+    for key in baseline.keys() & current.keys():
+        old, new = baseline[key]["best_s"], current[key]["best_s"]
+        change = (new - old) / old if old else 0.0
+        rows.append(
+            {
+                "name": key[0],
+                "scale": key[1],
+                "baseline_s": old,
+                "current_s": new,
+                "change": change,
+                "regression": change > threshold,
+            }
+        )
+    return sorted(rows, key=lambda row: (row["scale"], row["name"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="allowed relative slowdown (0.10 = 10 %%)",
+    )
+    args = parser.parse_args()
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    rows = compare(baseline, current, args.threshold)
+    print(
+        f"{'scale':>8} {'benchmark':<28} {'baseline [s]':>13}"
+        f" {'current [s]':>12} {'change':>8}"
+    )
+    for row in rows:
+        print(
+            f"{row['scale']:>8} {row['name']:<28} {row['baseline_s']:>13.3f}"
+            f" {row['current_s']:>12.3f} {row['change']:>+8.1%}"
+            f"{'  REGRESSION' if row['regression'] else ''}"
+        )
+    for key in sorted(baseline.keys() ^ current.keys()):
+        print(f"{key[1]:>8} {key[0]:<28} only in one of result files")
+
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) slower by more than {args.threshold:.0%}."
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Deterministic generator of synthetic dummyjson-shaped users, products and carts.
+
+Records have the same fields and nesting as responses of https://dummyjson.com
+(see data/*_data.json), so they go through the same conversion, transformation
+and load code as real data. The same scale and seed always give the same data.
+
+Usage: python benchmarks/datagen.py --users 10000 --products 5000 --carts 20000
+       [--seed 42] [--output-dir benchmarks/data]
+"""
+
+import argparse
+import json
+import os
+import random
+
+CATEGORIES = ["beauty", "fragrances", "furniture", "groceries", "laptops", "vehicle"]
+BRANDS = ["Essence", "Glamour Beauty", "Annibale Colombo", "Apple", "Dodge", None]
+FIRST_NAMES = ["Emily", "Michael", "Sophia", "James", "Emma", "Olivia", "Lucas"]
+LAST_NAMES = ["Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Gordon"]
+CITIES = [
+    ("Phoenix", "Mississippi"),
+    ("Houston", "Alabama"),
+    ("Washington", "Alabama"),
+    ("Seattle", "Pennsylvania"),
+    ("Jacksonville", "Colorado"),
+]
+REVIEW_COMMENTS = ["Would not recommend!", "Very satisfied!", "Highly impressed!"]
+TIMESTAMP = "2025-04-30T09:41:02.053Z"
+
+# Default numbers of records (about the size of files in data/)
+DEFAULT_SCALE = {"users": 208, "products": 194, "carts": 50}
+
+
+def _address(rng: random.Random) -> dict:
+    city, state = rng.choice(CITIES)
+    return {
+        "address": f"{rng.randint(1, 9999)} Main Street",
+        "city": city,
+        "state": state,
+        "stateCode": state[:2].upper(),
+        "postalCode": f"{rng.randint(10000, 99999)}",
+        "coordinates": {
+            "lat": round(rng.uniform(-90, 90), 6),
+            "lng": round(rng.uniform(-180, 180), 6),
+        },
+        "country": "United States",
+    }
+
+
+def generate_users(n_users: int, seed: int = 42) -> list[dict]:
+    """Users with nested address, hair, bank, company and crypto objects."""
+    rng = random.Random(seed)
+    users = []
+    for user_id in range(1, n_users + 1):
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        username = f"{first_name.lower()}{user_id}"
+        users.append(
+            {
+                "id": user_id,
+                "firstName": first_name,
+                "lastName": last_name,
+                "maidenName": "",
+                "age": rng.randint(18, 80),
+                "gender": rng.choice(["female", "male"]),
+                "email": f"{username}@x.dummyjson.com",
+                "phone": f"+{rng.randint(1, 99)} {rng.randint(100, 999)}-"
+                f"{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+                "username": username,
+                "password": f"{username}pass",
+                "birthDate": f"{rng.randint(1945, 2006)}-{rng.randint(1, 12)}-"
+                f"{rng.randint(1, 28)}",
+                "image": f"https://dummyjson.com/icon/{username}/128",
+                "bloodGroup": rng.choice(["A+", "A-", "B+", "O-"]),
+                "height": round(rng.uniform(150, 200), 2),
+                "weight": round(rng.uniform(45, 120), 2),
+                "eyeColor": rng.choice(["Green", "Brown", "Blue"]),
+                "hair": {"color": "Brown", "type": rng.choice(["Curly", "Straight"])},
+                "ip": ".".join(str(rng.randint(1, 254)) for _ in range(4)),
+                "address": _address(rng),
+                "macAddress": ":".join(f"{rng.randint(0, 255):02x}" for _ in range(6)),
+                "university": "University of Wisconsin--Madison",
+                "bank": {
+                    "cardExpire": f"{rng.randint(1, 12):02d}/{rng.randint(25, 30)}",
+                    "cardNumber": f"{rng.randint(10**15, 10**16 - 1)}",
+                    "cardType": rng.choice(["Elo", "Visa", "Mastercard"]),
+                    "currency": rng.choice(["CNY", "USD", "EUR"]),
+                    "iban": f"{rng.getrandbits(96):024X}",
+                },
+                "company": {
+                    "department": rng.choice(["Engineering", "Sales", "Support"]),
+                    "name": f"{last_name} and Sons",
+                    "title": "Sales Manager",
+                    "address": _address(rng),
+                },
+                "ein": f"{rng.randint(100, 999)}-{rng.randint(100, 999)}",
+                "ssn": f"{rng.randint(100, 999)}-{rng.randint(100, 999)}-"
+                f"{rng.randint(100, 999)}",
+                "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
+                "crypto": {
+                    "coin": "Bitcoin",
+                    "wallet": f"0x{rng.getrandbits(160):040x}",
+                    "network": "Ethereum (ERC20)",
+                },
+                "role": rng.choice(["admin", "moderator", "user"]),
+            }
+        )
+    return users
+
+
+def generate_products(
+    n_products: int, seed: int = 42, max_reviews: int = 5
+) -> list[dict]:
+    """Products with nested reviews (0 to max_reviews per product), dimensions
+    and meta objects."""
+    rng = random.Random(seed + 1)
+    products = []
+    for product_id in range(1, n_products + 1):
+        category = rng.choice(CATEGORIES)
+        reviews = []
+        for _ in range(rng.randint(0, max_reviews)):
+            first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            reviews.append(
+                {
+                    "rating": rng.randint(1, 5),
+                    "comment": rng.choice(REVIEW_COMMENTS),
+                    "date": TIMESTAMP,
+                    "reviewerName": f"{first_name} {last_name}",
+                    "reviewerEmail": f"{first_name}.{last_name}@x.dummyjson.com".lower(),
+                }
+            )
+        products.append(
+            {
+                "id": product_id,
+                "title": f"{category.title()} product {product_id}",
+                "description": f"Synthetic {category} product number {product_id}.",
+                "category": category,
+                "price": round(rng.uniform(1, 2000), 2),
+                "discountPercentage": round(rng.uniform(0, 20), 2),
+                "rating": round(rng.uniform(1, 5), 2),
+                "stock": rng.randint(0, 150),
+                "tags": [category],
+                "brand": rng.choice(BRANDS),
+                "sku": f"{category[:3].upper()}-{product_id:06d}",
+                "weight": rng.randint(1, 10),
+                "dimensions": {
+                    "width": round(rng.uniform(5, 30), 2),
+                    "height": round(rng.uniform(5, 30), 2),
+                    "depth": round(rng.uniform(5, 30), 2),
+                },
+                "warrantyInformation": "1 week warranty",
+                "shippingInformation": "Ships in 3-5 business days",
+                "availabilityStatus": "In Stock",
+                "reviews": reviews,
+                "returnPolicy": "No return policy",
+                "minimumOrderQuantity": rng.randint(1, 50),
+                "meta": {
+                    "createdAt": TIMESTAMP,
+                    "updatedAt": TIMESTAMP,
+                    "barcode": f"{rng.randint(10**12, 10**13 - 1)}",
+                    "qrCode": "https://cdn.dummyjson.com/public/qr-code.png",
+                },
+                "images": [f"https://cdn.dummyjson.com/{category}/{product_id}/1.webp"],
+                "thumbnail": f"https://cdn.dummyjson.com/{category}/{product_id}/t.webp",
+            }
+        )
+    return products
+
+
+def generate_carts(
+    n_carts: int,
+    n_users: int,
+    products: list[dict],
+    seed: int = 42,
+    max_items: int = 5,
+) -> list[dict]:
+    """Carts with nested products (1 to max_items per cart) referencing
+    existing users and products, totals are computed as dummyjson does."""
+    rng = random.Random(seed + 2)
+    carts = []
+    for cart_id in range(1, n_carts + 1):
+        items = []
+        for product in rng.sample(
+            products, min(len(products), rng.randint(1, max_items))
+        ):
+            quantity = rng.randint(1, 5)
+            total = product["price"] * quantity
+            items.append(
+                {
+                    "id": product["id"],
+                    "title": product["title"],
+                    "price": product["price"],
+                    "quantity": quantity,
+                    "total": total,
+                    "discountPercentage": product["discountPercentage"],
+                    "discountedTotal": round(
+                        total * (1 - product["discountPercentage"] / 100), 2
+                    ),
+                    "thumbnail": product["thumbnail"],
+                }
+            )
+        carts.append(
+            {
+                "id": cart_id,
+                "products": items,
+                "total": round(sum(item["total"] for item in items), 2),
+                "discountedTotal": round(
+                    sum(item["discountedTotal"] for item in items), 2
+                ),
+                "userId": rng.randint(1, n_users),
+                "totalProducts": len(items),
+                "totalQuantity": sum(item["quantity"] for item in items),
+            }
+        )
+    return carts
+
+
+def generate_dataset(
+    users: int = DEFAULT_SCALE["users"],
+    products: int = DEFAULT_SCALE["products"],
+    carts: int = DEFAULT_SCALE["carts"],
+    seed: int = 42,
+) -> dict:
+    """Return entity name -> list of records (users, products and carts)."""
+    product_records = generate_products(products, seed)
+    return {
+        "users": generate_users(users, seed),
+        "products": product_records,
+        "carts": generate_carts(carts, users, product_records, seed),
+    }
+
+
+def write_dataset(dataset: dict, directory: str) -> dict:
+    """Write dataset as API responses (<entity>_data.json files as in data/).
+
+    Returns:
+    dict: Entity name -> path to written file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for name, records in dataset.items():
+        paths[name] = os.path.join(directory, f"{name}_data.json")
+        with open(paths[name], "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    name: records,
+                    "total": len(records),
+                    "skip": 0,
+                    "limit": len(records),
+                },
+                f,
+            )
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=DEFAULT_SCALE["users"])
+    parser.add_argument("--products", type=int, default=DEFAULT_SCALE["products"])
+    parser.add_argument("--carts", type=int, default=DEFAULT_SCALE["carts"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--output-dir",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"),
+    )
+    args = parser.parse_args()
+
+    dataset = generate_dataset(args.users, args.products, args.carts, args.seed)
+    for name, path in write_dataset(dataset, args.output_dir).items():
+        print(f"{name:>10} {len(dataset[name]):>10} records -> {path}")
+
+
+if __name__ == "__main__":
+    main()
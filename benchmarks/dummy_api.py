@@ -0,0 +1,85 @@
+"""Local HTTP server with dummyjson-style paginated endpoints of a generated dataset"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Url paths of entities (dummyjson serves carts under /cart)
+ENTITY_PATHS = {"users": "users", "products": "products", "carts": "cart"}
+
+
+class DummyJsonServer:
+    """Serve dataset (entity name -> records) on 127.0.0.1 with 'limit'/'skip'
+    pagination and 'total' count as https://dummyjson.com does.
+
+    Usage:
+        with DummyJsonServer(dataset) as server:
+            config.API_ENDPOINTS = server.endpoints
+    """
+
+    def __init__(self, dataset: dict, port: int = 0):
+        records_by_path = {
+            ENTITY_PATHS.get(name, name): (name, records)
+            for name, records in dataset.items()
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                entity = records_by_path.get(parts.path.strip("/"))
+                if entity is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                name, records = entity
+                query = parse_qs(parts.query)
+                skip = int(query.get("skip", ["0"])[0])
+                limit = int(query.get("limit", ["30"])[0]) or len(records)
+                page = records[skip : skip + limit]
+                body = json.dumps(
+                    {
+                        name: page,
+                        "total": len(records),
+                        "skip": skip,
+                        "limit": len(page),
+                    }
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+        self.endpoints = {
+            name: f"http://127.0.0.1:{self._server.server_port}/{path}"
+            for path, (name, _) in records_by_path.items()
+        }
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="dummy-api", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -1,172 +1,376 @@
 """Module providing configuration for project.
 Ssuch as dir route, API configuration, logging configuration and database configuration
+
+Importing this module has no side effects: .env file and environment variables
+are read when the first setting is accessed, either as typed Settings object
+(get_settings().load_mode) or as module constant (config.LOAD_MODE, resolved
+from the same object). Constants can be overridden by assignment
+(config.DATA_DIR = ...), e.g. in benchmarks; settings derived from overridden
+constant (DB_CONNECTION_STRING and CHECKPOINT_DIR from DATA_DIR, ...) follow it.
 """
 
+import logging
 import os
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property, lru_cache
 
-from dotenv import load_dotenv
+logger = logging.getLogger(__name__)
 
-# --- Load variables from .env file
 PROJECT_ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__)))
 DOTENV_PATH = os.path.join(PROJECT_ROOT_DIR, ".env")
 
-if os.path.exists(DOTENV_PATH):
-    load_dotenv(dotenv_path=DOTENV_PATH)
-    print(f"INFO: Variables from .env successfully loaded {DOTENV_PATH}",)
-else:
-    print(
-        f"INFO: .env file could not be found, {DOTENV_PATH}."
-        f"Default values or system environment variables are used."
-    )
 
-# --- Base project Configuration ---
-BASE_DIR = PROJECT_ROOT_DIR
-# route to folder for data saving
-DATA_DIR = os.path.join(BASE_DIR, "data")
-# route to folder for log files
-LOG_DIR = os.path.join(BASE_DIR, "logs")
-# route to with sql
-SQL_DIR = os.path.join(BASE_DIR, "sql")
-# create folder "data" if not exists
-os.makedirs(DATA_DIR, exist_ok=True)
-
-# --- Database Schema Configuration ---
-TARGET_DB_SCHEMA = "etl"
-
-# -- API configuration --
-API_ENDPOINTS = {
-    "users": "https://dummyjson.com/users?limit=1000",
-    "products": "https://dummyjson.com/products?limit=1000",
-    "carts": "https://dummyjson.com/cart?limit=1000",
-}
+def _flag(value: str) -> bool:
+    """Parse boolean flag ("1", "true", "yes", "on")."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env(name: str, default: str, cast=str):
+    """Settings field read from environment variable when settings are created."""
+    return field(default_factory=lambda: cast(os.getenv(name, default)))
 
-# --- Logging Configuration ---
-LOG_FILE_PATH = os.path.join(LOG_DIR, "etl_pipeline.log")
-LOGGING_CONFIG = {
-    "version": 1,  # Version of schema config
-    "disable_existing_loggers": False,  # Keep existing loggers
-    # Format of logs
-    "formatters": {
-        "standard": {
-            # basic format for console
-            "format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        },
-        "detailed": {
-            # Detailed format for file
-            "format": "%(asctime)s - %(levelname)s - %(name)s - %(module)s - "
-            "%(funcName)s - %(lineno)d - %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S",
-        },
-    },
-    # Handlers (where logs should be send)
-    "handlers": {
-        "console": {  # dict for console handler
-            "level": "INFO",
-            "class": "logging.StreamHandler",
-            "formatter": "standard",
-            "stream": "ext://sys.stdout",
-        },
-        "file": {  # dict for file handler
-            "level": "DEBUG",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": LOG_FILE_PATH,
-            "maxBytes": 1024 * 1024 * 5,
-            "backupCount": 3,
-            "encoding": "utf-8",
-            "formatter": "detailed",
-        },
-    },
-    # Root logger (setting for all loggers, in case of tey has not own setting)
-    "root": {
-        "level": "DEBUG",  # Lowest level which we want to catch
-        "handlers": ["console", "file"],  # Sending logs to both handlers
-    },
+
+# Settings left empty are derived from other settings (in this order)
+_DERIVED = {
+    "checkpoint_dir": lambda s: os.path.join(s.data_dir, "checkpoints"),
+    "cleaned_dir": lambda s: os.path.join(s.data_dir, "cleaned"),
+    "ddl_mode": lambda s: "migrate" if s.load_mode == "upsert" else "always",
+    "metrics_dir": lambda s: os.path.join(s.log_dir, "metrics"),
+    "log_file_path": lambda s: os.path.join(s.log_dir, "etl_pipeline.log"),
+    "prometheus_textfile": lambda s: os.path.join(s.metrics_dir, "etl_pipeline.prom"),
 }
 
-# --- Database Configuration ---
-DB_TYPE = os.getenv("ETL_DB_TYPE", "sqlite").lower()
-DB_CONNECTION_STRING = None
-
-print(f"INFO: Chosen database type (ETL_DB_TYPE): {DB_TYPE}")
-
-if DB_TYPE == "sqlite":
-    # For SQLite database,  file name is used from .env or default
-    sqlite_filename = os.getenv("SQLITE_DB_FILENAME", "ecommerce_pipeline_default.db")
-    db_path = os.path.join(DATA_DIR, sqlite_filename)
-    DB_CONNECTION_STRING = f"sqlite:///{db_path}"
-    print(f"INFO: SQLite databáze in: {db_path}")
-
-elif DB_TYPE == "postgresql":
-    db_user = os.getenv("PG_DB_USER")
-    db_password = os.getenv("PG_DB_PASSWORD")
-    db_host = os.getenv("PG_DB_HOST", "localhost")
-    db_port = os.getenv("PG_DB_PORT", "5432")
-    db_name = os.getenv("PG_DB_NAME")
-
-    if not all([db_user, db_password, db_name]):
-        print(
-            "WARNING: All necessary environment variables (EPG_DB_USER, PG_DB_PASSWORD,"
-            "PG_DB_NAME) are not set for PostgreSQL in .env file."
-            "Pipeline may not work properly."
-        )
-        DB_CONNECTION_STRING = None
-    else:
-        DB_CONNECTION_STRING = f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        print(
-            f"INFO: Connectiong to PostgreSQL: user={db_user}, host={db_host},"
-            f"port={db_port}, dbname={db_name}"
-        )
 
-elif DB_TYPE == "mssql":
-    db_user = os.getenv("MSSQL_DB_USER")
-    db_password = os.getenv("MSSQL_DB_PASSWORD")
-    db_host = os.getenv("MSSQL_DB_HOST")
-    db_port = os.getenv("MSSQL_DB_PORT", "1433")
-    db_name = os.getenv("MSSQL_DB_NAME")
-    odbc_driver_env = os.getenv("MSSQL_DB_ODBC_DRIVER", "ODBC Driver 17 for SQL Server")
-    odbc_driver_url = odbc_driver_env.replace(" ", "+")
-
-    if not all([db_user, db_password, db_host, db_name]):
-        print(
-            "WARNING: All necessary environment variables (MSSQL_DB_USER, MSSQL_DB_PASSWORD,"
-            "MSSQL_DB_HOST, MSSQL_DB_NAME) are not set for MSSQL in .env file."
-            "Pipeline may not work properly."
-        )
-        DB_CONNECTION_STRING = None
-    else:
-        DB_CONNECTION_STRING = f"mssql+pyodbc://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}?driver={odbc_driver_url}"
-        print(
-            f"INFO: Connecting to MSSQL: user={db_user}, host={db_host},"
-            f"port={db_port}, dbname={db_name}, driver={odbc_driver_env}"
-        )
-else:
-    print(
-        f"Error: Unknown DB_TYPE '{DB_TYPE}' set in ETL_DB_TYPE."
-        f"Pipeline can not continue in database configuration."
+@dataclass(frozen=True)
+class Settings:
+    """Typed settings of pipeline, config constants are upper case names of fields.
+
+    Fields default to environment variables (ETL_* and DB credentials), paths
+    left empty are derived from data_dir and log_dir.
+    """
+
+    # --- Base project Configuration ---
+    base_dir: str = PROJECT_ROOT_DIR
+    # route to folder for data saving
+    data_dir: str = _env("ETL_DATA_DIR", os.path.join(PROJECT_ROOT_DIR, "data"))
+    # route to folder for log files
+    log_dir: str = _env("ETL_LOG_DIR", os.path.join(PROJECT_ROOT_DIR, "logs"))
+    # route to with sql
+    sql_dir: str = os.path.join(PROJECT_ROOT_DIR, "sql")
+
+    # --- Database Schema Configuration ---
+    target_db_schema: str = "etl"
+
+    # -- API configuration --
+    # Endpoints are paginated with 'limit'/'skip' query parameters
+    api_endpoints: dict = field(
+        default_factory=lambda: {
+            "users": "https://dummyjson.com/users",
+            "products": "https://dummyjson.com/products",
+            "carts": "https://dummyjson.com/cart",
+        }
     )
-    # Fallback to sqlite in case of Unknown database
-    print("INFO: Setting default fallback SQLite configuration.")
-    sqlite_filename_fallback = "ecommerce_pipeline_fallback.db"
-    db_path_fallback = os.path.join(DATA_DIR, sqlite_filename_fallback)
-    DB_CONNECTION_STRING = f"sqlite:///{db_path_fallback}"
-    DB_TYPE = "sqlite"
-
-if DB_CONNECTION_STRING:
-    # Short print of connection string for log,(hide password)
-    safe_conn_str_display = DB_CONNECTION_STRING
-    if "@" in safe_conn_str_display and ":" in safe_conn_str_display.split("@")[0]:
-        user_pass, rest = safe_conn_str_display.split("://")[1].split("@", 1)
-        user = user_pass.split(":")[0]
-        safe_conn_str_display = (
-            f"{safe_conn_str_display.split('://')[0]}://{user}:********@{rest}"
+    # Number of records requested per page
+    api_page_size: int = _env("ETL_API_PAGE_SIZE", "100", int)
+    # Maximum of pages of one endpoint downloaded at the same time
+    api_max_in_flight_pages: int = _env("ETL_API_MAX_IN_FLIGHT_PAGES", "4", int)
+    # --- HTTP client configuration ---
+    # Timeout of one request in seconds
+    http_timeout: float = _env("ETL_HTTP_TIMEOUT", "10", float)
+    # Number of attempts for one request
+    http_max_retries: int = _env("ETL_HTTP_MAX_RETRIES", "3", int)
+    # Exponential backoff (with jitter) base and cap in seconds, cap applies to Retry-After
+    http_backoff_base: float = _env("ETL_HTTP_BACKOFF_BASE", "2", float)
+    http_backoff_max: float = _env("ETL_HTTP_BACKOFF_MAX", "60", float)
+    # Keep-alive connections kept in pool per host
+    http_pool_maxsize: int = _env("ETL_HTTP_POOL_MAXSIZE", "16", int)
+    # Token bucket rate limit per host (requests per second, 0 = unlimited) and burst
+    http_rate_limit_per_sec: float = _env("ETL_HTTP_RATE_LIMIT_PER_SEC", "0", float)
+    http_rate_limit_burst: int = _env("ETL_HTTP_RATE_LIMIT_BURST", "10", int)
+
+    # Number of endpoints fetched in parallel
+    extract_max_workers: int = _env("ETL_EXTRACT_MAX_WORKERS", "4", int)
+    # Conditional/incremental extraction (ETag/Last-Modified and content hash cache)
+    extract_cache_enabled: bool = _env("ETL_EXTRACT_CACHE", "true", _flag)
+    # Raw zone file format: "json", "ndjson", "ndjson.gz", "ndjson.zst" (zstandard)
+    # or "parquet" (pyarrow)
+    raw_format: str = _env("ETL_RAW_FORMAT", "ndjson.gz", str.lower)
+    # Handoff of extracted data to transformation: "disk" (read back raw files) or
+    # "memory" (records go straight to transformation, raw files written on background)
+    pipeline_handoff: str = _env("ETL_PIPELINE_HANDOFF", "disk", str.lower)
+    # Cache file name (stored in DATA_DIR)
+    extract_cache_filename: str = "extract_cache.json"
+
+    # --- Pipeline Scheduler Configuration ---
+    # Extract, transform and load tasks of entities running at the same time
+    pipeline_workers: int = _env("ETL_PIPELINE_WORKERS", "4", int)
+    # Retries of failed task (loads are retried only when it cannot duplicate rows:
+    # upsert load mode without atomic load)
+    task_max_retries: int = _env("ETL_TASK_MAX_RETRIES", "1", int)
+    # Delay before first retry in seconds (doubled with every next retry)
+    task_retry_delay: float = _env("ETL_TASK_RETRY_DELAY", "1", float)
+    # Seconds after which running attempt of task is reported as failed (0 = no
+    # timeout; not applied to loads over the shared connection, see README)
+    task_timeout: float = _env("ETL_TASK_TIMEOUT", "0", float)
+
+    # --- Checkpoint Configuration ---
+    # Record completed stages of every run (with cleaned tables), so a failed run can
+    # be continued with `python main.py --resume`
+    checkpoint_enabled: bool = _env("ETL_CHECKPOINTS", "true", _flag)
+    # Manifest file name (stored in DATA_DIR) and folder of checkpointed tables
+    # (default DATA_DIR/checkpoints)
+    checkpoint_filename: str = "pipeline_checkpoint.json"
+    checkpoint_dir: str = ""
+
+    # --- Transformation Configuration ---
+    # Chunked mode: number of raw records transformed and loaded at once (0 = whole entity)
+    transform_chunk_size: int = _env("ETL_TRANSFORM_CHUNK_SIZE", "0", int)
+    # Number of processes running transformations (1 = in the main process)
+    transform_workers: int = _env("ETL_TRANSFORM_WORKERS", "1", int)
+    # Create and load normalized 'product_reviews' table (one row per review)
+    load_product_reviews: bool = _env("ETL_LOAD_PRODUCT_REVIEWS", "false", _flag)
+    # Folder of cleaned tables written by `main.py transform` and read by
+    # `main.py load` (default DATA_DIR/cleaned)
+    cleaned_dir: str = _env("ETL_CLEANED_DIR", "")
+
+    # --- Load Configuration ---
+    # "append" = insert rows to tables recreated by DDL, "upsert" = keep tables and
+    # merge only new or changed rows on primary keys
+    load_mode: str = _env("ETL_LOAD_MODE", "append", str.lower)
+    # "always" = apply DDL script (drop and recreate tables) every run, "migrate" =
+    # apply it only when its checksum changed, plus new scripts in sql/migrations/
+    # (default "migrate" for upsert load mode, "always" otherwise)
+    ddl_mode: str = _env("ETL_DDL_MODE", "", str.lower)
+    # "bulk" = dialect native path (COPY for PostgreSQL, fast_executemany for MSSQL,
+    # one executemany with tuned PRAGMAs for SQLite), "to_sql" = plain pandas inserts
+    load_method: str = _env("ETL_LOAD_METHOD", "bulk", str.lower)
+    # Rows sent to database in one batch by bulk load
+    load_bulk_chunksize: int = _env("ETL_LOAD_BULK_CHUNKSIZE", "50000", int)
+    # Tables not referencing each other loaded in parallel (SQLite always uses 1)
+    load_max_workers: int = _env("ETL_LOAD_MAX_WORKERS", "2", int)
+    # Load all tables of all entities in one transaction (all-or-nothing, no parallelism)
+    load_atomic: bool = _env("ETL_LOAD_ATOMIC", "false", _flag)
+    # Drop/disable secondary indexes and FK/UNIQUE constraints during load, rebuild after
+    load_defer_indexes: bool = _env("ETL_LOAD_DEFER_INDEXES", "false", _flag)
+    # Create secondary indexes for common lookups (src/indexes.py SECONDARY_INDEXES)
+    create_secondary_indexes: bool = _env("ETL_CREATE_SECONDARY_INDEXES", "true", _flag)
+    # Change data capture: rows are hashed per primary key and compared with digest
+    # index of previous run, only new and changed rows are loaded (merged as upsert
+    # unless tables were recreated) and rows missing in source are deleted
+    cdc_enabled: bool = _env("ETL_CDC", "false", _flag)
+    # Digest index file name (stored in DATA_DIR)
+    cdc_index_filename: str = "cdc_digests.json"
+
+    # --- Database Connection Pool Configuration ---
+    # Connections kept open in pool and extra connections opened under load
+    # (size, overflow and timeout are not used for SQLite)
+    db_pool_size: int = _env("ETL_DB_POOL_SIZE", "5", int)
+    db_max_overflow: int = _env("ETL_DB_MAX_OVERFLOW", "10", int)
+    # Seconds to wait for free connection of pool
+    db_pool_timeout: float = _env("ETL_DB_POOL_TIMEOUT", "30", float)
+    # Test connection before it is taken from pool (stale connections are replaced)
+    db_pool_pre_ping: bool = _env("ETL_DB_POOL_PRE_PING", "true", _flag)
+    # Seconds after which pooled connection is reopened (-1 = never)
+    db_pool_recycle: int = _env("ETL_DB_POOL_RECYCLE", "1800", int)
+    # executemany of driver: "auto" (fast_executemany for MSSQL bulk load, driver
+    # default otherwise), "fast" (MSSQL pyodbc fast_executemany), "plain" (driver
+    # default), "values_only" or "values_plus_batch" (PostgreSQL psycopg2)
+    db_executemany_mode: str = _env("ETL_DB_EXECUTEMANY_MODE", "auto", str.lower)
+
+    # --- Metrics Configuration ---
+    # Per-stage metrics (wall/CPU time, rows, bytes, peak memory, retries) written
+    # at the end of every run as JSON run report and Prometheus textfile
+    metrics_enabled: bool = _env("ETL_METRICS", "true", _flag)
+    # Folder of run reports (run_report_<start time>.json, one per run),
+    # default LOG_DIR/metrics
+    metrics_dir: str = _env("ETL_METRICS_DIR", "")
+    # Prometheus textfile (e.g. in textfile collector folder of node_exporter),
+    # rewritten by every run, default METRICS_DIR/etl_pipeline.prom
+    prometheus_textfile: str = _env("ETL_PROMETHEUS_TEXTFILE", "")
+    # Seconds between samples of resident memory of process
+    metrics_sample_interval: float = _env("ETL_METRICS_SAMPLE_INTERVAL", "0.1", float)
+    # Profiling (`python main.py --profile [--profile-stages STAGE,...]`): number of functions and
+    # allocations listed in reports written to LOG_DIR/profile_<start time>/
+    profile_top: int = _env("ETL_PROFILE_TOP", "25", int)
+
+    # --- Logging Configuration ---
+    # default LOG_DIR/etl_pipeline.log
+    log_file_path: str = ""
+
+    # --- Database Configuration ---
+    # "sqlite", "postgresql" or "mssql" (unknown type falls back to SQLite)
+    db_type: str = _env("ETL_DB_TYPE", "sqlite", str.lower)
+    # Unknown DB_TYPE was replaced by SQLite (fallback database file is used)
+    _sqlite_fallback: bool = field(default=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen dataclass, derived defaults are set through object.__setattr__
+        for name, derive in _DERIVED.items():
+            if not getattr(self, name):
+                object.__setattr__(self, name, derive(self))
+        if self.db_type not in ("sqlite", "postgresql", "mssql"):
+            logger.error(
+                "Unknown DB_TYPE '%s' set in ETL_DB_TYPE, falling back to SQLite"
+                " database '%s'.",
+                self.db_type,
+                "ecommerce_pipeline_fallback.db",
+            )
+            object.__setattr__(self, "db_type", "sqlite")
+            object.__setattr__(self, "_sqlite_fallback", True)
+
+    @cached_property
+    def db_connection_string(self) -> str | None:
+        """SQLAlchemy url of target database from DB_TYPE and its credentials
+        (None if required credentials are missing)."""
+        if self.db_type == "sqlite":
+            # For SQLite database,  file name is used from .env or default
+            sqlite_filename = (
+                "ecommerce_pipeline_fallback.db"
+                if self._sqlite_fallback
+                else os.getenv("SQLITE_DB_FILENAME", "ecommerce_pipeline_default.db")
+            )
+            db_path = os.path.join(self.data_dir, sqlite_filename)
+            logger.info("SQLite database in: %s", db_path)
+            return f"sqlite:///{db_path}"
+
+        if self.db_type == "postgresql":
+            db_user = os.getenv("PG_DB_USER")
+            db_password = os.getenv("PG_DB_PASSWORD")
+            db_host = os.getenv("PG_DB_HOST", "localhost")
+            db_port = os.getenv("PG_DB_PORT", "5432")
+            db_name = os.getenv("PG_DB_NAME")
+            if not all([db_user, db_password, db_name]):
+                logger.warning(
+                    "All necessary environment variables (PG_DB_USER, PG_DB_PASSWORD,"
+                    " PG_DB_NAME) are not set for PostgreSQL in .env file."
+                    " Pipeline may not work properly."
+                )
+                return None
+            logger.info(
+                "Connecting to PostgreSQL: user=%s, host=%s, port=%s, dbname=%s",
+                db_user,
+                db_host,
+                db_port,
+                db_name,
+            )
+            return f"postgresql+psycopg2://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+
+        db_user = os.getenv("MSSQL_DB_USER")
+        db_password = os.getenv("MSSQL_DB_PASSWORD")
+        db_host = os.getenv("MSSQL_DB_HOST")
+        db_port = os.getenv("MSSQL_DB_PORT", "1433")
+        db_name = os.getenv("MSSQL_DB_NAME")
+        odbc_driver_env = os.getenv(
+            "MSSQL_DB_ODBC_DRIVER", "ODBC Driver 17 for SQL Server"
+        )
+        odbc_driver_url = odbc_driver_env.replace(" ", "+")
+        if not all([db_user, db_password, db_host, db_name]):
+            logger.warning(
+                "All necessary environment variables (MSSQL_DB_USER, MSSQL_DB_PASSWORD,"
+                " MSSQL_DB_HOST, MSSQL_DB_NAME) are not set for MSSQL in .env file."
+                " Pipeline may not work properly."
+            )
+            return None
+        logger.info(
+            "Connecting to MSSQL: user=%s, host=%s, port=%s, dbname=%s, driver=%s",
+            db_user,
+            db_host,
+            db_port,
+            db_name,
+            odbc_driver_env,
         )
+        return f"mssql+pyodbc://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}?driver={odbc_driver_url}"
 
-    print(
-        f"INFO: Final DB_CONNECTION_STRING (safety shortened): {safe_conn_str_display}"
-    )
-else:
-    print(
-        f"Error: DB_CONNECTION_STRING can not be successfully created for DB_TYPE: {DB_TYPE}."
-        f"Check the configuration and environment variables."
-    )
+    @property
+    def logging_config(self) -> dict:
+        """Dictionary configuration of logging (console INFO, rotating file DEBUG)."""
+        return {
+            "version": 1,  # Version of schema config
+            "disable_existing_loggers": False,  # Keep existing loggers
+            # Format of logs
+            "formatters": {
+                "standard": {
+                    # basic format for console
+                    "format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+                    "datefmt": "%Y-%m-%d %H:%M:%S",
+                },
+                "detailed": {
+                    # Detailed format for file
+                    "format": "%(asctime)s - %(levelname)s - %(name)s - %(module)s - "
+                    "%(funcName)s - %(lineno)d - %(message)s",
+                    "datefmt": "%Y-%m-%d %H:%M:%S",
+                },
+            },
+            # Handlers (where logs should be send)
+            "handlers": {
+                "console": {  # dict for console handler
+                    "level": "INFO",
+                    "class": "logging.StreamHandler",
+                    "formatter": "standard",
+                    "stream": "ext://sys.stdout",
+                },
+                "file": {  # dict for file handler
+                    "level": "DEBUG",
+                    "class": "logging.handlers.RotatingFileHandler",
+                    "filename": self.log_file_path,
+                    "maxBytes": 1024 * 1024 * 5,
+                    "backupCount": 3,
+                    "encoding": "utf-8",
+                    "formatter": "detailed",
+                },
+            },
+            # Root logger (setting for all loggers, in case of tey has not own setting)
+            "root": {
+                "level": "DEBUG",  # Lowest level which we want to catch
+                "handlers": ["console", "file"],  # Sending logs to both handlers
+            },
+        }
+
+    def with_overrides(self, **changes) -> "Settings":
+        """Copy of settings with changed fields, settings which were derived (not
+        set explicitly) are derived again from the changed ones."""
+        for name, derive in _DERIVED.items():
+            if name not in changes and getattr(self, name) == derive(self):
+                changes[name] = ""
+        return replace(self, **changes)
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Return settings resolved from .env file and environment (created once,
+    get_settings.cache_clear() resolves them again)."""
+    if os.path.exists(DOTENV_PATH):
+        # python-dotenv is needed only when .env file exists
+        from dotenv import load_dotenv  # pylint: disable=import-outside-toplevel
+
+        load_dotenv(dotenv_path=DOTENV_PATH)
+        logger.debug("Variables from .env successfully loaded %s", DOTENV_PATH)
+    return Settings()
+
+
+# Constants resolved from settings with module overrides applied
+_DEPENDENT = {name.upper() for name in _DERIVED} | {
+    "DB_CONNECTION_STRING",
+    "LOGGING_CONFIG",
+}
+
+
+def __getattr__(name: str):
+    """Resolve module constants (config.LOAD_MODE, ...) from settings lazily.
+
+    Constants derived from other settings are resolved with overridden module
+    constants, e.g. CHECKPOINT_DIR follows config.DATA_DIR = ...
+    """
+    if name.isupper():
+        settings = get_settings()
+        if name in _DEPENDENT:
+            overrides = {
+                item.name: globals()[item.name.upper()]
+                for item in fields(settings)
+                if item.name.upper() in globals()
+            }
+            if overrides:
+                settings = settings.with_overrides(**overrides)
+        if hasattr(settings, name.lower()):
+            return getattr(settings, name.lower())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,219 +1,182 @@
-"""Main orchestration module for other modules of ETL pipeline"""
+"""Command line interface of ETL pipeline for e-commerce data.
 
-# Import modules and functions
-import json
+Usage: python main.py [run] [--resume] [--profile] [--profile-stages STAGE,...]
+       python main.py extract | transform | load
+
+Commands import only modules they need (e.g. extract does not import pandas
+or SQLAlchemy, database drivers are imported only by load and run) and
+configuration is resolved on first use (see config.py).
+"""
+
+import argparse
 import logging
 import os
+import sys
 
 import config
 from src.logging_setup import setup_logging
-from src.extract import fetch_from_api, save_to_json
-from src.transform import (
-    convert_list_to_dataframe,
-    transform_carts,
-    transform_products,
-    transform_users,
-)
-from src.load import create_db_engine, load_dataframe_to_db, apply_ddl_script
-
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
+# Stages of pipeline tasks, entity stages are named "<stage>:<entity>"
+ENTITY_STAGES = ("extract", "transform", "load")
+RUN_STAGES = ("ddl", "cdc", "cdc:delete")
 
-# --- Main Pipeline Function ---
-def run_pipeline():
-    """Run pipeline for extraction tranformation and loading data."""
-    logger.info("%s S T A R T   E T L   P I P E L I N E %s", "=" * 20, "=" * 20)
 
-    logger.info("=== Database schema setup ===")
-    engine = create_db_engine(config.DB_CONNECTION_STRING)
-
-    if not engine:
-        logger.critical("Failed to create database engine. Halting pipeline.")
-        return
+def ensure_sql_dir():
+    """Warn about (and create) missing folder of DDL scripts."""
+    if not os.path.isdir(config.SQL_DIR):
+        logger.warning(
+            "SQL directory not found at: %s. DDL scripts might not be loaded."
+            "Creating it.",
+            config.SQL_DIR,
+        )
+        try:
+            os.makedirs(config.SQL_DIR, exist_ok=True)
+        except OSError as e:
+            logger.error("Could not create SQL directory %s: %s", config.SQL_DIR, e)
 
-    ddl_file_name = ""
-    if config.DB_TYPE == "mssql":
-        ddl_file_name = "schema_mssql_ddl.sql"
-    elif config.DB_TYPE == "postgresql":
-        ddl_file_name = "schema_postgresql_ddl.sql"
-    elif config.DB_TYPE == "sqlite":
-        ddl_file_name = "schema_sqlite_ddl.sql"
 
-    if ddl_file_name:
-        ddl_script_path = os.path.join(config.SQL_DIR, ddl_file_name)
+def extract_command(args) -> bool:
+    """Fetch all API endpoints to raw files in DATA_DIR.
 
-        if not os.path.exists(ddl_script_path):
-            logger.error(
-                "DDL script file not found at: %s. Halting pipeline.", ddl_script_path
-            )
-            return
+    Extraction cache is used for conditional requests only, it is saved by
+    run command after successful load (so changed entities are loaded).
+    """
+    # pylint: disable=import-outside-toplevel,unused-argument
+    from src.extract import extract_all_endpoints
+    from src.extract_cache import ExtractCache
 
-        try:
-            apply_ddl_script(engine, ddl_script_path)
-            logger.info(
-                "Database schema from '%s' applied successfully.", ddl_file_name
-            )
-        except Exception as e:
-            logger.critical(
-                "Could not apply DDL schema from '%s'. Halting pipeline. Error: %s",
-                ddl_file_name,
-                e,
-                exc_info=True,
-            )
-            return
-    else:
-        logger.warning(
-            "No DDL script defined for DB_TYPE: %s."
-            "Proceeding without DDL application.",
-            config.DB_TYPE,
+    os.makedirs(config.DATA_DIR, exist_ok=True)
+    cache = None
+    if config.EXTRACT_CACHE_ENABLED:
+        cache = ExtractCache(
+            os.path.join(config.DATA_DIR, config.EXTRACT_CACHE_FILENAME)
         )
+    extracted_files, _ = extract_all_endpoints(
+        config.API_ENDPOINTS, config.DATA_DIR, cache=cache
+    )
+    return all(extracted_files.values())
+
+
+def transform_command(args) -> bool:
+    """Transform raw files of all entities to cleaned tables in CLEANED_DIR."""
+    # pylint: disable=import-outside-toplevel,unused-argument
+    from src.extract import raw_file_name
+    from src.parallel_transform import write_tables
+    from src.transform import transform_entity
 
-    # === PART 1: EXTRACT ===
-    logger.info("- - -  E X T R A C T I O N  - - -\n")
-    extracted_files = {}  # Dictionary for saving paths to created files
-    for name, url in config.API_ENDPOINTS.items():
-        # Calling function from extract.py
-        raw_data = fetch_from_api(url)
-        if raw_data:
-            json_filename = f"{name}_data.json"
-            file_path = os.path.join(config.DATA_DIR, json_filename)
-            # Calling function from extract.py
-            save_to_json(raw_data, json_filename, config.DATA_DIR)
-            extracted_files[name] = file_path  # Save path for next step
-        else:
-            logger.warning("Extraction of %s failed,  skipping current endpoint.", name)
-            extracted_files[name] = None
-
-    # === PART 2: TRANSFORM ===
-    logger.info("- - -  T R A N S F O R M A T I O N  - - -\n")
-    cleaned_dataframes = {}  # Dictionary for saving DataFrames
-    for name, file_path in extracted_files.items():
-        if file_path is None:
-            logger.warning("Skipping transformation of %s (Extraction failed).", name)
+    cleaned_dataframes = {}
+    for name in config.API_ENDPOINTS:
+        tables = transform_entity(
+            name, os.path.join(config.DATA_DIR, raw_file_name(name))
+        )
+        if not tables:
+            logger.error("Transformation of %s produced no tables.", name)
+            return False
+        cleaned_dataframes.update(tables)
+    return write_tables(cleaned_dataframes, config.CLEANED_DIR)
+
+
+def load_command(args) -> bool:
+    """Load cleaned tables from CLEANED_DIR to database."""
+    # pylint: disable=import-outside-toplevel,unused-argument
+    from src.pipeline import load_cleaned_tables
+
+    ensure_sql_dir()
+    return load_cleaned_tables()
+
+
+def run_command(args) -> bool:
+    """Run whole pipeline (extract, transform and load tasks of all entities)."""
+    # pylint: disable=import-outside-toplevel
+    from src.pipeline import run_pipeline
+
+    ensure_sql_dir()
+    profile = args.profile_stages
+    if profile is None and args.profile:
+        profile = []  # All stages
+    return run_pipeline(resume=args.resume, profile=profile)
+
+
+def profile_stages(value: str) -> list:
+    """Comma separated stages of --profile-stages (e.g. "transform,load:carts").
+
+    Raises:
+    argparse.ArgumentTypeError: If stage is not a stage of pipeline tasks.
+    """
+    stages = [stage.strip() for stage in value.split(",") if stage.strip()]
+    for stage in stages:
+        kind, _, entity = stage.partition(":")
+        if stage in RUN_STAGES or (
+            kind in ENTITY_STAGES and (not entity or entity in config.API_ENDPOINTS)
+        ):
             continue
+        raise argparse.ArgumentTypeError(
+            f"unknown stage '{stage}', expected one of {', '.join(RUN_STAGES)} or"
+            f" {', '.join(ENTITY_STAGES)} (optionally followed by"
+            f" ':<entity>', entities: {', '.join(config.API_ENDPOINTS)})"
+        )
+    return stages
 
-        logger.info("Data tranformation of %s from file %s", name, file_path)
-        try:
-            # Loading data from JSON file
-            with open(file_path, "r", encoding="utf-8") as f:
-                full_data = json.load(f)
-
-            # Getting relevant list od data (specific for dummyjson)
-            # Using endpoint name as key (users, products, carts)
-            data_list = full_data.get(name, [])
-            if not data_list:
-                logger.warning(
-                    "In file %s data not found under key '%s'.", file_path, name
-                )
-                continue
-
-            # Conversion to DataFrame (function from transform.py)
-            df_raw = convert_list_to_dataframe(data_list, name)
-            if df_raw is None:
-                logger.error("Data conversion of %s to DataFrame failed.", name)
-                continue
-
-            # Aplication of specific transformation (function from transform.py)
-            df_cleaned = None  # Initialize df_cleaned
-            if name == "users":
-                df_cleaned_users = transform_users(df_raw)
-                if df_cleaned_users is not None:
-                    cleaned_dataframes["users"] = df_cleaned_users
-            elif name == "products":
-                df_cleaned_products = transform_products(df_raw)
-                if df_cleaned_products is not None:
-                    cleaned_dataframes["products"] = df_cleaned_products
-            elif name == "carts":
-                carts_df, items_df = transform_carts(df_raw)
-                if carts_df is not None:
-                    cleaned_dataframes["carts"] = carts_df
-                if items_df is not None:
-                    cleaned_dataframes["cart_items"] = items_df
-
-            # Log shapes after transformations
-            if name == "users" and "users" in cleaned_dataframes:
-                logger.info(
-                    "Transformation of 'users' finished. Shape: %s\n",
-                    cleaned_dataframes["users"].shape,
-                )
-            elif name == "products" and "products" in cleaned_dataframes:
-                logger.info(
-                    "Transformation of 'products' finished. Shape: %s\n",
-                    cleaned_dataframes["products"].shape,
-                )
-            elif name == "carts":
-                if "carts" in cleaned_dataframes:
-                    logger.info(
-                        "Transformation of 'carts' finished. Shape: %s\n",
-                        cleaned_dataframes["carts"].shape,
-                    )
-                if "cart_items" in cleaned_dataframes:
-                    logger.info(
-                        "Transformation of 'cart_items' finished. Shape: %s\n",
-                        cleaned_dataframes["cart_items"].shape,
-                    )
-
-        except Exception as e:
-            # Detailed log with traceback
-            logger.error(
-                "Unexpected error during transformation for %s: %s",
-                name,
-                e,
-                exc_info=True,
-            )
-    logger.info(
-        "Transformation finneshed. DataFrames ready: %s\n",
-        list(cleaned_dataframes.keys()),
+
+def add_run_options(parser, default=None):
+    """Options of run command (accepted also without command name)."""
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        default=default if default is not None else False,
+        help="continue failed previous run from its last completed stages",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=default if default is not None else False,
+        help="profile stages with cProfile and tracemalloc, reports are written to"
+        " the log directory",
+    )
+    parser.add_argument(
+        "--profile-stages",
+        type=profile_stages,
+        metavar="STAGE[,STAGE...]",
+        default=default,
+        help="profile only these stages (names like load:carts or prefixes like"
+        " transform), implies --profile",
     )
 
-    # === PART 3: LOAD ===
-    logger.info("- - -   L o a d   - - -\n")
-    if not cleaned_dataframes:
-        logger.warning("No transformed DataFrames for loading. Skipping load...")
-    elif not engine:  # Check if engine was created
-        logger.error("Database engine not available. Skipping load phase.")
-    else:
-        load_order = ["users", "products", "carts", "cart_items"]
-        # schema for SQLite should be none 
-        schema_to_load = config.TARGET_DB_SCHEMA if config.DB_TYPE not in ['sqlite'] else None
-
-        for simple_table_name in load_order:
-            if simple_table_name in cleaned_dataframes:
-                df_to_load = cleaned_dataframes[simple_table_name]
-
-                logger.info(f"Loading DataFrame '{simple_table_name}' into SQL table "
-                            f"'{schema_to_load + '.' if schema_to_load else ''}{simple_table_name}'...")
-
-                load_dataframe_to_db(
-                    df=df_to_load,
-                    table_name=simple_table_name,
-                    engine=engine,
-                    schema_name=schema_to_load,
-                    if_exists="append",
-                )
-            else:
-                logger.warning(
-                    "DataFrame for key '%s' not found in cleaned_dataframes. Skipping.",
-                    simple_table_name,
-                )
-        logger.info("Load phase completed.")
-
-    logger.info("%s E N D   E T L   P I P E L I N E %s", "=" * 20, "=" * 20)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="ETL pipeline for e-commerce data")
+    add_run_options(parser)
+    parser.set_defaults(handler=run_command)
+    commands = parser.add_subparsers(
+        title="commands", metavar="COMMAND", help="run if not given"
+    )
+    commands.add_parser(
+        "extract", help="fetch API endpoints to raw files in data directory"
+    ).set_defaults(handler=extract_command)
+    commands.add_parser(
+        "transform", help="transform raw files to cleaned tables"
+    ).set_defaults(handler=transform_command)
+    commands.add_parser("load", help="load cleaned tables to database").set_defaults(
+        handler=load_command
+    )
+    run_parser = commands.add_parser(
+        "run", help="extract, transform and load all entities as one pipeline"
+    )
+    # Options given before command name are kept
+    add_run_options(run_parser, default=argparse.SUPPRESS)
+    run_parser.set_defaults(handler=run_command)
+    return parser
+
+
+def main(argv=None) -> int:
+    """Run command given on command line, return exit code."""
+    args = build_parser().parse_args(argv)
+    setup_logging()
+    return 0 if args.handler(args) else 1
 
 
 # --- Run the pipeline ---
 if __name__ == "__main__":
-    if not os.path.isdir(config.SQL_DIR):
-        logger.warning(
-            "SQL directory not found at: %s. DDL scripts might not be loaded."
-            "Creating it.",
-            config.SQL_DIR,
-        )
-        try:
-            os.makedirs(config.SQL_DIR, exist_ok=True)
-        except OSError as e:
-            logger.error("Could not create SQL directory %s: %s", config.SQL_DIR, e)
-
-    run_pipeline()
+    sys.exit(main())
@@ -0,0 +1,15 @@
+/*
+=============================================================
+Migration: Add address columns to users
+-------------------------------------------------------------
+Script Purpose:
+    Adds city, state and postal_code of user address to the
+    existing etl.users table, loaded rows are kept.
+=============================================================
+*/
+
+ALTER TABLE etl.users ADD
+    city NVARCHAR(100),
+    state NVARCHAR(100),
+    postal_code NVARCHAR(20);
+GO
@@ -0,0 +1,14 @@
+/*
+=============================================================
+Migration: Add address columns to users
+-------------------------------------------------------------
+Script Purpose:
+    Adds city, state and postal_code of user address to the
+    existing etl.users table, loaded rows are kept.
+=============================================================
+*/
+
+ALTER TABLE etl.users
+    ADD COLUMN city VARCHAR(100),
+    ADD COLUMN state VARCHAR(100),
+    ADD COLUMN postal_code VARCHAR(20);
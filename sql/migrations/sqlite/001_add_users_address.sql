@@ -0,0 +1,13 @@
+/*
+=============================================================
+Migration: Add address columns to users
+-------------------------------------------------------------
+Script Purpose:
+    Adds city, state and postal_code of user address to the
+    existing users table, loaded rows are kept.
+=============================================================
+*/
+
+ALTER TABLE users ADD COLUMN city TEXT;
+ALTER TABLE users ADD COLUMN state TEXT;
+ALTER TABLE users ADD COLUMN postal_code TEXT;
@@ -35,7 +35,15 @@ IF EXISTS (SELECT * FROM sys.foreign_keys WHERE name = 'FK_carts_users' AND pare
     ALTER TABLE etl.carts DROP CONSTRAINT FK_carts_users;
 GO
 
+IF EXISTS (SELECT * FROM sys.foreign_keys WHERE name = 'FK_productreviews_products' AND parent_object_id = OBJECT_ID('etl.product_reviews'))
+    ALTER TABLE etl.product_reviews DROP CONSTRAINT FK_productreviews_products;
+GO
+
 -- Drop the tables in the correct order (child tables first)
+IF OBJECT_ID('etl.product_reviews', 'U') IS NOT NULL
+    DROP TABLE etl.product_reviews;
+GO
+
 IF OBJECT_ID('etl.cart_items', 'U') IS NOT NULL
     DROP TABLE etl.cart_items;
 GO
@@ -79,6 +87,17 @@ CREATE TABLE etl.products(
 );
 GO
 
+CREATE TABLE etl.product_reviews(
+    review_id INT IDENTITY(1,1) PRIMARY KEY NOT NULL,
+    product_id INT NOT NULL,
+    rating INT,
+    comment NVARCHAR(MAX),
+    review_date DATETIME2,
+    reviewer_name NVARCHAR(100),
+    reviewer_email NVARCHAR(255)
+);
+GO
+
 CREATE TABLE etl.carts(
     cart_id INT IDENTITY(1,1) PRIMARY KEY NOT NULL,
     user_id INT NOT NULL,
@@ -124,5 +143,12 @@ REFERENCES etl.products(id)
 ON DELETE CASCADE;
 GO
 
+ALTER TABLE etl.product_reviews
+ADD CONSTRAINT FK_productreviews_products
+FOREIGN KEY (product_id)
+REFERENCES etl.products(id)
+ON DELETE CASCADE;
+GO
+
 PRINT '==================== All tables and constraints created successfully.====================';
 GO
\ No newline at end of file
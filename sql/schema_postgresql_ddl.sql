@@ -13,6 +13,7 @@ Script Purpose:
 CREATE SCHEMA IF NOT EXISTS etl;
 
 -- Drop tables in reverse dependency order
+DROP TABLE IF EXISTS etl.product_reviews CASCADE;
 DROP TABLE IF EXISTS etl.cart_items CASCADE;
 DROP TABLE IF EXISTS etl.carts CASCADE;
 DROP TABLE IF EXISTS etl.products CASCADE;
@@ -44,6 +45,17 @@ CREATE TABLE etl.products(
     review_comments TEXT
 );
 
+-- Create product_reviews table (optional, loaded with ETL_LOAD_PRODUCT_REVIEWS)
+CREATE TABLE etl.product_reviews(
+    review_id SERIAL PRIMARY KEY,
+    product_id INT NOT NULL,
+    rating INT,
+    comment TEXT,
+    review_date TIMESTAMP,
+    reviewer_name VARCHAR(100),
+    reviewer_email VARCHAR(255)
+);
+
 -- Create carts table
 CREATE TABLE etl.carts(
     cart_id SERIAL PRIMARY KEY,
@@ -86,4 +98,11 @@ ALTER TABLE etl.cart_items
 ADD CONSTRAINT FK_cartitems_products 
 FOREIGN KEY (product_id) 
 REFERENCES etl.products(id)
+ON DELETE CASCADE;
+
+-- In etl.product_reviews table
+ALTER TABLE etl.product_reviews
+ADD CONSTRAINT FK_productreviews_products
+FOREIGN KEY (product_id)
+REFERENCES etl.products(id)
 ON DELETE CASCADE;
\ No newline at end of file
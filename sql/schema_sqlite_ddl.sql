@@ -10,6 +10,7 @@ Script Purpose:
 */
 
 -- Drop tables if they exist (in reverse order of creation due to potential FKs if added later)
+DROP TABLE IF EXISTS product_reviews;
 DROP TABLE IF EXISTS cart_items;
 DROP TABLE IF EXISTS carts;
 DROP TABLE IF EXISTS products;
@@ -42,6 +43,18 @@ CREATE TABLE products (
     review_comments TEXT
 );
 
+-- Create product_reviews table (optional, loaded with ETL_LOAD_PRODUCT_REVIEWS)
+CREATE TABLE product_reviews (
+    review_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER NOT NULL,
+    rating INTEGER,
+    comment TEXT,
+    review_date TEXT, -- Store as 'YYYY-MM-DD HH:MM:SS' (UTC)
+    reviewer_name TEXT,
+    reviewer_email TEXT,
+    FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
+);
+
 -- Create carts table
 CREATE TABLE carts (
     cart_id INTEGER PRIMARY KEY,
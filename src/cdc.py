@@ -0,0 +1,176 @@
+"""Module provide change data capture of cleaned tables against previous run"""
+
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Integer, Numeric
+
+from src.load import UPSERT_KEYS, UPSERT_PARENT_KEYS
+from src.table_schemas import TABLE_SCHEMAS, prepare_load_frame
+
+logger = logging.getLogger(__name__)
+
+# Column rows are compared on: primary key, or parent key of child tables
+# (rows of one cart/product are hashed together and replaced together)
+CDC_KEYS = {
+    **{table_name: keys[0] for table_name, keys in UPSERT_KEYS.items()},
+    **UPSERT_PARENT_KEYS,
+}
+
+
+def _canonical_frame(df: pd.DataFrame, table_name: str) -> pd.DataFrame:
+    """All TABLE_SCHEMAS columns of table in fixed order with dtypes given by
+    column types, so digests do not depend on columns and dtypes inferred from
+    one chunk (missing column is the same as NULL values)."""
+    table_schema = TABLE_SCHEMAS.get(table_name)
+    if table_schema is None:
+        return df
+    prepared = prepare_load_frame(df, table_name, as_objects=False)
+    columns = {}
+    for column, sql_type in table_schema.items():
+        if column in prepared.columns:
+            series = prepared[column]
+        else:
+            series = pd.Series(None, index=df.index, dtype=object)
+        if isinstance(sql_type, Integer):
+            columns[column] = pd.to_numeric(series).astype("Int64")
+        elif isinstance(sql_type, Numeric):
+            columns[column] = pd.to_numeric(series).astype("Float64")
+        else:
+            columns[column] = series.astype("string")
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _row_digests(df: pd.DataFrame, table_name: str) -> np.ndarray:
+    """64-bit hash of every row (vectorized, stable between runs)."""
+    return pd.util.hash_pandas_object(
+        _canonical_frame(df, table_name), index=False
+    ).to_numpy(dtype=np.uint64)
+
+
+def _group_digest(row_digests: pd.Series) -> int:
+    """One digest of rows of one parent key."""
+    digest = hashlib.blake2b(row_digests.to_numpy().tobytes(), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+class ChangeCapture:
+    """Row-level diff of cleaned tables against digest index of previous run.
+
+    Index holds key -> row digest of every table (see CDC_KEYS), persisted as
+    JSON file: {table_name: {"keys": [...], "digests": [...]}}. Tables are
+    diffed chunk by chunk (diff), keys missing in this run are deletes
+    (deleted_keys). New index is saved only after successful load (save).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._previous = {}
+        self._current = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._previous = {
+                        table_name: pd.Series(
+                            np.array(entry["digests"], dtype=np.uint64),
+                            index=pd.Index(entry["keys"]),
+                        )
+                        for table_name, entry in json.load(f).items()
+                    }
+                logger.info(
+                    "CDC digest index loaded from %s (%s).",
+                    path,
+                    {name: len(index) for name, index in self._previous.items()},
+                )
+            except (IOError, ValueError, KeyError, TypeError) as e:
+                logger.warning(
+                    "CDC digest index %s could not be read, all rows are treated"
+                    " as new: %s",
+                    path,
+                    e,
+                )
+                self._previous = {}
+
+    def reset(self):
+        """Forget previous run (e.g. tables were recreated), all rows are new."""
+        self._previous = {}
+
+    def diff(self, table_name: str, df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+        """Return rows of df that are new or changed since previous run.
+
+        Tables without CDC key are returned whole.
+
+        Returns:
+        tuple: DataFrame of changed rows and counts of inserted, updated and
+        unchanged keys.
+        """
+        key = CDC_KEYS.get(table_name)
+        if key is None or key not in df.columns:
+            return df, {"inserted": len(df), "updated": 0, "unchanged": 0}
+
+        row_digests = pd.Series(_row_digests(df, table_name), index=df.index)
+        if table_name in UPSERT_PARENT_KEYS:
+            digests = row_digests.groupby(df[key].to_numpy(), sort=False).agg(
+                _group_digest
+            )
+            digests = digests.astype(np.uint64)
+        else:
+            digests = pd.Series(row_digests.to_numpy(), index=pd.Index(df[key]))
+        self._current.setdefault(table_name, []).append(digests)
+
+        previous = self._previous.get(table_name)
+        if previous is None or previous.empty:
+            is_new = np.ones(len(digests), dtype=bool)
+            is_changed = np.zeros(len(digests), dtype=bool)
+        else:
+            positions = previous.index.get_indexer(digests.index)
+            is_new = positions < 0
+            is_changed = ~is_new & (
+                previous.to_numpy()[positions] != digests.to_numpy()
+            )
+        changed_keys = digests.index[is_new | is_changed]
+        counts = {
+            "inserted": int(is_new.sum()),
+            "updated": int(is_changed.sum()),
+            "unchanged": int(len(digests) - is_new.sum() - is_changed.sum()),
+        }
+        return df[df[key].isin(changed_keys)], counts
+
+    def deleted_keys(self, table_name: str) -> list:
+        """Keys of previous run not seen in this run (only for diffed tables)."""
+        previous = self._previous.get(table_name)
+        if previous is None or table_name not in self._current:
+            return []
+        seen = pd.Index(
+            np.concatenate([digests.index for digests in self._current[table_name]])
+        )
+        return previous.index[~previous.index.isin(seen)].tolist()
+
+    def save(self):
+        """Write new digest index (tables not diffed in this run are kept)."""
+        index = {
+            table_name: {
+                "keys": previous.index.tolist(),
+                "digests": previous.tolist(),
+            }
+            for table_name, previous in self._previous.items()
+            if table_name not in self._current
+        }
+        for table_name, chunks in self._current.items():
+            digests = pd.concat(chunks)
+            index[table_name] = {
+                "keys": digests.index.tolist(),
+                "digests": digests.tolist(),
+            }
+        tmp_path = f"{self.path}.part"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, self.path)
+            logger.info("CDC digest index saved to %s.", self.path)
+        except IOError as e:
+            logger.error("CDC digest index could not be saved to %s: %s", self.path, e)
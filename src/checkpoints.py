@@ -0,0 +1,169 @@
+"""Module provide checkpoint store of pipeline runs for resuming failed runs"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+
+from src.migrations import file_checksum
+from src.parallel_transform import frame_from_buffer, frame_to_buffer
+
+logger = logging.getLogger(__name__)
+
+# Run states in manifest
+RUNNING = "running"
+FAILED = "failed"
+SUCCEEDED = "succeeded"
+
+
+class CheckpointStore:
+    """Manifest (JSON file) of completed stages of the current pipeline run.
+
+    Stages are named as pipeline tasks (ddl, extract:<entity>,
+    transform:<entity>, load:<entity>, ...). Every completed stage holds its
+    artifacts with SHA-256 hashes, e.g.:
+    {"run_id": ..., "status": "failed", "stages": {"transform:users":
+     {"artifacts": {"users": {"path": ..., "format": "arrow", "sha256": ...}}}}}
+
+    Cleaned tables are stored as files in artifacts_dir/<run_id>/, they are
+    removed when run succeeds.
+    """
+
+    def __init__(self, path: str, artifacts_dir: str):
+        self.path = path
+        self.artifacts_dir = artifacts_dir
+        self._lock = threading.Lock()
+        self._manifest = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._manifest = json.load(f)
+            except (IOError, json.JSONDecodeError) as e:
+                logger.warning(
+                    "Checkpoint manifest %s could not be read, ignoring it: %s", path, e
+                )
+                self._manifest = {}
+
+    @property
+    def run_id(self) -> str | None:
+        return self._manifest.get("run_id")
+
+    def start_run(self, resume: bool = False) -> bool:
+        """Start new run, or continue unfinished previous run if resume is True.
+
+        Returns:
+        bool: True if previous run is resumed.
+        """
+        with self._lock:
+            unfinished = self._manifest.get("status") in (RUNNING, FAILED)
+            if resume and unfinished:
+                logger.info(
+                    "Resuming pipeline run %s, completed stages: %s",
+                    self.run_id,
+                    sorted(self._manifest.get("stages", {})),
+                )
+                self._manifest["status"] = RUNNING
+                self._save()
+                return True
+            if resume:
+                logger.warning(
+                    "No unfinished pipeline run to resume, starting new run."
+                )
+            shutil.rmtree(self.artifacts_dir, ignore_errors=True)
+            self._manifest = {
+                "run_id": datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ"),
+                "status": RUNNING,
+                "stages": {},
+            }
+            self._save()
+            return False
+
+    def finish_run(self, succeeded: bool):
+        """Mark run as finished, artifacts of succeeded run are removed."""
+        with self._lock:
+            self._manifest["status"] = SUCCEEDED if succeeded else FAILED
+            self._save()
+        if succeeded:
+            shutil.rmtree(self.artifacts_dir, ignore_errors=True)
+        else:
+            logger.info(
+                "Pipeline run %s did not succeed, continue it with --resume.",
+                self.run_id,
+            )
+
+    def completed(self, stage: str) -> dict | None:
+        """Return entry of completed stage, None if stage was not completed or
+        any of its artifacts is missing or changed."""
+        with self._lock:
+            entry = self._manifest.get("stages", {}).get(stage)
+        if entry is None:
+            return None
+        for name, artifact in entry.get("artifacts", {}).items():
+            path = artifact["path"]
+            if not os.path.exists(path) or file_checksum(path) != artifact["sha256"]:
+                logger.warning(
+                    "Artifact '%s' of stage '%s' is missing or changed, stage is"
+                    " repeated.",
+                    name,
+                    stage,
+                )
+                return None
+        return entry
+
+    def complete(self, stage: str, artifacts: dict | None = None, **values):
+        """Record completed stage with artifacts (name -> file path) and values."""
+        entry = dict(values)
+        entry["artifacts"] = {
+            name: {"path": path, "sha256": file_checksum(path)}
+            for name, path in (artifacts or {}).items()
+        }
+        with self._lock:
+            self._manifest.setdefault("stages", {})[stage] = entry
+            self._save()
+
+    def save_tables(self, stage: str, tables: dict):
+        """Write cleaned DataFrames as artifacts and record completed stage."""
+        stage_dir = os.path.join(
+            self.artifacts_dir, self.run_id, stage.replace(":", "_")
+        )
+        os.makedirs(stage_dir, exist_ok=True)
+        artifacts = {}
+        for table_name, df in tables.items():
+            buffer_format, data = frame_to_buffer(df)
+            path = os.path.join(stage_dir, f"{table_name}.{buffer_format}")
+            with open(path, "wb") as f:
+                f.write(data)
+            artifacts[table_name] = {
+                "path": path,
+                "format": buffer_format,
+                "sha256": hashlib.sha256(data).hexdigest(),
+            }
+        with self._lock:
+            self._manifest.setdefault("stages", {})[stage] = {"artifacts": artifacts}
+            self._save()
+
+    def load_tables(self, stage: str) -> dict | None:
+        """Read cleaned DataFrames of completed stage (None if not available)."""
+        entry = self.completed(stage)
+        if entry is None:
+            return None
+        tables = {}
+        for table_name, artifact in entry["artifacts"].items():
+            with open(artifact["path"], "rb") as f:
+                tables[table_name] = frame_from_buffer((artifact["format"], f.read()))
+        return tables
+
+    def _save(self):
+        """Write manifest through temporary file (caller holds the lock)."""
+        tmp_path = f"{self.path}.part"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, indent=4)
+            os.replace(tmp_path, self.path)
+        except IOError as e:
+            logger.error(
+                "Checkpoint manifest could not be saved to %s: %s", self.path, e
+            )
@@ -0,0 +1,145 @@
+"""Module provide database connection reuse across pipeline steps and pool statistics"""
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Pool events counted by ConnectionManager (event name -> counter name)
+POOL_EVENTS = {
+    "connect": "connects",
+    "checkout": "checkouts",
+    "checkin": "checkins",
+    "invalidate": "invalidations",
+}
+
+
+@contextmanager
+def connect(connectable):
+    """Yield connection of engine (closed at the end) or connection as it is."""
+    if isinstance(connectable, Connection):
+        yield connectable
+    else:
+        with connectable.connect() as connection:
+            yield connection
+
+
+@contextmanager
+def transaction(connectable):
+    """Yield connection in transaction.
+    Engine: new connection, committed at the end (rolled back on error).
+    Connection: used as it is, its open transaction is left to the caller.
+    """
+    if isinstance(connectable, Connection):
+        if connectable.in_transaction():
+            yield connectable
+        else:
+            with connectable.begin():
+                yield connectable
+    else:
+        with connectable.begin() as connection:
+            yield connection
+
+
+class ConnectionManager:
+    """Engine with one connection shared by sequential pipeline steps.
+
+    DDL, migrations, index maintenance and sequential loads run over the same
+    checked-out connection, parallel loads take their own connections from the
+    engine pool. New, checked-out and invalidated pool connections are counted
+    (see pool_status).
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._connection = None
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(POOL_EVENTS.values(), 0)
+        for event_name, counter in POOL_EVENTS.items():
+            event.listen(engine, event_name, self._counter_listener(counter))
+
+    def _counter_listener(self, counter: str):
+        def listener(*args):
+            with self._lock:
+                self._counters[counter] += 1
+
+        return listener
+
+    @contextmanager
+    def connection(self):
+        """Yield shared connection (checked out on first use and kept for next steps).
+
+        Transaction left open by the block is committed at its end, rolled back
+        on error, so every block starts without open transaction.
+        """
+        if self._connection is None or self._connection.closed:
+            self._connection = self.engine.connect()
+        elif self._connection.invalidated:
+            # Connection was lost, next statement reconnects it
+            self._connection.rollback()
+        connection = self._connection
+        try:
+            yield connection
+        except Exception:
+            if connection.in_transaction():
+                connection.rollback()
+            raise
+        if connection.in_transaction():
+            connection.commit()
+
+    @contextmanager
+    def load_target(self, max_workers: int = None, atomic: bool = None):
+        """Yield connectable for load_table_batch.
+
+        Shared connection when tables are loaded one by one (SQLite, one load
+        worker or atomic load), engine when they are loaded in parallel (every
+        load worker checks out its own pooled connection).
+        """
+        if max_workers is None:
+            max_workers = config.LOAD_MAX_WORKERS
+        if atomic is None:
+            atomic = config.LOAD_ATOMIC
+        if max_workers > 1 and not atomic and self.engine.dialect.name != "sqlite":
+            yield self.engine
+            return
+        with self.connection() as connection:
+            yield connection
+
+    def pool_status(self) -> dict:
+        """Return pool statistics: pool class, size and usage of queue pools and
+        counters of pool events since manager was created."""
+        pool = self.engine.pool
+        status = {"pool": type(pool).__name__}
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                status[name] = method()
+        with self._lock:
+            status.update(self._counters)
+        return status
+
+    def log_pool_status(self):
+        """Log pool statistics (many new connections mean connection churn)."""
+        status = self.pool_status()
+        logger.info(
+            "Database connection pool: %s",
+            ", ".join(f"{name}={value}" for name, value in status.items()),
+        )
+
+    def close(self):
+        """Return shared connection to pool."""
+        if self._connection is not None and not self._connection.closed:
+            self._connection.close()
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,91 +1,188 @@
-"""Module provide function for fetching data from API and save them to JSON file"""
+"""Module provide function for fetching data from API and save them to raw zone files"""
 
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib
+import io
 import json
 import logging
 import os
-import time
-
-import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import config
+from src.extract_cache import ExtractCache, conditional_headers
+from src.http_client import get_http_client
+
+if TYPE_CHECKING:
+    # pandas is imported only by readers of raw files, extraction does not need it
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
-RAW_DATA_DIR = config.DATA_DIR
 
 API_ENDPOINTS_TEST = {
-    "users": "https://dummyjson.com/users?limit=10",
-    "products": "https://dummyjson.com/products?limit=10",
-    "carts": "https://dummyjson.com/cart?limit=10",
+    "users": "https://dummyjson.com/users",
+    "products": "https://dummyjson.com/products",
+    "carts": "https://dummyjson.com/cart",
 }
 
+# Records parsed at once by NDJSON reader projecting fields without pyarrow
+PROJECTION_BATCH_SIZE = 10000
+
+
+class PaginationError(Exception):
+    """Raised when a page of paginated endpoint could not be downloaded or the
+    number of downloaded records differs from 'total' reported by the API."""
+
 
 # -- Extraction Function (Fetch) --
-def fetch_from_api(url, max_retries=3, delay=2) -> list | dict:
-    """Fetch data from API endpoint with retry logic"""
+def fetch_from_api(url, max_retries=None, delay=None, page_meta=None) -> list | dict:
+    """Fetch data from API endpoint with retry logic.
 
-    for attempt in range(max_retries):
-        try:
-            logger.info(
-                "Attempt %d/%d: Data extraction form %s", attempt + 1, max_retries, url
-            )
-            response = requests.get(url, timeout=10)  # Add timeout for request
-            response.raise_for_status()  # Check (4xx,5xx) Errors
+    Requests go through shared pooled HTTP client (keep-alive connections,
+    exponential backoff with jitter, Retry-After handling and rate limiting).
+    'delay' is the base of exponential backoff (default from config).
+    If page_meta dict is given, ETag/Last-Modified of response are stored in it
+    under the url.
+    """
+    response = get_http_client().get(url, max_retries=max_retries, backoff_base=delay)
+    if response is None:
+        return None  # All attempt failure
 
-            logger.info(
-                "Successfully downloaded data from  %s (Status: %d).",
-                url,
-                response.status_code,
-            )
+    try:
+        # JSON Decoding
+        data = response.json()
+        logger.info("JSON successfully decoded %s", url)
+        if page_meta is not None:
+            page_meta[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        return data  # Success --> return data and end function
+    except json.JSONDecodeError:
+        logger.error("Response data for %s are not valid JSON.", url)
+        logger.debug("Response content: %s...", response.text[:200])
+        return None
 
-            # JSON Decoding
-            data = response.json()
-            logger.info("JSON successfully decoded %s", url)
-            return data  # Success --> return data and end function
 
-        except requests.exceptions.HTTPError as e:
-            logger.warning(
-                "Attempt %d/%d: HTTP Error for %s: %s", attempt + 1, max_retries, url, e
-            )
-        except requests.exceptions.ConnectionError as e:
-            logger.warning(
-                "Attempt %d/%d: Connection Error for %s: %s",
-                attempt + 1,
-                max_retries,
-                url,
-                e,
-            )
-        except requests.exceptions.Timeout as e:
-            logger.warning(
-                "Attempt %d/%d: Timeout for %s: %s",
-                attempt + 1,
-                max_retries,
-                url,
-                e,
-            )
-        except requests.exceptions.RequestException as e:
-            logger.warning(
-                "Attempt %d/%d: Request Error for %s: %s",
-                attempt + 1,
-                max_retries,
-                url,
-                e,
-            )
-        except json.JSONDecodeError:
-            logger.warning(
-                "Attempt %d/%d: Response data for %s are not valid JSON.",
-                attempt + 1,
-                max_retries,
-                url,
-            )
-            logger.debug("Response content: %s...", response.text[:200])
+# -- Paginated Extraction --
+def _page_url(url, skip, limit) -> str:
+    """Return url with 'skip' and 'limit' query parameters set."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update({"limit": str(limit), "skip": str(skip)})
+    return urlunsplit(parts._replace(query=urlencode(query)))
 
-        # Waiting for another response if we are not in last attempt
-        if attempt < max_retries - 1:
-            logger.info("Waiting %f s before another attempt.", delay)
-            time.sleep(delay)
-        else:
-            logger.error("Downloading data was unsuccessful")
-            return None  # All attempt failure
+
+def fetch_pages(url, entity_name, page_size=None, max_in_flight=None, page_meta=None):
+    """Fetch paginated endpoint and yield records page by page.
+
+    First page tells 'total' number of records, remaining pages are requested
+    with 'skip'/'limit' cursors concurrently (at most max_in_flight requests
+    at once). Pages are yielded in the API order.
+
+    Args:
+        url: API endpoint url (existing 'limit'/'skip' parameters are replaced).
+        entity_name: Key under which the API returns records (users, products...).
+        page_size: Number of records requested per page (default from config).
+        max_in_flight: Maximum of concurrently fetched pages (default from config).
+        page_meta: Optional dict filled with ETag/Last-Modified of every page url.
+
+    Yields:
+    list: Records (dicts) of one page.
+
+    Raises:
+    PaginationError: If any page could not be downloaded or number of fetched
+    records differs from 'total' (after all pages were yielded, so consumers
+    discard the incomplete data).
+    """
+    if page_size is None:
+        page_size = config.API_PAGE_SIZE
+    if max_in_flight is None:
+        max_in_flight = config.API_MAX_IN_FLIGHT_PAGES
+    max_in_flight = max(1, max_in_flight)
+
+    first_page = fetch_from_api(_page_url(url, 0, page_size), page_meta=page_meta)
+    if not first_page:
+        raise PaginationError(f"First page of {url} could not be downloaded.")
+
+    records = first_page.get(entity_name, [])
+    total = first_page.get("total", len(records))
+    fetched = len(records)
+    logger.info(
+        "Endpoint %s reports %d records of '%s', first page has %d.",
+        url,
+        total,
+        entity_name,
+        fetched,
+    )
+    if records:
+        yield records
+
+    # API may return less records than requested (server side cap),
+    # so next cursors are derived from real page length
+    step = len(records)
+    if step and fetched < total:
+        skips = iter(range(step, total, step))
+        executor = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix=f"page-{entity_name}"
+        )
+        pending = deque()
+        try:
+            for skip in skips:
+                page_url = _page_url(url, skip, step)
+                pending.append(
+                    (
+                        skip,
+                        executor.submit(fetch_from_api, page_url, page_meta=page_meta),
+                    )
+                )
+                if len(pending) >= max_in_flight:
+                    break
+
+            while pending:
+                skip, future = pending.popleft()
+                page = future.result()
+                next_skip = next(skips, None)
+                if next_skip is not None:
+                    page_url = _page_url(url, next_skip, step)
+                    pending.append(
+                        (
+                            next_skip,
+                            executor.submit(
+                                fetch_from_api, page_url, page_meta=page_meta
+                            ),
+                        )
+                    )
+                if not page:
+                    raise PaginationError(
+                        f"Page with skip={skip} of {url} could not be downloaded."
+                    )
+
+                page_records = page.get(entity_name, [])
+                fetched += len(page_records)
+                logger.debug(
+                    "Page skip=%d of '%s' fetched (%d records).",
+                    skip,
+                    entity_name,
+                    len(page_records),
+                )
+                if page_records:
+                    yield page_records
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    if fetched != total:
+        raise PaginationError(
+            f"Endpoint {url} reports {total} records of '{entity_name}',"
+            f" but {fetched} were fetched."
+        )
+    logger.info("All %d records of '%s' fetched from %s.", fetched, entity_name, url)
 
 
 # -- Saving Function --
@@ -109,6 +206,575 @@ def save_to_json(data, filename, directory) -> json:
         logger.error("Error during data serialization to JSON for %s: %s", file_path, e)
 
 
+# -- Raw Zone Formats --
+class _JsonRawWriter:
+    """Legacy format, JSON document shaped as API response {entity: [...]}."""
+
+    def __init__(self, path, entity_name):
+        self._file = open(path, "w", encoding="utf-8")
+        self._count = 0
+        self._file.write("{" + json.dumps(entity_name) + ": [")
+
+    def write_page(self, records, lines):
+        for line in lines:
+            self._file.write(",\n" if self._count else "\n")
+            self._file.write(line)
+            self._count += 1
+
+    def close(self):
+        count = self._count
+        self._file.write(f'\n], "total": {count}, "skip": 0, "limit": {count}}}\n')
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+
+
+class _NdjsonRawWriter:
+    """Newline delimited JSON, one record per line (optionally compressed)."""
+
+    def __init__(self, path, entity_name, compression=None):
+        self._raw = None
+        if compression == "gzip":
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        elif compression == "zstd":
+            zstandard = _require_module("zstandard", "ndjson.zst")
+            self._raw = open(path, "wb")
+            self._file = io.TextIOWrapper(
+                zstandard.ZstdCompressor().stream_writer(self._raw), encoding="utf-8"
+            )
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+
+    def write_page(self, records, lines):
+        self._file.write("\n".join(lines))
+        self._file.write("\n")
+
+    def close(self):
+        self._file.close()
+        if self._raw is not None and not self._raw.closed:
+            self._raw.close()
+
+    def abort(self):
+        self.close()
+
+
+class _ParquetRawWriter:
+    """Columnar Parquet file (requires pyarrow).
+
+    Pages are kept as compact Arrow tables and written at close, so schema
+    of all pages can be unified (e.g. int and float prices on different pages).
+    """
+
+    def __init__(self, path, entity_name):
+        self._pa = _require_module("pyarrow", "parquet")
+        self._path = path
+        self._tables = []
+
+    def write_page(self, records, lines):
+        self._tables.append(self._pa.Table.from_pylist(records))
+
+    def close(self):
+        parquet = _require_module("pyarrow.parquet", "parquet")
+        table = self._pa.concat_tables(self._tables, promote_options="permissive")
+        parquet.write_table(table, self._path, compression="zstd")
+        self._tables = []
+
+    def abort(self):
+        self._tables = []
+
+
+def _require_module(module_name, raw_format):
+    """Import optional dependency needed by raw format."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"Raw format '{raw_format}' requires package '{module_name.split('.')[0]}'"
+            " to be installed."
+        ) from e
+
+
+def _arrow_to_dataframe(table, fields=None) -> pd.DataFrame:
+    """Convert Arrow table to DataFrame, nested lists become python lists.
+
+    With fields (see project_records) only columns of these fields are converted.
+    """
+    if fields is not None:
+        # pylint: disable-next=import-outside-toplevel
+        from src.projection import project_arrow_table
+
+        return project_arrow_table(table, fields)
+    pa = _require_module("pyarrow", "parquet")
+    list_columns = [
+        field.name
+        for field in table.schema
+        if pa.types.is_list(field.type) or pa.types.is_large_list(field.type)
+    ]
+    df = table.drop_columns(list_columns).to_pandas()
+    for column in list_columns:
+        df[column] = table.column(column).to_pylist()
+    return df[table.column_names]
+
+
+def _read_json(path, entity_name, fields=None) -> pd.DataFrame:
+    # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+    import pandas as pd
+
+    # pylint: disable-next=import-outside-toplevel
+    from src.projection import project_records
+
+    with open(path, "r", encoding="utf-8") as f:
+        # Getting relevant list od data (specific for dummyjson)
+        records = json.load(f).get(entity_name, [])
+    if fields is not None:
+        return project_records(records, fields)
+    return pd.DataFrame(records)
+
+
+def _read_ndjson(path, entity_name, compression=None, fields=None) -> pd.DataFrame:
+    try:
+        pa = importlib.import_module("pyarrow")
+        pa_json = importlib.import_module("pyarrow.json")
+    except ImportError:
+        pa = None
+    if pa is not None:
+        try:
+            # Native columnar parser, no python objects for scalar columns
+            with pa.input_stream(path, compression=compression) as stream:
+                return _arrow_to_dataframe(pa_json.read_json(stream), fields)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            logger.debug("Arrow could not parse %s, using pandas: %s", path, e)
+    if fields is not None:
+        # pylint: disable-next=import-outside-toplevel
+        from src.projection import project_records
+
+        records = [
+            record
+            for batch in _iter_ndjson_batches(
+                path, entity_name, PROJECTION_BATCH_SIZE, compression
+            )
+            for record in batch
+        ]
+        return project_records(records, fields)
+    import pandas as pd  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    return pd.read_json(
+        path,
+        lines=True,
+        dtype=False,
+        convert_dates=False,
+        compression=compression,
+    )
+
+
+def _read_parquet(path, entity_name, fields=None) -> pd.DataFrame:
+    parquet = _require_module("pyarrow.parquet", "parquet")
+    columns = None
+    if fields is not None:
+        # pylint: disable-next=import-outside-toplevel
+        from src.projection import top_level_fields
+
+        # Projection pushdown, columns of other fields are not read from file
+        names = set(parquet.read_schema(path).names)
+        columns = [name for name in top_level_fields(fields) if name in names]
+    return _arrow_to_dataframe(parquet.read_table(path, columns=columns), fields)
+
+
+def _iter_json_batches(path, entity_name, batch_size):
+    # Legacy JSON document can not be streamed, it is parsed whole
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f).get(entity_name, [])
+    for start in range(0, len(records), batch_size):
+        yield records[start : start + batch_size]
+
+
+def _iter_ndjson_batches(path, entity_name, batch_size, compression=None):
+    with open(path, "rb") as raw:
+        if compression == "gzip":
+            stream = gzip.GzipFile(fileobj=raw)
+        elif compression == "zstd":
+            zstandard = _require_module("zstandard", "ndjson.zst")
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        else:
+            stream = raw
+        batch = []
+        for line in io.TextIOWrapper(stream, encoding="utf-8"):
+            if line.strip():
+                batch.append(json.loads(line))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _iter_parquet_batches(path, entity_name, batch_size):
+    parquet = _require_module("pyarrow.parquet", "parquet")
+    for record_batch in parquet.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield record_batch.to_pylist()
+
+
+# Format name -> file extension, writer, reader and batch reader
+RAW_FORMATS = {
+    "json": {
+        "extension": ".json",
+        "writer": _JsonRawWriter,
+        "reader": _read_json,
+        "batch_reader": _iter_json_batches,
+    },
+    "ndjson": {
+        "extension": ".ndjson",
+        "writer": _NdjsonRawWriter,
+        "reader": _read_ndjson,
+        "batch_reader": _iter_ndjson_batches,
+    },
+    "ndjson.gz": {
+        "extension": ".ndjson.gz",
+        "writer": partial(_NdjsonRawWriter, compression="gzip"),
+        "reader": partial(_read_ndjson, compression="gzip"),
+        "batch_reader": partial(_iter_ndjson_batches, compression="gzip"),
+    },
+    "ndjson.zst": {
+        "extension": ".ndjson.zst",
+        "writer": partial(_NdjsonRawWriter, compression="zstd"),
+        "reader": partial(_read_ndjson, compression="zstd"),
+        "batch_reader": partial(_iter_ndjson_batches, compression="zstd"),
+    },
+    "parquet": {
+        "extension": ".parquet",
+        "writer": _ParquetRawWriter,
+        "reader": _read_parquet,
+        "batch_reader": _iter_parquet_batches,
+    },
+}
+
+
+def _raw_format_spec(raw_format=None) -> dict:
+    """Return spec of raw format (default from config)."""
+    raw_format = raw_format or config.RAW_FORMAT
+    if raw_format not in RAW_FORMATS:
+        raise ValueError(
+            f"Unknown raw format '{raw_format}', choose one of {sorted(RAW_FORMATS)}."
+        )
+    return RAW_FORMATS[raw_format]
+
+
+def raw_file_name(entity_name, raw_format=None) -> str:
+    """Return name of raw zone file of entity, e.g. users_data.ndjson.gz."""
+    return f"{entity_name}_data{_raw_format_spec(raw_format)['extension']}"
+
+
+def write_raw_pages(
+    pages, entity_name, file_path, raw_format=None, unchanged_hash=None
+) -> dict | None:
+    """Stream pages of records to raw zone file without holding all of them in memory.
+
+    File is written to temporary file first and replaced only after success.
+    SHA-256 hash of records (independent of raw format) is computed while
+    writing, if it equals unchanged_hash, existing file is kept untouched.
+
+    Returns:
+    dict: {"records": count, "content_hash": hash, "written": bool}
+    or None in case of failure.
+    """
+    tmp_path = f"{file_path}.part"
+    logger.info("Streaming data to raw file %s", file_path)
+    count = 0
+    content_hash = hashlib.sha256()
+    writer = None
+    try:
+        writer = _raw_format_spec(raw_format)["writer"](tmp_path, entity_name)
+        for page in pages:
+            lines = [json.dumps(record, ensure_ascii=False) for record in page]
+            for line in lines:
+                content_hash.update(line.encode("utf-8"))
+            writer.write_page(page, lines)
+            count += len(lines)
+        writer.close()
+        writer = None
+
+        digest = content_hash.hexdigest()
+        if unchanged_hash == digest and os.path.exists(file_path):
+            os.remove(tmp_path)
+            logger.info("Content of %s is unchanged, file is not rewritten.", file_path)
+            return {"records": count, "content_hash": digest, "written": False}
+
+        os.replace(tmp_path, file_path)
+        logger.info("%d records successfully saved to %s.\n", count, file_path)
+        return {"records": count, "content_hash": digest, "written": True}
+
+    except PaginationError as e:
+        logger.error("Paginated extraction for %s failed: %s", file_path, e)
+    except (ImportError, ValueError) as e:
+        logger.error("Raw file %s could not be written: %s", file_path, e)
+    except IOError as e:
+        logger.error("Error during writing to file %s: %s", file_path, e)
+    except TypeError as e:
+        logger.error("Error during data serialization for %s: %s", file_path, e)
+
+    if writer is not None:
+        writer.abort()
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    return None
+
+
+def read_raw_dataframe(
+    file_path, entity_name, raw_format=None, fields=None
+) -> pd.DataFrame | None:
+    """Read raw zone file of entity to DataFrame (one row per record).
+
+    With fields (field path -> dtype, see src.projection.project_records) only
+    columns of these fields are created, nested fields are flattened to dotted
+    columns (e.g. "address.city").
+
+    Returns:
+    pd.DataFrame: Raw records or None in case of failure.
+    """
+    logger.info("Reading raw file %s", file_path)
+    try:
+        return _raw_format_spec(raw_format)["reader"](
+            file_path, entity_name, fields=fields
+        )
+    except FileNotFoundError:
+        logger.error("File not found: %s", file_path)
+    except (ImportError, ValueError) as e:
+        logger.error("Raw file %s could not be read: %s", file_path, e)
+    except Exception as e:
+        logger.error("Unexpected file reading error %s: %s", file_path, e)
+    return None
+
+
+def iter_raw_batches(file_path, entity_name, batch_size, raw_format=None):
+    """Read raw zone file of entity as batches of records (lists of dicts).
+
+    NDJSON and Parquet files are streamed, so only one batch is held in memory.
+
+    Yields:
+    list: Records of one batch (at most batch_size).
+    """
+    logger.info("Reading raw file %s in batches of %d records", file_path, batch_size)
+    yield from _raw_format_spec(raw_format)["batch_reader"](
+        file_path, entity_name, batch_size
+    )
+
+
+def _is_page_not_modified(page_url, validators) -> bool:
+    """Send conditional request for cached page, True if server answers 304."""
+    headers = conditional_headers(validators)
+    if not headers:
+        return False
+    response = get_http_client().get(page_url, headers=headers)
+    return response is not None and response.status_code == 304
+
+
+def _entity_not_modified(entry, max_in_flight=None) -> bool:
+    """Validate all cached pages of entity with conditional requests."""
+    pages = entry.get("pages") or {}
+    if not pages or not os.path.exists(entry.get("file_path") or ""):
+        return False
+    if max_in_flight is None:
+        max_in_flight = config.API_MAX_IN_FLIGHT_PAGES
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_in_flight), thread_name_prefix="validate"
+    ) as executor:
+        results = executor.map(_is_page_not_modified, pages.keys(), pages.values())
+        return all(results)
+
+
+# -- Background Raw Writer --
+class BackgroundRawWriter:
+    """Writes raw zone files on background thread for in-memory handoff.
+
+    Extracted records go straight to transformation, persisting them to raw
+    zone (and updating extraction cache) does not block the critical path.
+    """
+
+    def __init__(self, max_workers=1):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="raw-writer"
+        )
+        self._futures = []
+
+    def submit(self, name, url, records, file_path, cache=None, page_meta=None):
+        """Schedule write of records to file_path."""
+        self._futures.append(
+            self._executor.submit(
+                self._write, name, url, records, file_path, cache, page_meta
+            )
+        )
+
+    @staticmethod
+    def _write(name, url, records, file_path, cache, page_meta) -> bool:
+        entry = cache.get(url) if cache is not None else None
+        saved = write_raw_pages(
+            [records],
+            name,
+            file_path,
+            unchanged_hash=entry.get("content_hash") if entry else None,
+        )
+        if not saved:
+            return False
+        if cache is not None:
+            cache.update(
+                url,
+                {
+                    "file_path": file_path,
+                    "content_hash": saved["content_hash"],
+                    "records": saved["records"],
+                    "pages": page_meta or {},
+                },
+            )
+        return True
+
+    def wait(self) -> bool:
+        """Wait for all scheduled writes, True if all of them succeeded."""
+        self._executor.shutdown(wait=True)
+        succeeded = True
+        for future in self._futures:
+            try:
+                succeeded &= future.result()
+            except Exception as e:
+                logger.error("Background write of raw file failed: %s", e)
+                succeeded = False
+        self._futures = []
+        return succeeded
+
+
+# -- Concurrent Extraction --
+def extract_endpoint(
+    name, url, directory, cache=None, records=None, raw_writer=None, stats=None
+) -> tuple[str | None, bool]:
+    """Fetch all pages of one endpoint and stream them to raw zone file.
+
+    With cache, cached pages are validated by conditional requests first
+    (If-None-Match/If-Modified-Since) and file is not rewritten if every page
+    answers 304 or downloaded content has the same hash as before.
+
+    If records dict is given (in-memory handoff), fetched records are stored
+    in it under entity name and raw file is written by raw_writer
+    (BackgroundRawWriter) on background.
+
+    If stats dict is given, it is filled with number of extracted records and
+    bytes written to raw file (not known for in-memory handoff).
+
+    Returns:
+    tuple: Path to saved raw file (None in case of extraction failure)
+    and flag if the content changed since the previous extraction.
+    """
+    file_path = os.path.join(directory, raw_file_name(name))
+    entry = cache.get(url) if cache is not None else None
+    if stats is None:
+        stats = {}
+    stats["records"] = 0
+
+    if entry and entry.get("file_path") == file_path and _entity_not_modified(entry):
+        logger.info("Endpoint %s not modified (304), '%s' is up to date.", url, name)
+        return file_path, False
+    page_meta = {}
+    if records is not None:
+        try:
+            entity_records = [
+                record
+                for page in fetch_pages(url, name, page_meta=page_meta)
+                for record in page
+            ]
+        except PaginationError as e:
+            logger.error("Paginated extraction of %s failed: %s", name, e)
+            entity_records = []
+        if not entity_records:
+            logger.warning("Extraction of %s failed,  skipping current endpoint.", name)
+            return None, False
+
+        records[name] = entity_records
+        stats["records"] = len(entity_records)
+        raw_writer.submit(name, url, entity_records, file_path, cache, page_meta)
+        # Content hash is compared on background, entity is handled as changed
+        return file_path, True
+
+    saved = write_raw_pages(
+        fetch_pages(url, name, page_meta=page_meta),
+        name,
+        file_path,
+        unchanged_hash=entry.get("content_hash") if entry else None,
+    )
+    if not saved or not saved["records"]:
+        logger.warning("Extraction of %s failed,  skipping current endpoint.", name)
+        return None, False
+    stats["records"] = saved["records"]
+    stats["bytes_written"] = os.path.getsize(file_path) if saved["written"] else 0
+
+    if cache is not None:
+        cache.update(
+            url,
+            {
+                "file_path": file_path,
+                "content_hash": saved["content_hash"],
+                "records": saved["records"],
+                "pages": page_meta,
+            },
+        )
+    return file_path, saved["written"]
+
+
+def extract_all_endpoints(
+    endpoints, directory, max_workers=None, cache=None, records=None, raw_writer=None
+) -> tuple[dict, set]:
+    """Fetch all endpoints in parallel on a thread pool.
+
+    Args:
+        endpoints: Mapping of entity name to API url.
+        directory: Directory for saving raw files.
+        max_workers: Maximum of parallel requests (default from config).
+        cache: Optional ExtractCache for conditional/incremental extraction.
+        records: Optional dict for in-memory handoff, filled with records
+            of every extracted entity (raw files are written by raw_writer).
+        raw_writer: BackgroundRawWriter used with records.
+
+    Returns:
+    tuple: Dict entity name -> path to saved raw file (None if extraction
+    failed) in the same order as endpoints, and set of entity names which
+    did not change since the previous extraction.
+    """
+    if max_workers is None:
+        max_workers = config.EXTRACT_MAX_WORKERS
+    max_workers = max(1, min(max_workers, len(endpoints) or 1))
+    if records is not None and raw_writer is None:
+        raise ValueError("In-memory handoff requires raw_writer.")
+
+    logger.info(
+        "Extracting %d endpoints with %d parallel workers.",
+        len(endpoints),
+        max_workers,
+    )
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="extract"
+    ) as executor:
+        futures = {
+            name: executor.submit(
+                extract_endpoint, name, url, directory, cache, records, raw_writer
+            )
+            for name, url in endpoints.items()
+        }
+
+    extracted_files = {}
+    unchanged = set()
+    for name, future in futures.items():
+        try:
+            extracted_files[name], changed = future.result()
+            if extracted_files[name] and not changed:
+                unchanged.add(name)
+        except Exception as e:
+            logger.error(
+                "Unexpected error during extraction of %s: %s", name, e, exc_info=True
+            )
+            extracted_files[name] = None
+    if unchanged:
+        logger.info("Unchanged entities since previous run: %s", sorted(unchanged))
+    return extracted_files, unchanged
+
+
 if __name__ == "__main__":
     # basic logging for separate module testing
     logging.basicConfig(
@@ -116,20 +782,11 @@ if __name__ == "__main__":
         format="%(asctime)s - %(levelname)s - %(module)s - %(message)s",
     )
 
-    # Working on each defined endpoint
-    for name, url in API_ENDPOINTS_TEST.items():
-        # 1. Extraction
-        extracted_data = fetch_from_api(url)
-
-        # Skipping current endpoing if extraction failed
-        if extracted_data is None:
-            logger.warning(
-                "Skipping another steps for %s due to error durin extraction.", name
-            )
-            continue
-
-        # File name is derived from endpoint name
-        json_filename = f"{name}_data.json"
-
-        # 2. Saving to JSON File
-        save_to_json(extracted_data, json_filename, config.DATA_DIR)
+    # Extraction and saving of all defined endpoints
+    extract_all_endpoints(
+        API_ENDPOINTS_TEST,
+        config.DATA_DIR,
+        cache=ExtractCache(
+            os.path.join(config.DATA_DIR, config.EXTRACT_CACHE_FILENAME)
+        ),
+    )
@@ -0,0 +1,73 @@
+"""Module provide cache of extracted endpoints for conditional/incremental extraction"""
+
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractCache:
+    """Cache of extraction results keyed by endpoint URL, persisted as JSON file.
+
+    Every entry holds path to raw file, content hash of its records, number of
+    records and ETag/Last-Modified validators of every page, e.g.:
+    {"file_path": ..., "content_hash": ..., "records": 208,
+     "pages": {page_url: {"etag": ..., "last_modified": ...}}}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+                logger.info(
+                    "Extraction cache loaded from %s (%d entries).",
+                    path,
+                    len(self._entries),
+                )
+            except (IOError, json.JSONDecodeError) as e:
+                logger.warning(
+                    "Extraction cache %s could not be read, starting empty: %s", path, e
+                )
+                self._entries = {}
+
+    def get(self, url: str) -> dict | None:
+        """Return cached entry for url (None if url was not extracted before)."""
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def update(self, url: str, entry: dict):
+        """Store new entry for url."""
+        with self._lock:
+            self._entries[url] = entry
+
+    def save(self):
+        """Write cache to its JSON file (through temporary file)."""
+        tmp_path = f"{self.path}.part"
+        with self._lock:
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, indent=4)
+                os.replace(tmp_path, self.path)
+                logger.info("Extraction cache saved to %s.", self.path)
+            except IOError as e:
+                logger.error(
+                    "Extraction cache could not be saved to %s: %s", self.path, e
+                )
+
+
+def conditional_headers(validators: dict | None) -> dict:
+    """Build If-None-Match/If-Modified-Since headers from cached page validators."""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
@@ -0,0 +1,266 @@
+"""Module provide shared HTTP client with connection pooling, retries and rate limiting"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth another attempt (throttling and temporary server errors)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# Counters of requests kept for every endpoint
+HTTP_STATS = ("requests", "retries", "bytes_received")
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting number of requests per second."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, block until it is available. Returns waited seconds."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HttpClient:
+    """HTTP client sharing pooled keep-alive connections between threads.
+
+    Requests are retried with exponential backoff with full jitter, 'Retry-After'
+    header of throttled responses is honored and every host has its own token
+    bucket rate limiter. All settings default to values from config.py.
+
+    Requests, retries and received bytes are counted per endpoint (url without
+    query, see stats).
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        backoff_base: float | None = None,
+        backoff_max: float | None = None,
+        pool_maxsize: int | None = None,
+        rate_limit: float | None = None,
+        rate_burst: int | None = None,
+    ):
+        self.timeout = config.HTTP_TIMEOUT if timeout is None else timeout
+        self.max_retries = (
+            config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.backoff_base = (
+            config.HTTP_BACKOFF_BASE if backoff_base is None else backoff_base
+        )
+        self.backoff_max = (
+            config.HTTP_BACKOFF_MAX if backoff_max is None else backoff_max
+        )
+        self.rate_limit = (
+            config.HTTP_RATE_LIMIT_PER_SEC if rate_limit is None else rate_limit
+        )
+        self.rate_burst = (
+            config.HTTP_RATE_LIMIT_BURST if rate_burst is None else rate_burst
+        )
+        pool_maxsize = (
+            config.HTTP_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        )
+
+        self.session = requests.Session()
+        # Retries are handled here, adapter only keeps pool of connections
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._buckets = {}
+        self._buckets_lock = threading.Lock()
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def _bucket(self, url) -> TokenBucket | None:
+        """Return rate limiter of url host (None if rate limiting is disabled)."""
+        if not self.rate_limit or self.rate_limit <= 0:
+            return None
+        host = urlsplit(url).netloc
+        with self._buckets_lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate_limit, self.rate_burst)
+            return self._buckets[host]
+
+    @staticmethod
+    def _endpoint(url) -> str:
+        return urlsplit(url)._replace(query="", fragment="").geturl()
+
+    def _count(self, url, **counts):
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                self._endpoint(url), dict.fromkeys(HTTP_STATS, 0)
+            )
+            for name, value in counts.items():
+                stats[name] += value
+
+    def stats(self, url) -> dict:
+        """Return counters of requests, retries and received bytes of endpoint."""
+        with self._stats_lock:
+            return dict(
+                self._stats.get(self._endpoint(url), dict.fromkeys(HTTP_STATS, 0))
+            )
+
+    def backoff_delay(self, attempt: int, base: float | None = None) -> float:
+        """Exponential backoff with full jitter for given attempt (0-based)."""
+        base = self.backoff_base if base is None else base
+        return random.uniform(0, min(self.backoff_max, base * 2**attempt))
+
+    @staticmethod
+    def retry_after(response) -> float | None:
+        """Parse 'Retry-After' header (seconds or HTTP date) to seconds."""
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def get(
+        self,
+        url,
+        headers: dict | None = None,
+        max_retries: int | None = None,
+        backoff_base: float | None = None,
+    ) -> requests.Response | None:
+        """Send GET request with retry logic.
+
+        Returns:
+        requests.Response: Successful response (2xx/3xx) or None when all
+        attempts failed or server answered with not retryable error.
+        """
+        max_retries = self.max_retries if max_retries is None else max_retries
+        max_retries = max(1, max_retries)
+        bucket = self._bucket(url)
+
+        for attempt in range(max_retries):
+            response = None
+            if bucket is not None:
+                waited = bucket.acquire()
+                if waited:
+                    logger.debug(
+                        "Rate limit: waited %.3f s before request to %s", waited, url
+                    )
+            try:
+                logger.info(
+                    "Attempt %d/%d: Data extraction form %s",
+                    attempt + 1,
+                    max_retries,
+                    url,
+                )
+                self._count(url, requests=1, retries=1 if attempt else 0)
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                self._count(url, bytes_received=len(response.content))
+                response.raise_for_status()  # Check (4xx,5xx) Errors
+                logger.info(
+                    "Successfully downloaded data from  %s (Status: %d).",
+                    url,
+                    response.status_code,
+                )
+                return response
+
+            except requests.exceptions.HTTPError as e:
+                logger.warning(
+                    "Attempt %d/%d: HTTP Error for %s: %s",
+                    attempt + 1,
+                    max_retries,
+                    url,
+                    e,
+                )
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    logger.error(
+                        "HTTP status %d is not retryable.", response.status_code
+                    )
+                    return None
+            except requests.exceptions.ConnectionError as e:
+                logger.warning(
+                    "Attempt %d/%d: Connection Error for %s: %s",
+                    attempt + 1,
+                    max_retries,
+                    url,
+                    e,
+                )
+            except requests.exceptions.Timeout as e:
+                logger.warning(
+                    "Attempt %d/%d: Timeout for %s: %s",
+                    attempt + 1,
+                    max_retries,
+                    url,
+                    e,
+                )
+            except requests.exceptions.RequestException as e:
+                logger.warning(
+                    "Attempt %d/%d: Request Error for %s: %s",
+                    attempt + 1,
+                    max_retries,
+                    url,
+                    e,
+                )
+
+            # Waiting for another response if we are not in last attempt
+            if attempt < max_retries - 1:
+                delay = self.backoff_delay(attempt, backoff_base)
+                retry_after = self.retry_after(response)
+                if retry_after is not None:
+                    delay = min(self.backoff_max, max(delay, retry_after))
+                logger.info("Waiting %f s before another attempt.", delay)
+                time.sleep(delay)
+
+        logger.error("Downloading data was unsuccessful")
+        return None  # All attempt failure
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return HTTP client shared by all extraction threads (created on first use)."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
@@ -0,0 +1,230 @@
+"""Module manage secondary indexes and constraints around bulk loads"""
+
+import logging
+from contextlib import contextmanager
+
+from sqlalchemy import Column, Index, MetaData, Table, bindparam, inspect, text
+
+from src.connection_manager import transaction
+
+logger = logging.getLogger(__name__)
+
+# Declarative secondary indexes for common lookups (created by
+# ensure_secondary_indexes). dialect_options are passed to sqlalchemy Index,
+# e.g. {"postgresql_using": "btree"} or {"mssql_include": ["quantity"]}.
+SECONDARY_INDEXES = [
+    {
+        "name": "ix_carts_user_id",
+        "table": "carts",
+        "columns": ["user_id"],
+        "dialect_options": {},
+    },
+    {
+        "name": "ix_cart_items_cart_id",
+        "table": "cart_items",
+        "columns": ["cart_id"],
+        "dialect_options": {},
+    },
+    {
+        "name": "ix_cart_items_product_id",
+        "table": "cart_items",
+        "columns": ["product_id"],
+        "dialect_options": {"mssql_include": ["quantity", "price"]},
+    },
+    {
+        "name": "ix_product_reviews_product_id",
+        "table": "product_reviews",
+        "columns": ["product_id"],
+        "dialect_options": {},
+    },
+]
+
+
+def ensure_secondary_indexes(engine, schema_name: str = None) -> int:
+    """Create missing SECONDARY_INDEXES (tables that do not exist are skipped).
+    engine can be an engine or a connection.
+
+    Returns:
+    int: Number of created indexes.
+    """
+    inspector = inspect(engine)
+    dialect_name = engine.dialect.name
+    created = 0
+    for index_spec in SECONDARY_INDEXES:
+        table_name = index_spec["table"]
+        if not inspector.has_table(table_name, schema=schema_name):
+            continue
+        existing = {
+            index["name"]
+            for index in inspector.get_indexes(table_name, schema=schema_name)
+        }
+        if index_spec["name"] in existing:
+            continue
+        table = Table(
+            table_name,
+            MetaData(),
+            *[Column(column) for column in index_spec["columns"]],
+            schema=schema_name,
+        )
+        dialect_options = {
+            option: value
+            for option, value in index_spec["dialect_options"].items()
+            if option.startswith(f"{dialect_name}_")
+        }
+        index = Index(
+            index_spec["name"],
+            *[table.c[column] for column in index_spec["columns"]],
+            **dialect_options,
+        )
+        with transaction(engine) as connection:
+            index.create(connection)
+        created += 1
+        logger.info("Secondary index '%s' created.", index_spec["name"])
+    return created
+
+
+def _quote_table(preparer, table_name, schema_name):
+    if schema_name:
+        return f"{preparer.quote_schema(schema_name)}.{preparer.quote(table_name)}"
+    return preparer.quote(table_name)
+
+
+def _suspend_sqlite(connection, table_names, schema_name) -> list:
+    """Drop explicit indexes (UNIQUE autoindexes cannot be dropped in SQLite)."""
+    rows = connection.execute(
+        text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index'"
+            " AND sql IS NOT NULL AND tbl_name IN :tables"
+        ).bindparams(bindparam("tables", expanding=True)),
+        {"tables": table_names},
+    ).fetchall()
+    preparer = connection.dialect.identifier_preparer
+    for index_name, _ in rows:
+        connection.execute(text(f"DROP INDEX {preparer.quote(index_name)}"))
+    return [index_sql for _, index_sql in rows]
+
+
+def _suspend_postgresql(connection, table_names, schema_name) -> list:
+    """Drop FK and UNIQUE constraints and secondary indexes."""
+    preparer = connection.dialect.identifier_preparer
+    schema_name = schema_name or "public"
+    constraints = connection.execute(
+        text(
+            "SELECT con.conname, rel.relname, con.contype,"
+            " pg_get_constraintdef(con.oid)"
+            " FROM pg_constraint con"
+            " JOIN pg_class rel ON rel.oid = con.conrelid"
+            " JOIN pg_namespace nsp ON nsp.oid = rel.relnamespace"
+            " WHERE nsp.nspname = :schema AND rel.relname IN :tables"
+            " AND con.contype IN ('f', 'u')"
+            # FK constraints are dropped first and restored last
+            " ORDER BY con.contype = 'u'"
+        ).bindparams(bindparam("tables", expanding=True)),
+        {"schema": schema_name, "tables": table_names},
+    ).fetchall()
+    indexes = connection.execute(
+        text(
+            "SELECT i.indexname, i.indexdef FROM pg_indexes i"
+            " WHERE i.schemaname = :schema AND i.tablename IN :tables"
+            " AND NOT EXISTS (SELECT 1 FROM pg_constraint con"
+            " WHERE con.conname = i.indexname AND con.contype IN ('p', 'u', 'x'))"
+        ).bindparams(bindparam("tables", expanding=True)),
+        {"schema": schema_name, "tables": table_names},
+    ).fetchall()
+
+    restore = []
+    for constraint_name, table_name, _, definition in constraints:
+        table = _quote_table(preparer, table_name, schema_name)
+        constraint = preparer.quote(constraint_name)
+        connection.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT {constraint}"))
+        restore.insert(
+            0, f"ALTER TABLE {table} ADD CONSTRAINT {constraint} {definition}"
+        )
+    for index_name, index_definition in indexes:
+        connection.execute(
+            text(f"DROP INDEX {_quote_table(preparer, index_name, schema_name)}")
+        )
+        restore.insert(0, index_definition)
+    return restore
+
+
+def _suspend_mssql(connection, table_names, schema_name) -> list:
+    """Disable nonclustered indexes and FK/CHECK constraints."""
+    preparer = connection.dialect.identifier_preparer
+    schema_name = schema_name or "dbo"
+    indexes = connection.execute(
+        text(
+            "SELECT i.name, t.name FROM sys.indexes i"
+            " JOIN sys.tables t ON t.object_id = i.object_id"
+            " JOIN sys.schemas s ON s.schema_id = t.schema_id"
+            " WHERE s.name = :schema AND t.name IN :tables"
+            " AND i.type_desc = 'NONCLUSTERED' AND i.is_primary_key = 0"
+            " AND i.is_disabled = 0"
+        ).bindparams(bindparam("tables", expanding=True)),
+        {"schema": schema_name, "tables": table_names},
+    ).fetchall()
+
+    restore = []
+    for table_name in table_names:
+        table = _quote_table(preparer, table_name, schema_name)
+        connection.execute(text(f"ALTER TABLE {table} NOCHECK CONSTRAINT ALL"))
+        restore.append(f"ALTER TABLE {table} WITH CHECK CHECK CONSTRAINT ALL")
+    for index_name, table_name in indexes:
+        table = _quote_table(preparer, table_name, schema_name)
+        index = preparer.quote(index_name)
+        connection.execute(text(f"ALTER INDEX {index} ON {table} DISABLE"))
+        # Indexes are rebuilt before constraints are checked again
+        restore.insert(0, f"ALTER INDEX {index} ON {table} REBUILD")
+    return restore
+
+
+_SUSPEND_FUNCTIONS = {
+    "sqlite": _suspend_sqlite,
+    "postgresql": _suspend_postgresql,
+    "mssql": _suspend_mssql,
+}
+
+
+@contextmanager
+def deferred_indexes(engine, table_names, schema_name: str = None, enabled=True):
+    """Drop or disable secondary indexes and constraints of tables for bulk load.
+
+    Primary keys are kept (upsert merges on them). Indexes and constraints are
+    rebuilt when the block ends, also if the load failed. engine can be an
+    engine or a connection (every step runs in its own transaction).
+
+    Raises:
+    RuntimeError: If some index or constraint could not be rebuilt (e.g. loaded
+    rows violate UNIQUE constraint).
+    """
+    table_names = list(table_names)
+    suspend = _SUSPEND_FUNCTIONS.get(engine.dialect.name)
+    if not enabled or not table_names or suspend is None:
+        yield
+        return
+
+    with transaction(engine) as connection:
+        restore_statements = suspend(connection, table_names, schema_name)
+    logger.info(
+        "Indexes and constraints of %s suspended for bulk load (%d to rebuild).",
+        table_names,
+        len(restore_statements),
+    )
+    try:
+        yield
+    finally:
+        failed = []
+        for statement in restore_statements:
+            logger.debug("Rebuilding: %s", statement)
+            try:
+                with transaction(engine) as connection:
+                    connection.execute(text(statement))
+            except Exception as e:
+                logger.error("Could not rebuild '%s': %s", statement, e)
+                failed.append(statement)
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} indexes or constraints could not be rebuilt"
+                f" after load of {table_names}"
+            )
+        logger.info("Indexes and constraints of %s rebuilt.", table_names)
@@ -1,19 +1,56 @@
 """Module for loading data to sql database using SQLAlchemu DB engine"""
 
+import csv
+import io
 import logging
 import pandas as pd
-from sqlalchemy import create_engine, exc, text
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    Text,
+    bindparam,
+    create_engine,
+    event,
+    exc,
+    inspect,
+    text,
+)
+from sqlalchemy.engine import make_url
 import re
 
+import config
+from src.connection_manager import connect, transaction
+from src.table_schemas import TABLE_SCHEMAS, sql_dtypes, to_csv_buffer, to_insert_rows
+
 logger = logging.getLogger(__name__)
 
+# SQLite connection settings for bulk load (WAL journal, less fsyncs, bigger cache)
+SQLITE_BULK_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",  # in KiB (64 MiB)
+}
+
+# Tables where the DataFrame provides the ID that is an IDENTITY column in MSSQL DDL
+MSSQL_IDENTITY_TABLES = ["users", "products", "carts"]
+
+# Upsert load mode: primary keys rows are merged on
+UPSERT_KEYS = {"users": ["user_id"], "products": ["id"], "carts": ["cart_id"]}
+# Child tables without natural key, their rows are replaced per parent key
+UPSERT_PARENT_KEYS = {"cart_items": "cart_id", "product_reviews": "product_id"}
+# Keys in one DELETE statement (below parameter limits of SQLite and MSSQL)
+DELETE_BATCH_SIZE = 500
+
 
 def apply_ddl_script(engine, ddl_file_path: str):
     """
     Reads a DDL script from a file and executes its statements against the database.
     Handles MSSQL 'GO' statements by splitting the script.
     Args:
-        engine: SQLAlchemy engine instance.
+        engine: SQLAlchemy engine instance or connection (e.g. shared connection of
+            ConnectionManager).
         ddl_file_path (str): Absolute path to the .sql DDL script file.
     """
     logger.info("Applying DDL script from: %s", ddl_file_path)
@@ -22,11 +59,13 @@ def apply_ddl_script(engine, ddl_file_path: str):
             full_script = f.read()
 
         db_dialect_name = engine.dialect.name
-        logger.info("Detected DB dialect: %s",db_dialect_name)
+        logger.info("Detected DB dialect: %s", db_dialect_name)
 
         sql_commands = []
         if db_dialect_name == "mssql":
-            batches = re.split(r'^\s*GO\s*$', full_script, flags=re.MULTILINE | re.IGNORECASE)
+            batches = re.split(
+                r"^\s*GO\s*$", full_script, flags=re.MULTILINE | re.IGNORECASE
+            )
             for batch in batches:
                 batch = batch.strip()
                 if batch:
@@ -35,13 +74,15 @@ def apply_ddl_script(engine, ddl_file_path: str):
         else:  # For PostgreSQL and SQLite
             commands_with_comments_removed = []
             # Remove block comments
-            script_no_block_comments = re.sub(r'/\*.*?\*/', '', full_script, flags=re.MULTILINE | re.IGNORECASE)
+            script_no_block_comments = re.sub(
+                r"/\*.*?\*/", "", full_script, flags=re.MULTILINE | re.IGNORECASE
+            )
             # Remove full-line comments
             lines_no_full_comments = []
             for line in script_no_block_comments.splitlines():
                 stripped_line = line.split("--", 1)[0].strip()
                 if stripped_line:
-                    lines_no_full_comments.append(stripped_line) 
+                    lines_no_full_comments.append(stripped_line)
 
             # Filter out empty strings, handling multiline statements
             script_for_splitting = " ".join(lines_no_full_comments)
@@ -56,7 +97,7 @@ def apply_ddl_script(engine, ddl_file_path: str):
             logger.warning("No SQL commands found in DDL file: %s", ddl_file_path)
             return
 
-        with engine.connect() as connection:
+        with connect(engine) as connection:
             for command_index, command in enumerate(sql_commands):
                 if command:
                     try:
@@ -66,7 +107,9 @@ def apply_ddl_script(engine, ddl_file_path: str):
                             command[:200],
                         )
                         connection.execute(text(command))
-                        logger.info("Successfully executed DDL command #%s.", command_index + 1)
+                        logger.info(
+                            "Successfully executed DDL command #%s.", command_index + 1
+                        )
                     except Exception as cmd_exc:
                         logger.error(
                             "Error executing DDL command #%s: %s... Error: %s",
@@ -102,15 +145,51 @@ def apply_ddl_script(engine, ddl_file_path: str):
         raise
 
 
-def create_db_engine(connection_string: str):
-    """Create and return SQLAlchemy database engine"""
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_BULK_PRAGMAS to every new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_BULK_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
+def create_db_engine(connection_string: str, bulk_load: bool = None):
+    """Create and return SQLAlchemy database engine
+    Connection pool is configured from config.DB_POOL_* settings (SQLite keeps its
+    default pool, size and overflow apply to server databases).
+    With bulk_load (default: config.LOAD_METHOD is "bulk") the engine is tuned for
+    bulk inserts: fast_executemany for MSSQL (pyodbc), PRAGMAs for SQLite.
+    config.DB_EXECUTEMANY_MODE overrides executemany strategy of the driver.
+    """
     if not connection_string:
         logger.error(
             "Database connection string is not provided. Cannot create engine."
         )
         return None
+    if bulk_load is None:
+        bulk_load = config.LOAD_METHOD == "bulk"
     try:
-        engine = create_engine(connection_string)
+        url = make_url(connection_string)
+        backend_name, driver_name = url.get_backend_name(), url.get_driver_name()
+        engine_options = {
+            "pool_pre_ping": config.DB_POOL_PRE_PING,
+            "pool_recycle": config.DB_POOL_RECYCLE,
+        }
+        if backend_name != "sqlite":
+            engine_options["pool_size"] = config.DB_POOL_SIZE
+            engine_options["max_overflow"] = config.DB_MAX_OVERFLOW
+            engine_options["pool_timeout"] = config.DB_POOL_TIMEOUT
+        executemany_mode = config.DB_EXECUTEMANY_MODE
+        if backend_name == "mssql" and driver_name == "pyodbc":
+            if executemany_mode == "fast" or (executemany_mode == "auto" and bulk_load):
+                # Parameters of executemany are sent to server in one array
+                engine_options["fast_executemany"] = True
+        elif backend_name == "postgresql" and driver_name == "psycopg2":
+            if executemany_mode in ("values_only", "values_plus_batch"):
+                engine_options["executemany_mode"] = executemany_mode
+        engine = create_engine(connection_string, **engine_options)
+        if bulk_load and engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", _set_sqlite_pragmas)
         # Test connection
         with engine.connect() as connection:
             connection.execute(text("SELECT 1"))
@@ -143,95 +222,395 @@ def create_db_engine(connection_string: str):
         return None
 
 
+def _copy_csv(connection, target: str, columns: str, buffer):
+    """Stream CSV buffer to target table with PostgreSQL COPY FROM STDIN (psycopg2).
+    Values \\N are loaded as NULL.
+    """
+    dbapi_connection = (
+        connection.connection
+    )  # psycopg2 connection of SQLAlchemy connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {target} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+        return cursor.rowcount
+
+
+def _copy_from_stdin(table, conn, keys, data_iter):
+    """pandas to_sql insert method using PostgreSQL COPY FROM STDIN (psycopg2).
+    Used for tables missing in TABLE_SCHEMAS, rows are streamed as CSV.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in data_iter:
+        writer.writerow([r"\N" if value is None else value for value in row])
+    buffer.seek(0)
+
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.quote(table.name)
+    if table.schema:
+        table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+    return _copy_csv(conn, table_name, columns, buffer)
+
+
+def _bulk_insert_method(engine):
+    """Return to_sql insert method of bulk load for engine dialect.
+    None means pandas executemany, which is bulk path for MSSQL (fast_executemany)
+    and SQLite (one executemany per chunk in single transaction).
+    """
+    if engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2":
+        return _copy_from_stdin
+    return None
+
+
+def _bulk_insert(connection, df, table_name, schema_name, chunksize, schema_key):
+    """Bulk load hot path for tables registered in TABLE_SCHEMAS.
+    Values are pre-serialized column by column (see table_schemas.py) and sent
+    with COPY (PostgreSQL/psycopg2) or plain DBAPI executemany (SQLite, MSSQL),
+    so no per-value type conversion is done by pandas or SQLAlchemy.
+    """
+    preparer = connection.dialect.identifier_preparer
+    target = preparer.quote(table_name)
+    if schema_name:
+        target = f"{preparer.quote_schema(schema_name)}.{target}"
+    columns = ", ".join(preparer.quote(column) for column in df.columns)
+    use_copy = (
+        connection.dialect.name == "postgresql"
+        and connection.dialect.driver == "psycopg2"
+    )
+    placeholder = "?" if connection.dialect.paramstyle == "qmark" else "%s"
+    insert_sql = f"INSERT INTO {target} ({columns}) VALUES ({', '.join([placeholder] * len(df.columns))})"
+    for start in range(0, len(df), chunksize):
+        df_chunk = df.iloc[start : start + chunksize]
+        if use_copy:
+            _copy_csv(connection, target, columns, to_csv_buffer(df_chunk, schema_key))
+        else:
+            connection.exec_driver_sql(insert_sql, to_insert_rows(df_chunk, schema_key))
+
+
+def _write_dataframe(
+    connection,
+    df,
+    table_name,
+    schema_name,
+    if_exists,
+    chunksize,
+    method,
+    schema_key=None,
+):
+    """Write DataFrame over connection: bulk hot path for tables in TABLE_SCHEMAS,
+    pandas to_sql with explicit dtype mapping otherwise.
+    schema_key: TABLE_SCHEMAS entry of table (default table_name).
+    """
+    schema_key = schema_key or table_name
+    if method == "bulk" and if_exists == "append" and schema_key in TABLE_SCHEMAS:
+        _bulk_insert(connection, df, table_name, schema_name, chunksize, schema_key)
+        return
+    df.to_sql(
+        name=table_name,
+        con=connection,
+        schema=schema_name,
+        if_exists=if_exists,
+        index=False,
+        chunksize=chunksize,
+        method=_bulk_insert_method(connection) if method == "bulk" else None,
+        dtype=sql_dtypes(schema_key, df.columns),
+    )
+
+
+def tables_exist(engine, table_names, schema_name: str = None) -> bool:
+    """Return True if all tables exist in database (schema)."""
+    inspector = inspect(engine)
+    return all(
+        inspector.has_table(table_name, schema=schema_name)
+        for table_name in table_names
+    )
+
+
+def _merge_changed_rows_sql(dialect_name, target, changed, columns, keys):
+    """SQL statements merging changed rows (SELECT query) into target on keys.
+    ON CONFLICT upsert for PostgreSQL and SQLite, MERGE for MSSQL.
+    """
+    column_list = ", ".join(columns)
+    update_columns = [column for column in columns if column not in keys]
+    if dialect_name == "mssql":
+        on_keys = " AND ".join(f"t.{key} = s.{key}" for key in keys)
+        update_set = ", ".join(f"t.{column} = s.{column}" for column in update_columns)
+        source_columns = ", ".join(f"s.{column}" for column in columns)
+        merge = f"MERGE INTO {target} AS t USING ({changed}) AS s ON {on_keys} "
+        if update_columns:
+            merge += f"WHEN MATCHED THEN UPDATE SET {update_set} "
+        merge += (
+            f"WHEN NOT MATCHED THEN INSERT ({column_list}) VALUES ({source_columns});"
+        )
+        return [merge]
+
+    if update_columns:
+        update_set = ", ".join(
+            f"{column} = excluded.{column}" for column in update_columns
+        )
+        on_conflict = f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {update_set}"
+    else:
+        on_conflict = f"ON CONFLICT ({', '.join(keys)}) DO NOTHING"
+    # 'WHERE true' separates SELECT from ON CONFLICT clause for SQLite parser
+    return [
+        f"INSERT INTO {target} ({column_list}) "
+        f"SELECT {column_list} FROM ({changed}) AS changed_rows WHERE true {on_conflict}"
+    ]
+
+
+def _staging_table(dialect_name: str, table_name: str, columns) -> Table:
+    """Temporary table (visible only to its session) with columns of DataFrame
+    and column types of target table (#<table>_stage on MSSQL)."""
+    column_types = sql_dtypes(table_name) or {}
+    columns = [Column(column, column_types.get(column, Text())) for column in columns]
+    if dialect_name == "mssql":
+        return Table(f"#{table_name}_stage", MetaData(), *columns)
+    return Table(f"{table_name}_stage", MetaData(), *columns, prefixes=["TEMPORARY"])
+
+
+def _drop_staging_table(connection, stage_table: Table):
+    """Drop staging table if it exists (it is gone if its creation was rolled
+    back). Errors are only logged, temporary table is dropped by database when
+    connection is closed (e.g. transaction of caller failed and must be rolled
+    back first)."""
+    try:
+        with transaction(connection) as connection:
+            stage_table.drop(connection, checkfirst=True)
+    except exc.SQLAlchemyError as e:
+        logger.debug("Could not drop staging table %s: %s", stage_table.name, e)
+
+
+def _upsert_dataframe(
+    df, table_name, connectable, schema_name, chunksize, method
+) -> int:
+    """Stage DataFrame in a temporary table and merge only changed rows into table.
+    Tables in UPSERT_KEYS are merged on their primary key, rows of child tables
+    (UPSERT_PARENT_KEYS) are replaced for parents whose rows have changed.
+    Everything runs in one transaction (of connectable if it is a connection).
+    Staging table is a session temporary table (see _staging_table), so
+    concurrent loads of the same table do not share it, it is dropped at the
+    end (also on error) or at latest when the connection is closed.
+    Returns number of written (inserted or updated) rows.
+    """
+    if table_name not in UPSERT_KEYS and table_name not in UPSERT_PARENT_KEYS:
+        raise ValueError(f"No upsert key defined for table '{table_name}'.")
+
+    dialect = connectable.dialect
+    preparer = dialect.identifier_preparer
+    schema_prefix = f"{preparer.quote_schema(schema_name)}." if schema_name else ""
+    target = f"{schema_prefix}{preparer.quote(table_name)}"
+    stage_table = _staging_table(dialect.name, table_name, df.columns)
+    stage = preparer.format_table(stage_table)
+    columns = [preparer.quote(column) for column in df.columns]
+    column_list = ", ".join(columns)
+    # New or changed rows (EXCEPT compares NULLs as equal)
+    changed = (
+        f"SELECT {column_list} FROM {stage} EXCEPT SELECT {column_list} FROM {target}"
+    )
+
+    with connect(connectable) as session:
+        try:
+            with transaction(session) as connection:
+                stage_table.create(connection)
+                _write_dataframe(
+                    connection,
+                    df,
+                    stage_table.name,
+                    None,
+                    "append",
+                    chunksize,
+                    method,
+                    table_name,
+                )
+
+                if table_name in UPSERT_KEYS:
+                    written_rows = connection.execute(
+                        text(f"SELECT COUNT(*) FROM ({changed}) AS changed_rows")
+                    ).scalar()
+                    if written_rows:
+                        statements = _merge_changed_rows_sql(
+                            dialect.name,
+                            target,
+                            changed,
+                            columns,
+                            [preparer.quote(key) for key in UPSERT_KEYS[table_name]],
+                        )
+                        identity_insert = (
+                            dialect.name == "mssql"
+                            and table_name in MSSQL_IDENTITY_TABLES
+                        )
+                        if identity_insert:
+                            statements = [
+                                f"SET IDENTITY_INSERT {target} ON;",
+                                *statements,
+                                f"SET IDENTITY_INSERT {target} OFF;",
+                            ]
+                        for statement in statements:
+                            connection.execute(text(statement))
+                else:
+                    parent_key = preparer.quote(UPSERT_PARENT_KEYS[table_name])
+                    stored = (
+                        f"SELECT {column_list} FROM {target} "
+                        f"WHERE {parent_key} IN (SELECT {parent_key} FROM {stage})"
+                    )
+                    changed_parents = (
+                        f"SELECT {parent_key} FROM ({changed}) AS added_rows UNION "
+                        f"SELECT {parent_key} FROM ({stored} EXCEPT SELECT {column_list} FROM {stage}) AS removed_rows"
+                    )
+                    # Keep only rows of changed parents in stage, then replace them in target
+                    connection.execute(
+                        text(
+                            f"DELETE FROM {stage} WHERE {parent_key} NOT IN ({changed_parents})"
+                        )
+                    )
+                    connection.execute(
+                        text(
+                            f"DELETE FROM {target} WHERE {parent_key} IN (SELECT {parent_key} FROM {stage})"
+                        )
+                    )
+                    connection.execute(
+                        text(
+                            f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {stage}"
+                        )
+                    )
+                    written_rows = connection.execute(
+                        text(f"SELECT COUNT(*) FROM {stage}")
+                    ).scalar()
+        finally:
+            _drop_staging_table(session, stage_table)
+    return written_rows
+
+
 def load_dataframe_to_db(
     df: pd.DataFrame,
     table_name: str,
     engine,
     schema_name: str = None,
     if_exists: str = "append",
-    chunksize: int = 1000,
+    chunksize: int = None,
+    method: str = None,
 ):
-    """Load pandas DataFrame to sql table"""
+    """Load pandas DataFrame to sql table.
+    engine: SQLAlchemy engine (table is loaded in its own transaction) or connection
+    (table is loaded in its open transaction, commit is left to the caller).
+    if_exists: "append" or "upsert" (merge rows on primary keys, see UPSERT_KEYS),
+    other values are passed to pandas to_sql.
+    method: "bulk" (dialect native bulk load) or "to_sql" (plain inserts by pandas),
+    default config.LOAD_METHOD. Column types of tables are taken from TABLE_SCHEMAS,
+    bulk load sends their values pre-serialized (see _bulk_insert). Default chunksize is config.LOAD_BULK_CHUNKSIZE
+    for bulk load and 1000 for to_sql.
+    Returns True if data were loaded (or there was nothing to load), False on error.
+    """
     if engine is None:
         logger.error(
             "Database engine is not available. Cannot load data to table '%s'.",
             table_name,
         )
-        return
+        return False
     if df is None or df.empty:
         logger.warning(
             "DataFrame for table '%s%s' is empty or None.",
             schema_name + "." if schema_name else "",
             table_name,
         )
-        return
+        return True
+
+    if method is None:
+        method = config.LOAD_METHOD
+    if method == "bulk":
+        chunksize = chunksize or config.LOAD_BULK_CHUNKSIZE
+    else:
+        chunksize = chunksize or 1000
 
     full_table_name_for_log = f"{schema_name + '.' if schema_name else ''}{table_name}"
-    qualified_table_name_for_mssql = f"{schema_name}.{table_name}" if schema_name else table_name
+    qualified_table_name_for_mssql = (
+        f"{schema_name}.{table_name}" if schema_name else table_name
+    )
 
     try:
         logger.info(
-            "Loading data into table '%s' (if_exists='%s'). DataFrame shape: %s",
+            "Loading data into table '%s' (if_exists='%s', method='%s'). DataFrame shape: %s",
             full_table_name_for_log,
             if_exists,
+            method,
             df.shape,
         )
+        if if_exists == "upsert":
+            written_rows = _upsert_dataframe(
+                df, table_name, engine, schema_name, chunksize, method
+            )
+            logger.info(
+                "Data successfully merged to table '%s'. Rows: %d, changed rows written: %d",
+                full_table_name_for_log,
+                len(df),
+                written_rows,
+            )
+            return True
+
         # MSSQL specific: Handle IDENTITY_INSERT
         is_mssql = engine.dialect.name == "mssql"
-        # Tables where the DataFrame provides the ID that is an IDENTITY column in MSSQL DDL
-        tables_requiring_identity_insert_on = ["users", "products", "carts"] 
-
-        if is_mssql and table_name in tables_requiring_identity_insert_on:
-            with engine.connect() as connection:
+        if is_mssql and table_name in MSSQL_IDENTITY_TABLES:
+            with transaction(engine) as connection:
                 try:
-                    logger.debug("Attempting to SET IDENTITY_INSERT %s ON",
-                                qualified_table_name_for_mssql
+                    logger.debug(
+                        "Attempting to SET IDENTITY_INSERT %s ON",
+                        qualified_table_name_for_mssql,
+                    )
+                    sql_identity_on = (
+                        f"SET IDENTITY_INSERT {qualified_table_name_for_mssql} ON;"
                     )
-                    sql_identity_on = f"SET IDENTITY_INSERT {qualified_table_name_for_mssql} ON;"
                     connection.execute(text(sql_identity_on))
-                    connection.commit() # Commit this SET statement
-
-                    df.to_sql(
-                        name=table_name,
-                        con=connection, 
-                        schema=schema_name,
-                        if_exists=if_exists,
-                        index=False,
-                        chunksize=chunksize,
+
+                    _write_dataframe(
+                        connection,
+                        df,
+                        table_name,
+                        schema_name,
+                        if_exists,
+                        chunksize,
+                        method,
                     )
 
-                    logger.debug("Attempting to SET IDENTITY_INSERT %s OFF",
-                                qualified_table_name_for_mssql
+                    logger.debug(
+                        "Attempting to SET IDENTITY_INSERT %s OFF",
+                        qualified_table_name_for_mssql,
+                    )
+                    sql_identity_off = (
+                        f"SET IDENTITY_INSERT {qualified_table_name_for_mssql} OFF;"
                     )
-                    sql_identity_off = f"SET IDENTITY_INSERT {qualified_table_name_for_mssql} OFF;"
                     connection.execute(text(sql_identity_off))
-                    connection.commit() # Commit this SET statement
 
                 except Exception as e_identity:
-                    logger.error("Error during MSSQL IDENTITY_INSERT handling for %s: %s",
-                                qualified_table_name_for_mssql,
-                                e_identity,
-                                exc_info=True
+                    logger.error(
+                        "Error during MSSQL IDENTITY_INSERT handling for %s: %s",
+                        qualified_table_name_for_mssql,
+                        e_identity,
+                        exc_info=True,
                     )
-                    connection.rollback() # Rollback if any part of identity insert handling fails
-                    raise 
+                    raise  # Transaction is rolled back
 
         else:
-        # For other databases (PostgreSQL, SQLite)
-            df.to_sql(
-                name=table_name,
-                con=engine, # Use engine directly for other DBs
-                schema=schema_name,
-                if_exists=if_exists,
-                index=False,
-                chunksize=chunksize,
-            )
+            # For other databases (PostgreSQL, SQLite)
+            with transaction(engine) as connection:
+                _write_dataframe(
+                    connection,
+                    df,
+                    table_name,
+                    schema_name,
+                    if_exists,
+                    chunksize,
+                    method,
+                )
 
         logger.info(
             "Data successfully loaded to table '%s'. Number of loaded rows: %d",
             full_table_name_for_log,
             len(df),
         )
+        return True
     except exc.SQLAlchemyError as e:
         logger.error(
             "SQLAlchemy error when uploading data to the table  '%s': %s",
@@ -245,4 +624,78 @@ def load_dataframe_to_db(
             full_table_name_for_log,
             e,
             exc_info=True,
-        )
\ No newline at end of file
+        )
+    return False
+
+
+def delete_rows_by_key(
+    table_name: str, key_column: str, keys, engine, schema_name: str = None
+):
+    """Delete rows of sql table whose key_column value is in keys (in batches of
+    DELETE_BATCH_SIZE, all in one transaction).
+    engine: SQLAlchemy engine or connection (see load_dataframe_to_db).
+    Returns True if rows were deleted (or there was nothing to delete), False on error.
+    """
+    keys = list(keys)
+    if not keys:
+        return True
+    full_table_name_for_log = f"{schema_name + '.' if schema_name else ''}{table_name}"
+    try:
+        preparer = engine.dialect.identifier_preparer
+        target = preparer.quote(table_name)
+        if schema_name:
+            target = f"{preparer.quote_schema(schema_name)}.{target}"
+        statement = text(
+            f"DELETE FROM {target} WHERE {preparer.quote(key_column)} IN :keys"
+        ).bindparams(bindparam("keys", expanding=True))
+        deleted_rows = 0
+        with transaction(engine) as connection:
+            for start in range(0, len(keys), DELETE_BATCH_SIZE):
+                result = connection.execute(
+                    statement, {"keys": keys[start : start + DELETE_BATCH_SIZE]}
+                )
+                deleted_rows += result.rowcount
+        logger.info(
+            "Rows deleted from table '%s'. Keys: %d, deleted rows: %d",
+            full_table_name_for_log,
+            len(keys),
+            deleted_rows,
+        )
+        return True
+    except Exception as e:
+        logger.error(
+            "Error when deleting rows from the table '%s': %s",
+            full_table_name_for_log,
+            e,
+            exc_info=True,
+        )
+    return False
+
+
+def delete_all_rows(table_name: str, engine, schema_name: str = None):
+    """Delete all rows of sql table (e.g. partially loaded table of failed run).
+    engine: SQLAlchemy engine or connection (see load_dataframe_to_db).
+    Returns True if rows were deleted, False on error.
+    """
+    full_table_name_for_log = f"{schema_name + '.' if schema_name else ''}{table_name}"
+    try:
+        preparer = engine.dialect.identifier_preparer
+        target = preparer.quote(table_name)
+        if schema_name:
+            target = f"{preparer.quote_schema(schema_name)}.{target}"
+        with transaction(engine) as connection:
+            deleted_rows = connection.execute(text(f"DELETE FROM {target}")).rowcount
+        logger.info(
+            "All rows deleted from table '%s'. Deleted rows: %d",
+            full_table_name_for_log,
+            deleted_rows,
+        )
+        return True
+    except Exception as e:
+        logger.error(
+            "Error when deleting rows from the table '%s': %s",
+            full_table_name_for_log,
+            e,
+            exc_info=True,
+        )
+    return False
@@ -0,0 +1,226 @@
+"""Module coordinate loading of several tables respecting foreign keys"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from sqlalchemy.engine import Connection
+
+import config
+from src.connection_manager import connect
+from src.load import delete_rows_by_key, load_dataframe_to_db
+
+logger = logging.getLogger(__name__)
+
+# Tables referenced by foreign keys of table (loaded before it)
+TABLE_DEPENDENCIES = {
+    "users": [],
+    "products": [],
+    "product_reviews": ["products"],
+    "carts": ["users"],
+    "cart_items": ["carts", "products"],
+}
+
+
+def _ordered_tables(dataframes: dict) -> list:
+    """Table names of dataframes, referenced tables first."""
+    order = list(TABLE_DEPENDENCIES)
+    return sorted(
+        dataframes,
+        key=lambda table_name: (
+            order.index(table_name) if table_name in order else len(order)
+        ),
+    )
+
+
+def _load_atomic(dataframes: dict, engine, schema_name, if_exists) -> bool:
+    """Load all tables in FK order in one transaction, nothing is kept on error.
+
+    Connection with open transaction (e.g. atomic load of all entities by
+    PipelineTasks.run) is used as it is, the caller commits the transaction or
+    rolls it back.
+    """
+    with connect(engine) as connection:
+        joined = connection.in_transaction()
+        transaction = None if joined else connection.begin()
+        for table_name in _ordered_tables(dataframes):
+            if not load_dataframe_to_db(
+                df=dataframes[table_name],
+                table_name=table_name,
+                engine=connection,
+                schema_name=schema_name,
+                if_exists=if_exists,
+            ):
+                if transaction is not None:
+                    transaction.rollback()
+                logger.error(
+                    "Loading of table '%s' failed, whole load batch %s %s.",
+                    table_name,
+                    list(dataframes),
+                    "is left to be rolled back" if joined else "rolled back",
+                )
+                return False
+        if transaction is None:
+            logger.info("Load batch %s written in open transaction.", list(dataframes))
+            return True
+        transaction.commit()
+    logger.info("Load batch %s committed atomically.", list(dataframes))
+    return True
+
+
+def _load_sequential(dataframes: dict, connectable, schema_name, if_exists) -> bool:
+    """Load tables one by one in FK order over one connection (each table in its
+    own transaction), tables referencing a failed table are not loaded."""
+    failed = set()
+    for table_name in _ordered_tables(dataframes):
+        failed_dependencies = set(TABLE_DEPENDENCIES.get(table_name, [])) & failed
+        if failed_dependencies:
+            logger.error(
+                "Skipping load of table '%s', referenced tables %s failed.",
+                table_name,
+                sorted(failed_dependencies),
+            )
+            failed.add(table_name)
+        elif not load_dataframe_to_db(
+            df=dataframes[table_name],
+            table_name=table_name,
+            engine=connectable,
+            schema_name=schema_name,
+            if_exists=if_exists,
+        ):
+            failed.add(table_name)
+    return not failed
+
+
+def _load_parallel(
+    dataframes: dict, engine, schema_name, if_exists, max_workers
+) -> bool:
+    """Load tables on thread pool, table starts once tables it references are loaded.
+
+    Every table is loaded in its own transaction, tables referencing a failed
+    table are not loaded.
+    """
+    # Dependencies missing in this batch are already loaded (or not loaded at all)
+    pending = {
+        table_name: {
+            dependency
+            for dependency in TABLE_DEPENDENCIES.get(table_name, [])
+            if dependency in dataframes
+        }
+        for table_name in _ordered_tables(dataframes)
+    }
+    failed = set()
+    running = {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="load"
+    ) as executor:
+        while pending or running:
+            for table_name, dependencies in list(pending.items()):
+                if dependencies & failed:
+                    logger.error(
+                        "Skipping load of table '%s', referenced tables %s failed.",
+                        table_name,
+                        sorted(dependencies & failed),
+                    )
+                    failed.add(table_name)
+                    del pending[table_name]
+                elif not dependencies:
+                    running[
+                        executor.submit(
+                            load_dataframe_to_db,
+                            df=dataframes[table_name],
+                            table_name=table_name,
+                            engine=engine,
+                            schema_name=schema_name,
+                            if_exists=if_exists,
+                        )
+                    ] = table_name
+                    del pending[table_name]
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                table_name = running.pop(future)
+                if not future.result():
+                    failed.add(table_name)
+                    continue
+                for dependencies in pending.values():
+                    dependencies.discard(table_name)
+    return not failed
+
+
+def load_table_batch(
+    dataframes: dict,
+    engine,
+    schema_name: str = None,
+    if_exists: str = "append",
+    atomic: bool = None,
+    max_workers: int = None,
+) -> bool:
+    """Load DataFrames of several tables respecting foreign keys order.
+
+    Args:
+        dataframes: Table name -> DataFrame.
+        engine: SQLAlchemy engine or connection (tables are loaded one by one
+            over it, e.g. shared connection of ConnectionManager).
+        schema_name: Target schema (None for SQLite).
+        if_exists: Load mode passed to load_dataframe_to_db.
+        atomic: Load all tables in one transaction (default config.LOAD_ATOMIC).
+        max_workers: Tables loaded in parallel (default config.LOAD_MAX_WORKERS),
+            not used in atomic mode.
+
+    Returns:
+    bool: True if all tables were loaded successfully.
+    """
+    if atomic is None:
+        atomic = config.LOAD_ATOMIC
+    if max_workers is None:
+        max_workers = config.LOAD_MAX_WORKERS
+    if not dataframes:
+        return True
+    if atomic:
+        try:
+            return _load_atomic(dataframes, engine, schema_name, if_exists)
+        except Exception as e:
+            logger.error("Atomic load of tables failed: %s", e, exc_info=True)
+            return False
+    if engine.dialect.name == "sqlite":
+        # SQLite allows only one writer at a time
+        max_workers = 1
+    if max_workers <= 1 or isinstance(engine, Connection):
+        # Connection cannot be shared by load threads
+        return _load_sequential(dataframes, engine, schema_name, if_exists)
+    return _load_parallel(dataframes, engine, schema_name, if_exists, max_workers)
+
+
+def delete_table_batch(deleted_keys: dict, engine, schema_name: str = None) -> bool:
+    """Delete rows of several tables by key, referencing tables first.
+
+    Args:
+        deleted_keys: Table name -> (key column, list of keys).
+        engine: SQLAlchemy engine or connection.
+        schema_name: Target schema (None for SQLite).
+
+    Returns:
+    bool: True if rows of all tables were deleted successfully (rows of tables
+    referenced by a failed table are not deleted).
+    """
+    failed = set()
+    for table_name in reversed(_ordered_tables(deleted_keys)):
+        key_column, keys = deleted_keys[table_name]
+        failed_referencing = {
+            referencing
+            for referencing in failed
+            if table_name in TABLE_DEPENDENCIES.get(referencing, [])
+        }
+        if failed_referencing:
+            logger.error(
+                "Skipping delete from table '%s', referencing tables %s failed.",
+                table_name,
+                sorted(failed_referencing),
+            )
+            failed.add(table_name)
+        elif not delete_rows_by_key(
+            table_name, key_column, keys, engine, schema_name=schema_name
+        ):
+            failed.add(table_name)
+    return not failed
@@ -0,0 +1,264 @@
+"""Module provide per-stage metrics of pipeline runs, JSON run report and Prometheus textfile"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Counters of stages (stage.add), bytes are counted only where they are known
+STAGE_COUNTERS = ("rows", "bytes_read", "bytes_written", "http_requests", "retries")
+
+# Prometheus gauges of stages: metric name -> (report field, help text)
+PROMETHEUS_STAGE_METRICS = {
+    "etl_stage_duration_seconds": ("wall_s", "Wall time of pipeline stage."),
+    "etl_stage_cpu_seconds": ("cpu_s", "CPU time of thread running pipeline stage."),
+    "etl_stage_rows": ("rows", "Rows processed by pipeline stage."),
+    "etl_stage_rows_per_second": ("rows_per_s", "Rows per second of pipeline stage."),
+    "etl_stage_bytes_read": ("bytes_read", "Bytes read by pipeline stage."),
+    "etl_stage_bytes_written": ("bytes_written", "Bytes written by pipeline stage."),
+    "etl_stage_peak_rss_bytes": (
+        "peak_rss_bytes",
+        "Peak resident memory of process during pipeline stage.",
+    ),
+    "etl_stage_retries": ("retries", "Retried tasks and HTTP requests of stage."),
+    "etl_stage_success": ("success", "1 if pipeline stage succeeded."),
+}
+PROMETHEUS_RUN_METRICS = {
+    "etl_run_duration_seconds": ("wall_s", "Wall time of pipeline run."),
+    "etl_run_cpu_seconds": ("cpu_s", "CPU time of pipeline process."),
+    "etl_run_peak_rss_bytes": ("peak_rss_bytes", "Peak resident memory of process."),
+    "etl_run_success": ("success", "1 if pipeline run succeeded."),
+    "etl_run_finished_timestamp_seconds": (
+        "finished_timestamp",
+        "Unix time when pipeline run finished.",
+    ),
+}
+
+
+def current_rss() -> int | None:
+    """Resident memory of process in bytes (None if /proc is not available)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss() -> int | None:
+    """Peak resident memory of process since its start in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageMetrics:
+    """Metrics of one stage (e.g. extract:users), summed over its attempts."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.attempts = 0
+        self.succeeded = False
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.peak_rss_bytes = None
+        self.counters = {}
+
+    def add(self, **counts):
+        """Add counters (see STAGE_COUNTERS), None values are ignored."""
+        for counter, value in counts.items():
+            if value is not None:
+                self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def observe_rss(self, rss: int | None):
+        if rss is not None and (
+            self.peak_rss_bytes is None or rss > self.peak_rss_bytes
+        ):
+            self.peak_rss_bytes = rss
+
+    def as_dict(self) -> dict:
+        stage, _, entity = self.name.partition(":")
+        rows = self.counters.get("rows")
+        return {
+            "stage": stage,
+            "entity": entity or None,
+            "attempts": self.attempts,
+            "succeeded": self.succeeded,
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "rows_per_s": (
+                round(rows / self.wall_s, 3)
+                if rows is not None and self.wall_s
+                else None
+            ),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            **self.counters,
+            # Repeated attempts of task count as retries too
+            "retries": self.counters.get("retries", 0) + max(0, self.attempts - 1),
+        }
+
+
+class RunMetrics:
+    """Collect metrics of pipeline stages of one run.
+
+    Every stage runs in stage() block, its wall time and CPU time of running
+    thread are measured, rows and bytes are added by the block. Resident
+    memory is sampled on background thread every sample_interval seconds,
+    every stage gets peak sampled while it was running (process-wide, stages
+    running at the same time share it).
+
+    With profiler (StageProfiler), selected stages are also profiled.
+    """
+
+    def __init__(self, sample_interval: float = 0.1, profiler=None):
+        self.sample_interval = sample_interval
+        self.profiler = profiler
+        self.stages = {}
+        self.info = {}
+        self._active = {}  # stage name -> number of running attempts
+        self._lock = threading.Lock()
+        self.started = datetime.now(timezone.utc)
+        self.finished = None
+        self._started_perf = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self._stop = threading.Event()
+        self._sampler = None
+        if current_rss() is not None and sample_interval > 0:
+            self._sampler = threading.Thread(
+                target=self._sample, name="metrics-rss", daemon=True
+            )
+            self._sampler.start()
+
+    def _observe_active(self, rss):
+        with self._lock:
+            for name in self._active:
+                self.stages[name].observe_rss(rss)
+
+    def _sample(self):
+        while not self._stop.wait(self.sample_interval):
+            self._observe_active(current_rss())
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure one attempt of stage, yield its StageMetrics.
+
+        Stage fails if the block raises (exception is propagated).
+        """
+        with self._lock:
+            metrics = self.stages.setdefault(name, StageMetrics(name))
+            metrics.attempts += 1
+            self._active[name] = self._active.get(name, 0) + 1
+        metrics.observe_rss(current_rss())
+        profile = (
+            self.profiler.profile(name) if self.profiler is not None else nullcontext()
+        )
+        start, start_cpu = time.perf_counter(), time.thread_time()
+        succeeded = False
+        try:
+            with profile:
+                yield metrics
+            succeeded = True
+        finally:
+            wall_s = time.perf_counter() - start
+            cpu_s = time.thread_time() - start_cpu
+            rss = current_rss()
+            with self._lock:
+                metrics.wall_s += wall_s
+                metrics.cpu_s += cpu_s
+                metrics.succeeded = succeeded
+                metrics.observe_rss(rss if rss is not None else peak_rss())
+                self._active[name] -= 1
+                if not self._active[name]:
+                    del self._active[name]
+
+    def finish(self, succeeded: bool, **info):
+        """Stop sampling and record result of run and its additional info."""
+        if self.profiler is not None:
+            self.profiler.close()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self.finished = datetime.now(timezone.utc)
+        self.info.update(info)
+        self.info["succeeded"] = succeeded
+        self.info["wall_s"] = round(time.perf_counter() - self._started_perf, 6)
+        self.info["cpu_s"] = round(time.process_time() - self._started_cpu, 6)
+
+    def report(self) -> dict:
+        """Return run report: run info and metrics of every stage."""
+        with self._lock:
+            stages = {name: stage.as_dict() for name, stage in self.stages.items()}
+        return {
+            "started": self.started.isoformat(),
+            "finished": self.finished.isoformat() if self.finished else None,
+            **self.info,
+            "peak_rss_bytes": peak_rss(),
+            "stages": stages,
+        }
+
+    def write_report(self, path: str) -> dict:
+        """Write run report as JSON file (through temporary file)."""
+        report = self.report()
+        if _write_atomic(path, json.dumps(report, indent=4, default=str)):
+            logger.info("Pipeline run report written to %s.", path)
+        return report
+
+    def write_prometheus(self, path: str):
+        """Write gauges of run and stages in Prometheus text format (e.g. for
+        textfile collector of node_exporter)."""
+        report = self.report()
+        lines = []
+        run = dict(
+            report,
+            success=int(bool(report.get("succeeded"))),
+            finished_timestamp=self.finished.timestamp() if self.finished else None,
+        )
+        for metric, (field, help_text) in PROMETHEUS_RUN_METRICS.items():
+            if run.get(field) is not None:
+                lines += [
+                    f"# HELP {metric} {help_text}",
+                    f"# TYPE {metric} gauge",
+                    f"{metric} {run[field]}",
+                ]
+        for metric, (field, help_text) in PROMETHEUS_STAGE_METRICS.items():
+            samples = []
+            for stage in report["stages"].values():
+                value = (
+                    int(stage["succeeded"]) if field == "success" else stage.get(field)
+                )
+                if value is not None:
+                    labels = (
+                        f'stage="{stage["stage"]}",entity="{stage["entity"] or ""}"'
+                    )
+                    samples.append(f"{metric}{{{labels}}} {value}")
+            if samples:
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+                lines += samples
+        if _write_atomic(path, "\n".join(lines) + "\n"):
+            logger.info("Prometheus metrics written to %s.", path)
+
+
+def _write_atomic(path: str, text: str) -> bool:
+    """Write file through temporary file, so readers never see partial file."""
+    tmp_path = f"{path}.part"
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        return True
+    except IOError as e:
+        logger.error("Metrics could not be written to %s: %s", path, e)
+        return False
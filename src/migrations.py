@@ -0,0 +1,161 @@
+"""Module provide schema migration manager applying DDL scripts only when changed"""
+
+import glob
+import hashlib
+import logging
+import os
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, delete, select
+
+from src.connection_manager import transaction
+from src.load import apply_ddl_script, tables_exist
+
+logger = logging.getLogger(__name__)
+
+# Version table (in default schema of database) with checksums of applied scripts
+SCHEMA_VERSION_TABLE = "schema_migrations"
+# Additive migrations: sql/migrations/<db_type>/NNN_description.sql
+MIGRATIONS_DIR_NAME = "migrations"
+
+_metadata = MetaData()
+schema_migrations = Table(
+    SCHEMA_VERSION_TABLE,
+    _metadata,
+    Column("script_name", String(255), primary_key=True),
+    Column("checksum", String(64), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 hex digest of file content."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class MigrationManager:
+    """Apply base DDL script and additive migrations of one database type.
+
+    Base DDL script (sql/schema_<db_type>_ddl.sql) drops and recreates tables,
+    so it is applied only when its checksum differs from the recorded one (or
+    required tables are missing). Migrations from sql/migrations/<db_type>/ are
+    applied once each, in file name order, after the base script.
+
+    engine can be an engine or a connection (e.g. shared connection of
+    ConnectionManager).
+    """
+
+    def __init__(self, engine, sql_dir: str, db_type: str):
+        self.engine = engine
+        self.sql_dir = sql_dir
+        self.migrations_dir = os.path.join(sql_dir, MIGRATIONS_DIR_NAME, db_type)
+
+    def _applied(self) -> dict:
+        """Return script name -> checksum of applied scripts."""
+        with transaction(self.engine) as connection:
+            _metadata.create_all(
+                connection, tables=[schema_migrations], checkfirst=True
+            )
+            rows = connection.execute(
+                select(schema_migrations.c.script_name, schema_migrations.c.checksum)
+            )
+            return {script_name: checksum for script_name, checksum in rows}
+
+    def _record(self, script_name: str, checksum: str, reset: bool = False):
+        """Record applied script (reset=True forgets all previous records)."""
+        with transaction(self.engine) as connection:
+            if reset:
+                connection.execute(delete(schema_migrations))
+            else:
+                connection.execute(
+                    delete(schema_migrations).where(
+                        schema_migrations.c.script_name == script_name
+                    )
+                )
+            connection.execute(
+                schema_migrations.insert().values(
+                    script_name=script_name,
+                    checksum=checksum,
+                    applied_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                )
+            )
+
+    def pending_migrations(self, applied: dict) -> list:
+        """Paths of migration scripts not applied yet (sorted by file name)."""
+        pending = []
+        for path in sorted(glob.glob(os.path.join(self.migrations_dir, "*.sql"))):
+            script_name = f"{MIGRATIONS_DIR_NAME}/{os.path.basename(path)}"
+            if script_name not in applied:
+                pending.append(path)
+            elif applied[script_name] != file_checksum(path):
+                logger.warning(
+                    "Applied migration '%s' was modified, it is not applied again."
+                    " Add a new migration instead.",
+                    script_name,
+                )
+        return pending
+
+    def migrate(
+        self,
+        ddl_file_name: str,
+        required_tables=None,
+        schema_name: str = None,
+        force: bool = False,
+    ) -> bool:
+        """Bring database schema up to date.
+
+        Args:
+            ddl_file_name: Base DDL script in sql_dir.
+            required_tables: Tables created by base script, it is applied again
+                if any of them is missing.
+            schema_name: Schema of required tables.
+            force: Apply base script (and all migrations) even if unchanged,
+                e.g. DDL_MODE=always recreating tables on every run.
+
+        Returns:
+        bool: True if base DDL script was applied (tables were recreated).
+
+        Raises:
+        Exception: If any script could not be applied (see apply_ddl_script).
+        """
+        ddl_script_path = os.path.join(self.sql_dir, ddl_file_name)
+        checksum = file_checksum(ddl_script_path)
+        applied = self._applied()
+
+        schema_applied = False
+        if force:
+            logger.info("Recreating tables with DDL script '%s'.", ddl_file_name)
+            schema_applied = True
+        elif applied.get(ddl_file_name) != checksum:
+            logger.info(
+                "DDL script '%s' is new or changed, applying it.", ddl_file_name
+            )
+            schema_applied = True
+        elif required_tables and not tables_exist(
+            self.engine, required_tables, schema_name
+        ):
+            logger.warning(
+                "DDL script '%s' is unchanged but tables are missing, applying it.",
+                ddl_file_name,
+            )
+            schema_applied = True
+        else:
+            logger.info(
+                "DDL script '%s' is unchanged (checksum %s), skipping.",
+                ddl_file_name,
+                checksum[:12],
+            )
+
+        if schema_applied:
+            apply_ddl_script(self.engine, ddl_script_path)
+            # Tables were recreated, all migrations have to be applied again
+            self._record(ddl_file_name, checksum, reset=True)
+            applied = {ddl_file_name: checksum}
+
+        for path in self.pending_migrations(applied):
+            script_name = f"{MIGRATIONS_DIR_NAME}/{os.path.basename(path)}"
+            logger.info("Applying migration '%s'.", script_name)
+            apply_ddl_script(self.engine, path)
+            self._record(script_name, file_checksum(path))
+        return schema_applied
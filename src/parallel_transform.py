@@ -0,0 +1,221 @@
+"""Module provide parallel transformation of entities on a process pool"""
+
+import importlib
+import logging
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from src.extract import read_raw_dataframe
+from src.transform import (
+    ENTITY_FIELDS,
+    convert_list_to_dataframe,
+    transform_entity_tables,
+)
+
+logger = logging.getLogger(__name__)
+
+# Extensions of table files written by write_tables (buffer formats)
+TABLE_FILE_EXTENSIONS = (".arrow", ".pickle")
+
+
+def frame_to_buffer(df: pd.DataFrame) -> tuple[str, bytes]:
+    """Serialize DataFrame for transfer between processes.
+
+    Arrow IPC stream is used when pyarrow is installed (columnar buffers instead
+    of pickled python objects), pickle otherwise or if Arrow cannot convert it.
+
+    Returns:
+    tuple: Buffer format ('arrow' or 'pickle') and serialized bytes.
+    """
+    try:
+        pa = importlib.import_module("pyarrow")
+    except ImportError:
+        pa = None
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return "arrow", sink.getvalue().to_pybytes()
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.debug("DataFrame could not be converted to Arrow, pickling: %s", e)
+    return "pickle", pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def frame_from_buffer(buffer: tuple[str, bytes]) -> pd.DataFrame:
+    """Deserialize DataFrame created by frame_to_buffer."""
+    buffer_format, data = buffer
+    if buffer_format == "arrow":
+        pa = importlib.import_module("pyarrow")
+        table = pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+        return table.to_pandas()
+    return pickle.loads(data)
+
+
+def write_tables(tables: dict, directory: str) -> bool:
+    """Write cleaned DataFrames to directory as <table>.<buffer format> files
+    (see frame_to_buffer), tables written there before are removed.
+
+    Returns:
+    bool: True if all tables were written.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+        for file_name in os.listdir(directory):
+            if file_name.endswith(TABLE_FILE_EXTENSIONS):
+                os.remove(os.path.join(directory, file_name))
+        for table_name, df in tables.items():
+            buffer_format, data = frame_to_buffer(df)
+            path = os.path.join(directory, f"{table_name}.{buffer_format}")
+            with open(f"{path}.part", "wb") as f:
+                f.write(data)
+            os.replace(f"{path}.part", path)
+            logger.info(
+                "Table '%s' (%d rows) written to %s.", table_name, len(df), path
+            )
+        return True
+    except IOError as e:
+        logger.error("Cleaned tables could not be written to %s: %s", directory, e)
+        return False
+
+
+def read_tables(directory: str) -> dict:
+    """Read cleaned DataFrames written by write_tables.
+
+    Returns:
+    dict: Table name -> DataFrame (empty if directory holds no tables).
+    """
+    tables = {}
+    if not os.path.isdir(directory):
+        logger.error("Folder of cleaned tables not found: %s", directory)
+        return tables
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(TABLE_FILE_EXTENSIONS):
+            continue
+        table_name, buffer_format = file_name.rsplit(".", 1)
+        try:
+            with open(os.path.join(directory, file_name), "rb") as f:
+                tables[table_name] = frame_from_buffer((buffer_format, f.read()))
+        except (IOError, ImportError) as e:
+            logger.error("Cleaned table %s could not be read: %s", file_name, e)
+    return tables
+
+
+def _transform_task(
+    entity_name: str, records: list | None, file_path: str | None, with_reviews: bool
+) -> dict:
+    """Worker: transform records (or raw file) of entity to serialized tables.
+
+    Raises:
+    RuntimeError: If transformation of any table failed.
+    """
+    if records is not None:
+        df_raw = convert_list_to_dataframe(records, entity_name)
+    else:
+        df_raw = read_raw_dataframe(
+            file_path, entity_name, fields=ENTITY_FIELDS.get(entity_name)
+        )
+    if df_raw is None or df_raw.empty:
+        return {}
+
+    tables = transform_entity_tables(entity_name, df_raw, with_reviews) or {}
+    failed = [table for table, df in tables.items() if df is None]
+    if failed:
+        raise RuntimeError(
+            f"Transformation of '{entity_name}' failed for tables: {failed}"
+        )
+    return {table: frame_to_buffer(df) for table, df in tables.items()}
+
+
+class TransformPool:
+    """Process pool running entity transformations on all CPU cores.
+
+    Workers read raw files themselves (only paths are sent to them) and send
+    cleaned tables back as Arrow buffers (see frame_to_buffer).
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def submit_entity(
+        self,
+        entity_name: str,
+        file_path: str | None,
+        records: list | None = None,
+        with_reviews: bool = False,
+    ):
+        """Submit transformation of whole entity, records take precedence over file.
+
+        Returns:
+        Future: Pass it to result() to get dict of cleaned DataFrames.
+        """
+        return self._executor.submit(
+            _transform_task, entity_name, records, file_path, with_reviews
+        )
+
+    @staticmethod
+    def result(future) -> dict:
+        """Wait for submitted transformation, return table name -> DataFrame."""
+        return {
+            table: frame_from_buffer(buffer)
+            for table, buffer in future.result().items()
+        }
+
+    def iter_chunks(
+        self,
+        entity_name: str,
+        batches,
+        with_reviews: bool = False,
+        max_in_flight: int | None = None,
+    ):
+        """Parallel version of iter_transform_chunks.
+
+        Batches are transformed on workers, at most max_in_flight at once
+        (default twice the number of workers), chunks are yielded in order.
+
+        Yields:
+        dict: Table name -> cleaned DataFrame chunk.
+
+        Raises:
+        RuntimeError: If transformation of a chunk failed.
+        """
+        if max_in_flight is None:
+            max_in_flight = 2 * self.max_workers
+        seen_product_ids = set()
+        pending = deque()
+        for batch in batches:
+            if entity_name == "products":
+                # Drop duplicates ID across chunks before sending to workers
+                batch = [
+                    record
+                    for record in batch
+                    if record.get("id") not in seen_product_ids
+                ]
+                seen_product_ids.update(record.get("id") for record in batch)
+            if not batch:
+                continue
+            pending.append(self.submit_entity(entity_name, None, batch, with_reviews))
+            if len(pending) >= max_in_flight:
+                chunk = self.result(pending.popleft())
+                if chunk:
+                    yield chunk
+        while pending:
+            chunk = self.result(pending.popleft())
+            if chunk:
+                yield chunk
+
+    def shutdown(self):
+        """Stop workers (pending transformations are cancelled)."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
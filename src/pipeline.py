@@ -0,0 +1,876 @@
+"""Orchestration module of extract, transform and load stages of ETL pipeline
+(run by commands of main.py)"""
+
+# Import modules and functions
+import logging
+import os
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timezone
+
+from sqlalchemy.engine import Connection
+
+import config
+from src.extract import (
+    BackgroundRawWriter,
+    extract_endpoint,
+    iter_raw_batches,
+)
+from src.extract_cache import ExtractCache
+from src.http_client import get_http_client
+from src.transform import iter_transform_chunks, transform_entity
+from src.parallel_transform import TransformPool, read_tables
+from src.load import create_db_engine, delete_all_rows
+from src.connection_manager import ConnectionManager
+from src.indexes import deferred_indexes, ensure_secondary_indexes
+from src.load_coordinator import (
+    TABLE_DEPENDENCIES,
+    delete_table_batch,
+    load_table_batch,
+)
+from src.cdc import CDC_KEYS, ChangeCapture
+from src.migrations import MigrationManager, file_checksum
+from src.checkpoints import CheckpointStore
+from src.scheduler import TaskScheduler
+from src.metrics import RunMetrics
+from src.profiling import StageProfiler
+
+logger = logging.getLogger(__name__)
+
+
+# Tables in order respecting foreign keys
+LOAD_ORDER = ["users", "products", "product_reviews", "carts", "cart_items"]
+# Tables created by transformation of every entity
+ENTITY_TABLES = {
+    "users": ["users"],
+    "products": ["products", "product_reviews"],
+    "carts": ["carts", "cart_items"],
+}
+# DDL scripts (in SQL_DIR) of database types
+DDL_FILES = {
+    "mssql": "schema_mssql_ddl.sql",
+    "postgresql": "schema_postgresql_ddl.sql",
+    "sqlite": "schema_sqlite_ddl.sql",
+}
+
+
+def referenced_entities(name) -> list:
+    """Entities whose tables are referenced by foreign keys of tables of entity."""
+    referenced_tables = {
+        dependency
+        for table_name in ENTITY_TABLES.get(name, [])
+        for dependency in TABLE_DEPENDENCIES.get(table_name, [])
+    }
+    return [
+        entity
+        for entity, tables in ENTITY_TABLES.items()
+        if entity != name and referenced_tables.intersection(tables)
+    ]
+
+
+def load_tables(
+    cleaned_dataframes: dict, engine, schema_to_load, warn_missing=True, if_exists=None
+) -> bool:
+    """Load cleaned DataFrames to database respecting FK order (LOAD_ORDER).
+
+    Independent tables are loaded in parallel or all tables in one transaction
+    (see load_table_batch). Missing tables are logged with warning unless
+    warn_missing is False (chunks of one entity hold only its tables).
+    if_exists: Load mode (default config.LOAD_MODE).
+
+    Returns:
+    bool: True if all tables were loaded successfully.
+    """
+    if not engine:  # Check if engine was created
+        logger.error("Database engine not available. Skipping load phase.")
+        return False
+
+    tables_to_load = {}
+    for simple_table_name in LOAD_ORDER:
+        if simple_table_name in cleaned_dataframes:
+            tables_to_load[simple_table_name] = cleaned_dataframes[simple_table_name]
+            logger.info(
+                "Loading DataFrame '%s' into SQL table '%s%s'...",
+                simple_table_name,
+                schema_to_load + "." if schema_to_load else "",
+                simple_table_name,
+            )
+        elif simple_table_name == "product_reviews" and not config.LOAD_PRODUCT_REVIEWS:
+            continue  # Optional table, not enabled
+        elif warn_missing:
+            logger.warning(
+                "DataFrame for key '%s' not found in cleaned_dataframes. Skipping.",
+                simple_table_name,
+            )
+    return load_table_batch(
+        tables_to_load,
+        engine,
+        schema_name=schema_to_load,
+        if_exists=if_exists or config.LOAD_MODE,
+    )
+
+
+def schema_name() -> str | None:
+    """Target schema of tables (None for SQLite)."""
+    return config.TARGET_DB_SCHEMA if config.DB_TYPE not in ["sqlite"] else None
+
+
+def apply_schema(connection, ddl_file_name, schema_to_load) -> bool:
+    """Apply DDL script and migrations (config.DDL_MODE), create secondary indexes.
+
+    Returns:
+    bool: True if tables were (re)created.
+    """
+    # migrate: DDL is applied only when changed, migrations only once,
+    # always: tables are recreated by DDL and all migrations on every run
+    schema_applied = MigrationManager(
+        connection, config.SQL_DIR, config.DB_TYPE
+    ).migrate(
+        ddl_file_name,
+        LOAD_ORDER,
+        schema_to_load,
+        force=config.DDL_MODE != "migrate",
+    )
+    logger.info("Database schema from '%s' is up to date.", ddl_file_name)
+    if config.CREATE_SECONDARY_INDEXES:
+        ensure_secondary_indexes(connection, schema_to_load)
+    return schema_applied
+
+
+def capture_changes(cleaned_dataframes: dict, cdc) -> dict:
+    """CDC stage: keep only new and changed rows of cleaned DataFrames.
+
+    Returns:
+    dict: Table name -> DataFrame of changed rows (tables without changes are left out).
+    """
+    changed_dataframes = {}
+    for table_name, df_cleaned in cleaned_dataframes.items():
+        df_changed, counts = cdc.diff(table_name, df_cleaned)
+        logger.info("Changes of '%s' since previous run: %s", table_name, counts)
+        if not df_changed.empty:
+            changed_dataframes[table_name] = df_changed
+    return changed_dataframes
+
+
+def delete_removed_rows(cdc, engine, schema_to_load) -> bool:
+    """CDC stage: delete rows whose keys are missing in source since previous run.
+
+    Returns:
+    bool: True if all deletes were successful.
+    """
+    deleted_keys = {}
+    for table_name in LOAD_ORDER:
+        keys = cdc.deleted_keys(table_name)
+        if keys:
+            deleted_keys[table_name] = (CDC_KEYS[table_name], keys)
+    if not deleted_keys:
+        return True
+    logger.info(
+        "Deleting rows missing in source: %s",
+        {table_name: len(keys) for table_name, (_, keys) in deleted_keys.items()},
+    )
+    return delete_table_batch(deleted_keys, engine, schema_name=schema_to_load)
+
+
+def transform_and_load_in_chunks(
+    name,
+    file_path,
+    data_list,
+    engine,
+    schema_to_load,
+    chunk_size=None,
+    transform_pool=None,
+    cdc=None,
+    if_exists=None,
+    stats=None,
+) -> bool:
+    """Chunked mode: transform entity batch by batch and load every chunk at once.
+
+    Only one batch of raw records and its cleaned chunks are held in memory
+    (with transform_pool, batches are transformed in parallel on its workers).
+    With cdc only new and changed rows of every chunk are loaded.
+    If stats dict is given, it is filled with rows of transformed and loaded
+    chunks per table ("rows" and "loaded_rows").
+
+    Returns:
+    bool: True if all chunks were transformed and loaded successfully.
+    """
+    if chunk_size is None:
+        chunk_size = config.TRANSFORM_CHUNK_SIZE
+    logger.info(
+        "Chunked transformation of %s from file %s (chunk size %d)",
+        name,
+        file_path,
+        chunk_size,
+    )
+    if data_list is not None:
+        # In-memory handoff, batches are slices of extracted records
+        batches = (
+            data_list[start : start + chunk_size]
+            for start in range(0, len(data_list), chunk_size)
+        )
+    else:
+        batches = iter_raw_batches(file_path, name, chunk_size)
+
+    rows = {}
+    loaded_rows = {}
+    if stats is not None:
+        stats.update(rows=rows, loaded_rows=loaded_rows)
+    try:
+        if transform_pool is not None:
+            chunks = transform_pool.iter_chunks(
+                name, batches, with_reviews=config.LOAD_PRODUCT_REVIEWS
+            )
+        else:
+            chunks = iter_transform_chunks(
+                name, batches, with_reviews=config.LOAD_PRODUCT_REVIEWS
+            )
+        for chunk in chunks:
+            for table_name, df_chunk in chunk.items():
+                rows[table_name] = rows.get(table_name, 0) + len(df_chunk)
+            if cdc is not None:
+                chunk = capture_changes(chunk, cdc)
+            if not load_tables(
+                chunk, engine, schema_to_load, warn_missing=False, if_exists=if_exists
+            ):
+                logger.error("Loading chunk of %s failed. Stopping entity.", name)
+                return False
+            for table_name, df_chunk in chunk.items():
+                loaded_rows[table_name] = loaded_rows.get(table_name, 0) + len(df_chunk)
+    except Exception as e:
+        logger.error(
+            "Unexpected error during chunked transformation for %s: %s",
+            name,
+            e,
+            exc_info=True,
+        )
+        return False
+
+    logger.info(
+        "Chunked transformation and load of %s finished. Rows: %s\n", name, rows
+    )
+    return bool(rows)
+
+
+def write_run_metrics(metrics, succeeded, **info):
+    """Finish run metrics, write JSON run report and Prometheus textfile."""
+    metrics.finish(succeeded, **info)
+    if not config.METRICS_ENABLED:
+        return
+    metrics.write_report(
+        os.path.join(
+            config.METRICS_DIR,
+            f"run_report_{metrics.started.strftime('%Y%m%dT%H%M%SZ')}.json",
+        )
+    )
+    metrics.write_prometheus(config.PROMETHEUS_TEXTFILE)
+
+
+class PipelineTasks:
+    """Extract, transform and load tasks of entities for TaskScheduler.
+
+    Every entity gets tasks extract:<name> -> transform:<name> -> load:<name>
+    (in chunked mode extract:<name> -> load:<name>, transformation runs inside
+    the load), load of an entity waits for loads of entities it references
+    (e.g. carts after users and products). So users can be loaded while carts
+    are still being downloaded.
+
+    With checkpoints (CheckpointStore) completed stages are recorded and stages
+    completed by a resumed run are not repeated.
+
+    Time, rows and bytes of every task are measured by metrics (RunMetrics).
+
+    With LOAD_ATOMIC all load tasks write in one transaction of load_target
+    (shared connection), committed by run only if all tasks succeeded, so a
+    failed load of one entity rolls back loads of all entities.
+    """
+
+    def __init__(
+        self,
+        scheduler,
+        load_target,
+        schema_to_load,
+        schema_applied,
+        extract_cache=None,
+        raw_writer=None,
+        transform_pool=None,
+        cdc=None,
+        load_mode=None,
+        checkpoints=None,
+        resumed=False,
+        metrics=None,
+    ):
+        self.scheduler = scheduler
+        self.load_target = load_target
+        self.schema_to_load = schema_to_load
+        self.schema_applied = schema_applied
+        self.extract_cache = extract_cache
+        self.raw_writer = raw_writer
+        self.transform_pool = transform_pool
+        self.cdc = cdc
+        self.load_mode = load_mode or config.LOAD_MODE
+        self.checkpoints = checkpoints
+        self.metrics = metrics if metrics is not None else RunMetrics(0)
+        # Tables recreated by resumed run hold only its rows, rows of entities
+        # whose load did not complete are deleted before they are loaded again
+        self._clear_unfinished = (
+            resumed and schema_applied and self.load_mode == "append"
+        )
+        # In-memory handoff: records go straight to transformation
+        self.extracted_records = {} if raw_writer is not None else None
+        # Shared connection cannot be used by several load tasks at once
+        self._load_lock = (
+            threading.Lock() if isinstance(load_target, Connection) else nullcontext()
+        )
+        self._load_tasks = []
+        # Atomic load: checkpoints of loads are recorded after commit
+        self.atomic = config.LOAD_ATOMIC and isinstance(load_target, Connection)
+        self._uncommitted_loads = []
+        # Timed out attempt keeps running (see TaskScheduler), tasks writing over
+        # shared connection have no timeout, so the connection is never used by
+        # a forgotten attempt while it is rolled back or closed
+        self._load_timeout = (
+            None if isinstance(load_target, Connection) else config.TASK_TIMEOUT or None
+        )
+        # Endpoints fetched at the same time
+        self._extract_slots = threading.BoundedSemaphore(
+            max(1, config.EXTRACT_MAX_WORKERS)
+        )
+
+    def add_entity(self, name, url, entity_names):
+        """Add tasks of one entity (entity_names are all scheduled entities)."""
+        retries = config.TASK_MAX_RETRIES
+        timeout = config.TASK_TIMEOUT or None
+        # Load is retried only if repeating it cannot duplicate rows, never in
+        # atomic load (failed statement may abort the shared transaction)
+        load_retries = retries if self.load_mode == "upsert" and not self.atomic else 0
+        load_dependencies = [
+            f"load:{entity}"
+            for entity in referenced_entities(name)
+            if entity in entity_names
+        ]
+        self.scheduler.add_task(
+            f"extract:{name}",
+            lambda: self.extract(name, url),
+            retries=retries,
+            timeout=timeout,
+        )
+        if config.TRANSFORM_CHUNK_SIZE > 0:
+            self.scheduler.add_task(
+                f"load:{name}",
+                lambda: self.transform_and_load(name),
+                depends_on=[f"extract:{name}", *load_dependencies],
+                retries=load_retries,
+                timeout=self._load_timeout,
+            )
+        else:
+            self.scheduler.add_task(
+                f"transform:{name}",
+                lambda: self.transform(name),
+                depends_on=[f"extract:{name}"],
+                retries=retries,
+                timeout=timeout,
+            )
+            self.scheduler.add_task(
+                f"load:{name}",
+                lambda: self.load(name),
+                depends_on=[f"transform:{name}", *load_dependencies],
+                retries=load_retries,
+                timeout=self._load_timeout,
+            )
+        self._load_tasks.append(f"load:{name}")
+
+    def add_cdc_deletes(self):
+        """Add task deleting rows missing in source, after all loads succeeded."""
+        self.scheduler.add_task(
+            "cdc:delete",
+            self.delete_removed,
+            depends_on=list(self._load_tasks),
+            timeout=self._load_timeout,
+        )
+
+    def _completed(self, stage) -> dict | None:
+        """Checkpoint entry of stage completed by this (or resumed) run."""
+        if self.checkpoints is None:
+            return None
+        return self.checkpoints.completed(stage)
+
+    def _complete(self, stage, artifacts=None, **values):
+        if self.checkpoints is not None:
+            self.checkpoints.complete(stage, artifacts, **values)
+
+    def _complete_load(self, stage):
+        """Record completed load stage (atomic load: after commit, see run)."""
+        if self.atomic:
+            self._uncommitted_loads.append(stage)
+        else:
+            self._complete(stage)
+
+    def run(self) -> bool:
+        """Run scheduled tasks, in atomic load mode in one transaction of
+        load_target (rolled back if any task failed).
+
+        Returns:
+        bool: True if all tasks succeeded (and atomic load was committed).
+        """
+        if not self.atomic:
+            return self.scheduler.run()
+        transaction = self.load_target.begin()
+        try:
+            succeeded = self.scheduler.run()
+        except Exception:
+            transaction.rollback()
+            raise
+        if not succeeded:
+            transaction.rollback()
+            logger.error("Pipeline tasks failed, loads of all entities rolled back.")
+            return False
+        transaction.commit()
+        logger.info("Loads of all entities committed atomically.")
+        for stage in self._uncommitted_loads:
+            self._complete(stage)
+        return True
+
+    def _clear_entity_tables(self, name):
+        """Delete rows of entity tables partially loaded by resumed run.
+
+        Raises:
+        RuntimeError: If rows were not deleted.
+        """
+        for table_name in reversed(ENTITY_TABLES.get(name, [])):
+            if not delete_all_rows(table_name, self.load_target, self.schema_to_load):
+                raise RuntimeError(f"Rows of unfinished load of {name} not deleted.")
+
+    def _is_skipped(self, name) -> bool:
+        """Unchanged entities are already loaded, unless tables were recreated."""
+        _, changed = self.scheduler.result(f"extract:{name}")
+        if changed or self.schema_applied:
+            return False
+        logger.info("Skipping transformation and load of %s (unchanged).", name)
+        return True
+
+    def extract(self, name, url) -> tuple:
+        """Task: fetch endpoint of entity to raw file (and memory).
+
+        Returns:
+        tuple: Path to raw file and flag if content changed (see extract_endpoint).
+
+        Raises:
+        RuntimeError: If extraction failed.
+        """
+        stage = f"extract:{name}"
+        entry = self._completed(stage)
+        if entry is not None and os.path.exists(entry["file_path"]):
+            logger.info("Extraction of %s was completed by resumed run.", name)
+            return entry["file_path"], entry["changed"]
+        with self._extract_slots, self.metrics.stage(stage) as stage_metrics:
+            http_before = get_http_client().stats(url)
+            stats = {}
+            file_path, changed = extract_endpoint(
+                name,
+                url,
+                config.DATA_DIR,
+                self.extract_cache,
+                self.extracted_records,
+                self.raw_writer,
+                stats=stats,
+            )
+            http_after = get_http_client().stats(url)
+            stage_metrics.add(
+                rows=stats["records"],
+                bytes_read=http_after["bytes_received"] - http_before["bytes_received"],
+                bytes_written=stats.get("bytes_written"),
+                http_requests=http_after["requests"] - http_before["requests"],
+                retries=http_after["retries"] - http_before["retries"],
+            )
+            if file_path is None:
+                raise RuntimeError(f"Extraction of {name} failed.")
+        # Raw file of in-memory handoff is still being written on background
+        self._complete(
+            stage,
+            {"raw": file_path} if self.raw_writer is None else None,
+            file_path=file_path,
+            changed=changed,
+        )
+        return file_path, changed
+
+    def transform(self, name) -> dict:
+        """Task: transform extracted entity.
+
+        Returns:
+        dict: Table name -> cleaned DataFrame (empty for skipped entity).
+
+        Raises:
+        RuntimeError: If transformation produced no tables.
+        """
+        if self._is_skipped(name) or self._completed(f"load:{name}") is not None:
+            return {}
+        stage = f"transform:{name}"
+        with self.metrics.stage(stage) as stage_metrics:
+            cleaned_dataframes = self._transform(name, stage, stage_metrics)
+            stage_metrics.add(rows=sum(len(df) for df in cleaned_dataframes.values()))
+        return cleaned_dataframes
+
+    def _transform(self, name, stage, stage_metrics) -> dict:
+        """Transform entity or restore its cleaned tables from checkpoint."""
+        if self.checkpoints is not None:
+            cleaned_dataframes = self.checkpoints.load_tables(stage)
+            if cleaned_dataframes is not None:
+                logger.info("Cleaned tables of %s restored from checkpoint.", name)
+                return cleaned_dataframes
+        file_path, _ = self.scheduler.result(f"extract:{name}")
+        data_list = (self.extracted_records or {}).get(name)
+        if data_list is None:
+            stage_metrics.add(bytes_read=os.path.getsize(file_path))
+        if self.transform_pool is not None:
+            logger.info(
+                "Data tranformation of %s from file %s (worker)", name, file_path
+            )
+            cleaned_dataframes = self.transform_pool.result(
+                self.transform_pool.submit_entity(
+                    name, file_path, data_list, config.LOAD_PRODUCT_REVIEWS
+                )
+            )
+            for table_name, df_cleaned in cleaned_dataframes.items():
+                logger.info(
+                    "Transformation of '%s' finished. Shape: %s\n",
+                    table_name,
+                    df_cleaned.shape,
+                )
+        else:
+            cleaned_dataframes = transform_entity(name, file_path, data_list)
+        if not cleaned_dataframes:
+            raise RuntimeError(f"Transformation of {name} produced no tables.")
+        if self.checkpoints is not None:
+            self.checkpoints.save_tables(stage, cleaned_dataframes)
+        # Records are kept until transformation succeeded (for retries)
+        (self.extracted_records or {}).pop(name, None)
+        return cleaned_dataframes
+
+    def load(self, name):
+        """Task: load cleaned tables of entity (only changed rows with CDC).
+
+        Raises:
+        RuntimeError: If any table was not loaded.
+        """
+        cleaned_dataframes = self.scheduler.result(f"transform:{name}")
+        if not cleaned_dataframes or self._completed(f"load:{name}") is not None:
+            return
+        with self._load_lock, self.metrics.stage(f"load:{name}") as stage_metrics:
+            if self._clear_unfinished:
+                self._clear_entity_tables(name)
+            if self.cdc is not None:
+                cleaned_dataframes = capture_changes(cleaned_dataframes, self.cdc)
+            if not load_tables(
+                cleaned_dataframes,
+                self.load_target,
+                self.schema_to_load,
+                warn_missing=False,
+                if_exists=self.load_mode,
+            ):
+                raise RuntimeError(f"Load of {name} failed.")
+            stage_metrics.add(rows=sum(len(df) for df in cleaned_dataframes.values()))
+        self._complete_load(f"load:{name}")
+
+    def transform_and_load(self, name):
+        """Task: chunked transformation and load of entity.
+
+        Raises:
+        RuntimeError: If any chunk was not transformed or loaded.
+        """
+        if self._is_skipped(name) or self._completed(f"load:{name}") is not None:
+            return
+        file_path, _ = self.scheduler.result(f"extract:{name}")
+        data_list = (self.extracted_records or {}).get(name)
+        with self._load_lock, self.metrics.stage(f"load:{name}") as stage_metrics:
+            if self._clear_unfinished:
+                self._clear_entity_tables(name)
+            if data_list is None:
+                stage_metrics.add(bytes_read=os.path.getsize(file_path))
+            stats = {}
+            loaded = transform_and_load_in_chunks(
+                name,
+                file_path,
+                data_list,
+                self.load_target,
+                self.schema_to_load,
+                transform_pool=self.transform_pool,
+                cdc=self.cdc,
+                if_exists=self.load_mode,
+                stats=stats,
+            )
+            stage_metrics.add(rows=sum(stats.get("loaded_rows", {}).values()))
+            if not loaded:
+                raise RuntimeError(f"Chunked transformation and load of {name} failed.")
+        (self.extracted_records or {}).pop(name, None)
+        self._complete_load(f"load:{name}")
+
+    def delete_removed(self):
+        """Task: CDC deletes of rows missing in source.
+
+        Raises:
+        RuntimeError: If rows were not deleted.
+        """
+        with self._load_lock, self.metrics.stage("cdc:delete"):
+            if not delete_removed_rows(self.cdc, self.load_target, self.schema_to_load):
+                raise RuntimeError("Deleting rows missing in source failed.")
+        self._complete_load("cdc:delete")
+
+
+# --- Main Pipeline Function ---
+def run_pipeline(resume=False, profile=None) -> bool:
+    """Run pipeline for extraction tranformation and loading data.
+
+    Args:
+        resume: Continue unfinished previous run from its checkpoint (completed
+            stages are not repeated, see CheckpointStore).
+        profile: Stages profiled by cProfile and tracemalloc (names or prefixes
+            like "transform" or "load:carts", empty list = all stages), None =
+            no profiling. Tasks then run one at a time and transformations
+            in the main process, so profiles of stages are not mixed.
+
+    Returns:
+    bool: True if all stages succeeded.
+    """
+    logger.info("%s S T A R T   E T L   P I P E L I N E %s", "=" * 20, "=" * 20)
+    os.makedirs(config.DATA_DIR, exist_ok=True)
+    profiler = None
+    if profile is not None:
+        profiler = StageProfiler(
+            os.path.join(
+                config.LOG_DIR,
+                f"profile_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}",
+            ),
+            profile,
+            config.PROFILE_TOP,
+        )
+    metrics = RunMetrics(config.METRICS_SAMPLE_INTERVAL, profiler)
+    run_info = {"db_type": config.DB_TYPE, "resume": resume}
+
+    logger.info("=== Database schema setup ===")
+    engine = create_db_engine(config.DB_CONNECTION_STRING)
+
+    if not engine:
+        logger.critical("Failed to create database engine. Halting pipeline.")
+        write_run_metrics(metrics, False, **run_info)
+        return False
+    # DDL, migrations, index maintenance and sequential loads share one connection
+    db = ConnectionManager(engine)
+
+    checkpoints, resumed = None, False
+    if config.CHECKPOINT_ENABLED:
+        checkpoints = CheckpointStore(
+            os.path.join(config.DATA_DIR, config.CHECKPOINT_FILENAME),
+            config.CHECKPOINT_DIR,
+        )
+        resumed = checkpoints.start_run(resume)
+        run_info["run_id"] = checkpoints.run_id
+    elif resume:
+        logger.warning("Checkpoints are disabled (ETL_CHECKPOINTS), nothing to resume.")
+
+    schema_applied = False  # True if tables were (re)created in this run
+    ddl_file_name = DDL_FILES.get(config.DB_TYPE, "")
+    schema_to_load = schema_name()
+    if ddl_file_name:
+        ddl_script_path = os.path.join(config.SQL_DIR, ddl_file_name)
+
+        if not os.path.exists(ddl_script_path):
+            logger.error(
+                "DDL script file not found at: %s. Halting pipeline.", ddl_script_path
+            )
+            db.close()
+            write_run_metrics(metrics, False, **run_info)
+            return False
+
+        ddl_checkpoint = None
+        if resumed:
+            ddl_checkpoint = checkpoints.completed("ddl")
+            if ddl_checkpoint and ddl_checkpoint["checksum"] != file_checksum(
+                ddl_script_path
+            ):
+                ddl_checkpoint = None
+        try:
+            with metrics.stage("ddl"), db.connection() as connection:
+                if ddl_checkpoint is not None:
+                    # Tables hold rows loaded by resumed run, they are kept
+                    schema_applied = ddl_checkpoint["schema_applied"]
+                    logger.info(
+                        "DDL script '%s' was applied by resumed run, skipping.",
+                        ddl_file_name,
+                    )
+                else:
+                    schema_applied = apply_schema(
+                        connection, ddl_file_name, schema_to_load
+                    )
+            if checkpoints is not None and ddl_checkpoint is None:
+                checkpoints.complete(
+                    "ddl",
+                    checksum=file_checksum(ddl_script_path),
+                    schema_applied=schema_applied,
+                )
+        except Exception as e:
+            logger.critical(
+                "Could not apply DDL schema from '%s'. Halting pipeline. Error: %s",
+                ddl_file_name,
+                e,
+                exc_info=True,
+            )
+            db.close()
+            write_run_metrics(metrics, False, **run_info)
+            return False
+    else:
+        logger.warning(
+            "No DDL script defined for DB_TYPE: %s."
+            "Proceeding without DDL application.",
+            config.DB_TYPE,
+        )
+
+    # Change data capture against digest index of previous run
+    cdc = None
+    load_mode = config.LOAD_MODE
+    if config.CDC_ENABLED:
+        cdc = ChangeCapture(os.path.join(config.DATA_DIR, config.CDC_INDEX_FILENAME))
+        if schema_applied:
+            # Tables were recreated, all rows are loaded
+            cdc.reset()
+        else:
+            # Changed rows are merged into kept tables
+            load_mode = "upsert"
+    if ddl_file_name and not schema_applied and load_mode == "append":
+        logger.warning(
+            "Tables were not recreated, rows are appended to existing tables."
+            " Use ETL_LOAD_MODE=upsert with ETL_DDL_MODE=migrate."
+        )
+
+    # === EXTRACT -> TRANSFORM -> LOAD TASKS ===
+    logger.info("- - -  E X T R A C T   T R A N S F O R M   L O A D  - - -\n")
+    extract_cache = None
+    if config.EXTRACT_CACHE_ENABLED:
+        extract_cache = ExtractCache(
+            os.path.join(config.DATA_DIR, config.EXTRACT_CACHE_FILENAME)
+        )
+    # In-memory handoff: raw files are written on background thread
+    raw_writer = None
+    if config.PIPELINE_HANDOFF == "memory":
+        raw_writer = BackgroundRawWriter()
+    # Transformations run on process pool if more workers are configured
+    transform_pool = None
+    if config.TRANSFORM_WORKERS > 1 and profiler is None:
+        transform_pool = TransformPool(config.TRANSFORM_WORKERS)
+
+    scheduler = TaskScheduler(
+        config.PIPELINE_WORKERS if profiler is None else 1, config.TASK_RETRY_DELAY
+    )
+    tasks_succeeded = False
+    try:
+        with (
+            db.load_target() as load_target,
+            deferred_indexes(
+                load_target, LOAD_ORDER, schema_to_load, config.LOAD_DEFER_INDEXES
+            ),
+        ):
+            pipeline_tasks = PipelineTasks(
+                scheduler,
+                load_target,
+                schema_to_load,
+                schema_applied,
+                extract_cache=extract_cache,
+                raw_writer=raw_writer,
+                transform_pool=transform_pool,
+                cdc=cdc,
+                load_mode=load_mode,
+                checkpoints=checkpoints,
+                resumed=resumed,
+                metrics=metrics,
+            )
+            for name, url in config.API_ENDPOINTS.items():
+                pipeline_tasks.add_entity(name, url, config.API_ENDPOINTS)
+            if cdc is not None:
+                pipeline_tasks.add_cdc_deletes()
+            tasks_succeeded = pipeline_tasks.run()
+    except Exception as e:
+        logger.error("Pipeline tasks failed: %s", e, exc_info=True)
+        tasks_succeeded = False
+    finally:
+        if transform_pool is not None:
+            transform_pool.shutdown()
+    logger.info("Pipeline tasks finished: %s", scheduler.states)
+
+    db.close()
+    db.log_pool_status()
+
+    # Waiting for raw files written on background (in-memory handoff)
+    raw_files_written = raw_writer.wait() if raw_writer is not None else True
+
+    if checkpoints is not None:
+        checkpoints.finish_run(tasks_succeeded and raw_files_written)
+
+    # Digest index is saved only after successful load, so changes are loaded again
+    if cdc is not None and tasks_succeeded:
+        cdc.save()
+
+    # Cache is saved only after successful load, so failed entities are reloaded
+    if extract_cache is not None and raw_files_written:
+        if tasks_succeeded:
+            extract_cache.save()
+        else:
+            logger.warning("Load was not successful, extraction cache is not saved.")
+
+    succeeded = tasks_succeeded and raw_files_written
+    write_run_metrics(
+        metrics,
+        succeeded,
+        **run_info,
+        load_mode=load_mode,
+        tasks=scheduler.states,
+        db_pool=db.pool_status(),
+    )
+    logger.info("%s E N D   E T L   P I P E L I N E %s", "=" * 20, "=" * 20)
+    return succeeded
+
+
+def load_cleaned_tables(directory=None) -> bool:
+    """Load cleaned tables written by transform command to database.
+
+    Schema is set up as by run_pipeline (DDL_MODE, secondary indexes), tables
+    are loaded in FK order with LOAD_MODE. Checkpoints, CDC and run metrics
+    are used only by run_pipeline.
+
+    Args:
+        directory: Folder of cleaned tables (default config.CLEANED_DIR).
+
+    Returns:
+    bool: True if all tables were loaded.
+    """
+    directory = directory or config.CLEANED_DIR
+    cleaned_dataframes = read_tables(directory)
+    if not cleaned_dataframes:
+        logger.error("No cleaned tables in %s, run transform command first.", directory)
+        return False
+
+    engine = create_db_engine(config.DB_CONNECTION_STRING)
+    if not engine:
+        logger.critical("Failed to create database engine. Halting load.")
+        return False
+    db = ConnectionManager(engine)
+    ddl_file_name = DDL_FILES.get(config.DB_TYPE, "")
+    schema_to_load = schema_name()
+    loaded = False
+    try:
+        if ddl_file_name:
+            with db.connection() as connection:
+                apply_schema(connection, ddl_file_name, schema_to_load)
+        with (
+            db.load_target() as load_target,
+            deferred_indexes(
+                load_target, LOAD_ORDER, schema_to_load, config.LOAD_DEFER_INDEXES
+            ),
+        ):
+            loaded = load_tables(cleaned_dataframes, load_target, schema_to_load)
+    except Exception as e:
+        logger.error("Load of cleaned tables failed: %s", e, exc_info=True)
+        loaded = False
+    finally:
+        db.close()
+    logger.info("Load of cleaned tables from %s finished: %s", directory, loaded)
+    return loaded
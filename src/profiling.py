@@ -0,0 +1,125 @@
+"""Module provide cProfile and tracemalloc profiling of selected pipeline stages"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Frames stored for every traced allocation (more frames = slower profiling)
+TRACEMALLOC_FRAMES = 10
+
+
+class StageProfiler:
+    """Profile selected stages with cProfile (CPU) and tracemalloc (memory).
+
+    Every profiled stage writes to output_dir:
+    - <stage>.pstats: cProfile statistics (open with pstats, snakeviz, ...),
+    - <stage>.txt: top functions by cumulative time, top allocations (net
+      memory allocated by the stage per source line) and peak traced memory.
+
+    stages: Names (e.g. "load:carts") or name prefixes (e.g. "transform") of
+    profiled stages, all stages if empty or None.
+
+    cProfile measures only the thread running the stage and tracemalloc traces
+    the whole process, so stages should not run concurrently while profiled.
+    """
+
+    def __init__(self, output_dir: str, stages=None, top: int = 25):
+        self.output_dir = output_dir
+        self.stages = list(stages or [])
+        self.top = top
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        logger.info(
+            "Profiling stages %s, reports are written to %s.",
+            self.stages or "(all)",
+            output_dir,
+        )
+
+    def selected(self, stage: str) -> bool:
+        return not self.stages or any(
+            stage == name or stage.startswith(f"{name}:") for name in self.stages
+        )
+
+    @contextmanager
+    def profile(self, stage: str):
+        """Profile block running stage (if stage is selected)."""
+        if not self.selected(stage):
+            yield
+            return
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            allocations = _without_profilers(after).compare_to(
+                _without_profilers(before), "lineno"
+            )
+            self._write_reports(stage, profiler, allocations, peak)
+
+    def _write_reports(self, stage, profiler, allocations, peak):
+        base_path = os.path.join(self.output_dir, stage.replace(":", "_"))
+        with self._lock:
+            # Repeated attempts of stage (retries) get their own files
+            attempt = 1
+            while os.path.exists(_attempt_path(base_path, attempt, ".pstats")):
+                attempt += 1
+            pstats_path = _attempt_path(base_path, attempt, ".pstats")
+            report_path = _attempt_path(base_path, attempt, ".txt")
+            try:
+                profiler.dump_stats(pstats_path)
+                functions = io.StringIO()
+                pstats.Stats(profiler, stream=functions).sort_stats(
+                    pstats.SortKey.CUMULATIVE
+                ).print_stats(self.top)
+                with open(report_path, "w", encoding="utf-8") as f:
+                    f.write(f"Stage: {stage}\n")
+                    f.write(f"Peak traced memory: {peak / 1024**2:.1f} MiB\n\n")
+                    f.write(f"Top {self.top} allocations (net, by source line):\n")
+                    for statistic in allocations[: self.top]:
+                        f.write(f"{statistic}\n")
+                    f.write(f"\nTop {self.top} functions by cumulative time:\n")
+                    f.write(functions.getvalue())
+            except IOError as e:
+                logger.error("Profile of stage '%s' could not be written: %s", stage, e)
+                return
+        logger.info(
+            "Profile of stage '%s' written to %s (peak traced memory %.1f MiB).",
+            stage,
+            pstats_path,
+            peak / 1024**2,
+        )
+
+    def close(self):
+        """Stop tracing memory allocations (if started by profiler)."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _without_profilers(snapshot):
+    """Leave out memory of tracemalloc (e.g. previous snapshots) and cProfile."""
+    return snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+        ]
+    )
+
+
+def _attempt_path(base_path: str, attempt: int, extension: str) -> str:
+    suffix = "" if attempt == 1 else f"_attempt{attempt}"
+    return f"{base_path}{suffix}{extension}"
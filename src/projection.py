@@ -0,0 +1,117 @@
+"""Module provide projection of raw records to DataFrame columns of selected (nested) fields"""
+
+import importlib
+import logging
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _field_keys(fields: dict) -> list:
+    """Split dotted field paths (e.g. "address.city") to keys of nested dicts."""
+    return [(path, tuple(path.split("."))) for path in fields]
+
+
+def _typed_column(values, dtype, path: str) -> pd.Series:
+    """Column of values with dtype (None = inferred by pandas), values which do
+    not fit dtype (e.g. missing values of int64 field) fall back to inference."""
+    if dtype is None:
+        return pd.Series(values)
+    try:
+        return pd.Series(values, dtype=dtype)
+    except (TypeError, ValueError) as e:
+        logger.debug("Field '%s' does not fit dtype %s, inferring: %s", path, dtype, e)
+        return pd.Series(values)
+
+
+def _field_values(values: list, keys: tuple, cache: dict) -> list | None:
+    """Values of nested field (keys) of values (dicts), one list comprehension
+    per level, values of parent fields are cached (e.g. "address" is extracted
+    once for "address.city" and "address.state").
+
+    Returns:
+    list: Values of field (None where missing) or None if no value has it.
+    """
+    for depth, key in enumerate(keys, start=1):
+        if keys[:depth] in cache:
+            values = cache[keys[:depth]]
+            continue
+        if not any(isinstance(value, dict) and key in value for value in values):
+            values = None
+        else:
+            try:
+                # Fast path, all values are dicts (e.g. records)
+                values = [value.get(key) for value in values]
+            except AttributeError:
+                values = [
+                    value.get(key) if isinstance(value, dict) else None
+                    for value in values
+                ]
+        cache[keys[:depth]] = values
+        if values is None:
+            return None
+    return values
+
+
+def project_records(records: list, fields: dict) -> pd.DataFrame:
+    """Convert records (list of dicts) to DataFrame with one column per field.
+
+    Every field is extracted by a single pass over records, other keys of
+    records are never converted, so memory and time grow with the number of
+    selected fields, not with fields returned by API.
+
+    Args:
+        records: Raw records.
+        fields: Field path -> dtype of column (None = inferred), paths of nested
+            fields are dotted (e.g. "address.city") and become column names.
+
+    Returns:
+    pd.DataFrame: Columns of fields in order of fields, fields missing in all
+    records are left out (as pd.DataFrame(records) does), missing values are None.
+    """
+    cache = {}
+    data = {}
+    for path, keys in _field_keys(fields):
+        values = _field_values(records, keys, cache)
+        if values is not None:
+            data[path] = _typed_column(values, fields[path], path)
+    return pd.DataFrame(data)
+
+
+def top_level_fields(fields: dict) -> list:
+    """Top-level columns holding fields (e.g. "address" for "address.city")."""
+    return list(dict.fromkeys(keys[0] for _, keys in _field_keys(fields)))
+
+
+def project_arrow_table(table, fields: dict) -> pd.DataFrame:
+    """Arrow table version of project_records, nested fields are taken from
+    struct columns without converting the rest of them to python objects."""
+    pa = importlib.import_module("pyarrow")
+    data = {}
+    for path, keys in _field_keys(fields):
+        if keys[0] not in table.column_names:
+            continue
+        column = table.column(keys[0])
+        for key in keys[1:]:
+            if (
+                not pa.types.is_struct(column.type)
+                or column.type.get_field_index(key) < 0
+            ):
+                column = None
+                break
+            index = column.type.get_field_index(key)
+            # flatten() keeps nulls of parent structs
+            column = pa.chunked_array(
+                [chunk.flatten()[index] for chunk in column.chunks],
+                type=column.type.field(index).type,
+            )
+        if column is None:
+            continue
+        if pa.types.is_list(column.type) or pa.types.is_large_list(column.type):
+            # Nested lists become python lists (of dicts)
+            values = column.to_pylist()
+        else:
+            values = column.to_pandas()
+        data[path] = _typed_column(values, fields[path], path)
+    return pd.DataFrame(data)
@@ -0,0 +1,211 @@
+"""Module provide DAG task scheduler running pipeline tasks on a thread pool"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of started attempts of tasks with timeout
+START_POLL_INTERVAL = 0.05
+
+# Final states of tasks
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+SKIPPED = "skipped"
+
+
+class Task:
+    """Task of the scheduler: function without arguments and its dependencies."""
+
+    def __init__(self, name, func, depends_on=(), retries=0, timeout=None):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+        self.retries = retries
+        self.timeout = timeout
+
+
+class TaskScheduler:
+    """Run tasks on a thread pool, every task once all its dependencies succeeded.
+
+    Failed task (function raised) is retried up to its retries with exponential
+    backoff (retry_delay, 2 * retry_delay, ...), the retry is submitted once its
+    backoff elapsed. Tasks depending on a task that finally failed are skipped.
+    Attempt running longer than task timeout (measured from the moment the
+    attempt started running, not from its submission) is reported as timed
+    out; its thread cannot be stopped, so it is not retried and its result is
+    ignored. Tasks whose attempts must not outlive the run (e.g. writing over a
+    shared connection) therefore should not have a timeout.
+
+    Results of tasks (return values of functions) are available by result(),
+    e.g. for functions of dependent tasks.
+    """
+
+    def __init__(self, max_workers: int = 4, retry_delay: float = 1.0):
+        self.max_workers = max(1, max_workers)
+        self.retry_delay = retry_delay
+        self._tasks = {}
+        self._results = {}
+        self.states = {}
+
+    def add_task(self, name, func, depends_on=(), retries=0, timeout=None):
+        """Add task, dependencies are names of tasks (added before or later).
+
+        Raises:
+        ValueError: If task with the same name was already added.
+        """
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' is already defined.")
+        self._tasks[name] = Task(name, func, depends_on, retries, timeout)
+
+    def result(self, name):
+        """Return value of succeeded task (None if task did not succeed)."""
+        return self._results.get(name)
+
+    def _validate(self):
+        """Check that dependencies exist and do not form a cycle.
+
+        Raises:
+        ValueError: If dependency is unknown or tasks depend on each other.
+        """
+        for task in self._tasks.values():
+            unknown = [name for name in task.depends_on if name not in self._tasks]
+            if unknown:
+                raise ValueError(
+                    f"Task '{task.name}' depends on unknown tasks: {unknown}"
+                )
+        resolved = set()
+        remaining = dict(self._tasks)
+        while remaining:
+            ready = [
+                name
+                for name, task in remaining.items()
+                if resolved.issuperset(task.depends_on)
+            ]
+            if not ready:
+                raise ValueError(f"Dependency cycle among tasks: {sorted(remaining)}")
+            resolved.update(ready)
+            for name in ready:
+                del remaining[name]
+
+    @staticmethod
+    def _attempt(task: Task, started: dict):
+        """Run one attempt of task, record its start time in started."""
+        started["at"] = time.monotonic()
+        return task.func()
+
+    def run(self) -> bool:
+        """Run all tasks respecting dependencies.
+
+        Returns:
+        bool: True if all tasks succeeded (final states are in states).
+
+        Raises:
+        ValueError: If task dependencies are invalid (see _validate).
+        """
+        self._validate()
+        pending = {name: set(task.depends_on) for name, task in self._tasks.items()}
+        running = {}  # future -> (task, attempt, {"at": start time once running})
+        retries = []  # (submit time, task, attempt) of retries waiting for backoff
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="task"
+        )
+
+        def submit(task, attempt):
+            logger.debug("Starting task '%s' (attempt %d).", task.name, attempt + 1)
+            started = {}
+            future = executor.submit(self._attempt, task, started)
+            running[future] = (task, attempt, started)
+
+        try:
+            while pending or running or retries:
+                now = time.monotonic()
+                for retry in [retry for retry in retries if retry[0] <= now]:
+                    retries.remove(retry)
+                    submit(retry[1], retry[2])
+                for name, dependencies in list(pending.items()):
+                    not_succeeded = {
+                        dependency
+                        for dependency in dependencies
+                        if self.states.get(dependency, SUCCEEDED) != SUCCEEDED
+                    }
+                    if not_succeeded:
+                        logger.error(
+                            "Skipping task '%s', tasks %s did not succeed.",
+                            name,
+                            sorted(not_succeeded),
+                        )
+                        self.states[name] = SKIPPED
+                        del pending[name]
+                    elif all(dependency in self.states for dependency in dependencies):
+                        submit(self._tasks[name], 0)
+                        del pending[name]
+                if not running and not retries:
+                    continue
+
+                # Wake up for next deadline, next retry or start of attempt with timeout
+                wakeups = [retry_at for retry_at, _, _ in retries]
+                for task, _, started in running.values():
+                    if task.timeout:
+                        wakeups.append(
+                            started["at"] + task.timeout
+                            if "at" in started
+                            else time.monotonic() + START_POLL_INTERVAL
+                        )
+                timeout = max(0.0, min(wakeups) - time.monotonic()) if wakeups else None
+                if not running:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    task, attempt, started = running.pop(future)
+                    try:
+                        self._results[task.name] = future.result()
+                    except Exception as e:
+                        if attempt < task.retries:
+                            logger.warning(
+                                "Task '%s' failed (attempt %d of %d), retrying: %s",
+                                task.name,
+                                attempt + 1,
+                                task.retries + 1,
+                                e,
+                            )
+                            retries.append(
+                                (
+                                    time.monotonic() + self.retry_delay * 2**attempt,
+                                    task,
+                                    attempt + 1,
+                                )
+                            )
+                        else:
+                            logger.error(
+                                "Task '%s' failed: %s", task.name, e, exc_info=True
+                            )
+                            self.states[task.name] = FAILED
+                        continue
+                    self.states[task.name] = SUCCEEDED
+                    logger.info(
+                        "Task '%s' finished in %.2f s.",
+                        task.name,
+                        time.monotonic() - started["at"],
+                    )
+
+                now = time.monotonic()
+                for future, (task, _, started) in list(running.items()):
+                    if (
+                        task.timeout
+                        and "at" in started
+                        and now - started["at"] >= task.timeout
+                    ):
+                        del running[future]
+                        logger.error(
+                            "Task '%s' timed out after %.1f s.", task.name, task.timeout
+                        )
+                        self.states[task.name] = TIMED_OUT
+        finally:
+            # Timed out attempts are left running, their threads are not joined
+            executor.shutdown(wait=False, cancel_futures=True)
+        return all(state == SUCCEEDED for state in self.states.values())
@@ -0,0 +1,127 @@
+"""Module provide registry of SQL column types of loaded tables and load buffers"""
+
+import io
+
+import pandas as pd
+from sqlalchemy import Date, DateTime, Integer, Numeric, String, Text
+
+# Numeric(10,2) columns are handled as floats on python side
+DECIMAL = Numeric(10, 2, asdecimal=False)
+
+# Columns of transformed DataFrames -> SQLAlchemy types matching sql/schema_*_ddl.sql
+# (surrogate keys generated by database, e.g. cart_items.item_id, are not listed)
+TABLE_SCHEMAS = {
+    "users": {
+        "user_id": Integer(),
+        "first_name": String(50),
+        "last_name": String(50),
+        "email": String(255),
+        "phone": String(255),
+        "gender": String(50),
+        "age": Integer(),
+        "city": String(100),
+        "state": String(100),
+        "postal_code": String(20),
+        "birth_date": Date(),
+    },
+    "products": {
+        "id": Integer(),
+        "title": String(100),
+        "category": String(100),
+        "price": DECIMAL,
+        "discount_percentage": DECIMAL,
+        "rating": DECIMAL,
+        "stock": Integer(),
+        "brand": String(100),
+        "nr_of_reviews": Integer(),
+        "review_comments": Text(),
+    },
+    "product_reviews": {
+        "product_id": Integer(),
+        "rating": Integer(),
+        "comment": Text(),
+        "review_date": DateTime(),
+        "reviewer_name": String(100),
+        "reviewer_email": String(255),
+    },
+    "carts": {
+        "cart_id": Integer(),
+        "user_id": Integer(),
+        "cart_total": DECIMAL,
+        "discounted_total": DECIMAL,
+        "total_products": Integer(),
+        "total_quantity": Integer(),
+    },
+    "cart_items": {
+        "cart_id": Integer(),
+        "product_id": Integer(),
+        "title": String(100),
+        "quantity": Integer(),
+        "price": DECIMAL,
+        "total": DECIMAL,
+        "discount_percentage": DECIMAL,
+        "discounted_price": DECIMAL,
+    },
+}
+
+# Text format of dates sent to database (same as SQLAlchemy uses for SQLite)
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def sql_dtypes(table_name: str, columns=None) -> dict | None:
+    """dtype mapping for DataFrame.to_sql (None if table is not registered)."""
+    table_schema = TABLE_SCHEMAS.get(table_name)
+    if table_schema is None:
+        return None
+    if columns is None:
+        return dict(table_schema)
+    return {
+        column: table_schema[column] for column in columns if column in table_schema
+    }
+
+
+def _serialize_column(series: pd.Series, sql_type, as_objects: bool) -> pd.Series:
+    """Format date columns as text, with as_objects convert column to python
+    objects with None for missing values."""
+    if isinstance(sql_type, DateTime) or (
+        sql_type is None and pd.api.types.is_datetime64_any_dtype(series)
+    ):
+        series = pd.to_datetime(series).dt.strftime(DATETIME_FORMAT)
+    elif isinstance(sql_type, Date):
+        series = pd.to_datetime(series).dt.strftime(DATE_FORMAT)
+    if not as_objects:
+        return series
+    return series.astype(object).where(series.notna(), None)
+
+
+def prepare_load_frame(
+    df: pd.DataFrame, table_name: str, as_objects: bool = True
+) -> pd.DataFrame:
+    """Return DataFrame of insert-ready values (dates as text, with as_objects
+    python objects and None for missing values), converted column by column
+    with vectorized operations."""
+    table_schema = TABLE_SCHEMAS.get(table_name, {})
+    return pd.DataFrame(
+        {
+            column: _serialize_column(df[column], table_schema.get(column), as_objects)
+            for column in df.columns
+        },
+        index=df.index,
+    )
+
+
+def to_insert_rows(df: pd.DataFrame, table_name: str) -> list:
+    """Rows (tuples) for DBAPI executemany, no per-value conversion left."""
+    prepared = prepare_load_frame(df, table_name)
+    return list(zip(*(prepared[column].tolist() for column in prepared.columns)))
+
+
+def to_csv_buffer(df: pd.DataFrame, table_name: str, null: str = r"\N") -> io.StringIO:
+    """CSV buffer for PostgreSQL COPY (missing values written as null)."""
+    buffer = io.StringIO()
+    prepare_load_frame(df, table_name, as_objects=False).to_csv(
+        buffer, header=False, index=False, na_rep=null
+    )
+    buffer.seek(0)
+    return buffer
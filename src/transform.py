@@ -10,15 +10,76 @@ import pandas as pd
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# from config import your_config_module
+import config  # pylint: disable=wrong-import-position
+from src.extract import read_raw_dataframe  # pylint: disable=wrong-import-position
+from src.projection import project_records  # pylint: disable=wrong-import-position
 
 logger = logging.getLogger(__name__)  # Get logger for this module
 
+# Raw fields used by transformations of entities: field path (nested fields
+# dotted, e.g. "address.city") -> (dtype of column, column of cleaned table).
+# Dtype is object for text and nested lists, fields without column of cleaned
+# table (None) are only normalized to their own table (products of carts).
+ENTITY_COLUMNS = {
+    "users": {
+        "id": ("int64", "user_id"),
+        "firstName": (object, "first_name"),
+        "lastName": (object, "last_name"),
+        "email": (object, "email"),
+        "phone": (object, "phone"),
+        "gender": (object, "gender"),
+        "age": ("int64", "age"),
+        "address.city": (object, "city"),
+        "address.state": (object, "state"),
+        "address.postalCode": (object, "postal_code"),
+        "birthDate": (object, "birth_date"),  # Proxy for Signup Date
+    },
+    "products": {
+        "id": ("int64", "id"),
+        "title": (object, "title"),
+        "category": (object, "category"),
+        "price": ("float64", "price"),
+        "discountPercentage": ("float64", "discount_percentage"),
+        "rating": ("float64", "rating"),
+        "stock": ("int64", "stock"),
+        "brand": (object, "brand"),
+        "reviews": (object, "reviews"),  # list of review dicts, aggregated
+    },
+    "carts": {
+        "id": ("int64", "cart_id"),
+        "userId": ("int64", "user_id"),
+        "total": ("float64", "cart_total"),  # Total Price for the cart
+        "discountedTotal": ("float64", "discounted_total"),
+        "totalProducts": ("int64", "total_products"),
+        "totalQuantity": ("int64", "total_quantity"),
+        "products": (object, None),  # list of item dicts, see build_cart_items
+    },
+}
+
+# Only these fields are converted to DataFrame columns (field path -> dtype)
+ENTITY_FIELDS = {
+    entity_name: {field: dtype for field, (dtype, _) in columns.items()}
+    for entity_name, columns in ENTITY_COLUMNS.items()
+}
+
+
+def select_entity_columns(df: pd.DataFrame, entity_name: str) -> pd.DataFrame:
+    """Select raw fields of entity which exist in df (in ENTITY_COLUMNS order)
+    and rename them to columns of cleaned table."""
+    columns = {
+        field: column
+        for field, (_, column) in ENTITY_COLUMNS[entity_name].items()
+        if column is not None and field in df.columns
+    }
+    return df[list(columns)].rename(columns=columns)
+
 
 def convert_list_to_dataframe(
     data_list: list | None, entity_name: str
 ) -> pd.DataFrame | None:
     """Converts and logs python data (list of dicts) to Pandas DataFrame
+    Only fields of entity listed in ENTITY_FIELDS are converted (in one pass,
+    to typed columns), entities without entry there are converted with all fields.
     Args:
         data: Data to conversion (json files)
 
@@ -40,7 +101,10 @@ def convert_list_to_dataframe(
         return None  # Possible return empty DataFrame or None
 
     try:
-        df = pd.DataFrame(data_list)
+        if entity_name in ENTITY_FIELDS:
+            df = project_records(data_list, ENTITY_FIELDS[entity_name])
+        else:
+            df = pd.DataFrame(data_list)
         logger.info("Data '%s' succesfully converted to DataFrame.", entity_name)
         return df
     except Exception as e:
@@ -54,36 +118,8 @@ def transform_users(users_df: pd.DataFrame | None) -> pd.DataFrame | None:
         return None
     try:
         # logger.info("Users data transofrmation...")
-        # Columns to picks
-        relevant_cols = [
-            "id",  # User ID
-            "firstName",  # First Name
-            "lastName",  # Last Name
-            "email",  # Email
-            "phone",  # Phone
-            "gender",  # Gender
-            "age",  # Age
-            "address.city",  # City
-            "address.state",  # State
-            "address.postalCode",  # Postal Code
-            "birthDate",  # Birth Date (Proxy for Signup Date)
-        ]
-        # Select only colums which exists in df
-        cols_to_select = [col for col in relevant_cols if col in users_df.columns]
-        users_df = users_df[cols_to_select]
-        # Renaming columns to snake_case
-        users_df = users_df.rename(
-            columns={
-                "id": "user_id",
-                "firstName": "first_name",
-                "lastName": "last_name",
-                "address.city": "city",
-                "address.state": "state",
-                "address.postalCode": "postal_code",
-                "address.coordinates": "coordinates",
-                "birthDate": "birth_date",
-            }
-        )
+        # Picking columns and renaming them to snake_case
+        users_df = select_entity_columns(users_df, "users")
         # Datatype change
         users_df["birth_date"] = pd.to_datetime(users_df["birth_date"])
         # logger.info("Successful user transformation\n")
@@ -101,26 +137,8 @@ def transform_products(products_df: pd.DataFrame | None) -> pd.DataFrame | None:
     try:
         logger.info("Products data transformation...")
 
-        # Picking columns to keep
-        cols_to_keep = [
-            "id",
-            "title",
-            "category",
-            "price",
-            "discountPercentage",
-            "rating",
-            "stock",
-            "brand",
-            "reviews",
-        ]
-        # Check if columns exists
-        existing_cols = [col for col in cols_to_keep if col in products_df.columns]
-        products_df = products_df[existing_cols].copy()
-
-        # Renaming columns to snake_case
-        products_df = products_df.rename(
-            columns={"discountPercentage": "discount_percentage"}
-        )  # Upraveno na snake_case
+        # Picking columns and renaming them to snake_case
+        products_df = select_entity_columns(products_df, "products")
 
         # Chenge data type
         products_df["price"] = pd.to_numeric(products_df["price"], errors="coerce")
@@ -136,33 +154,11 @@ def transform_products(products_df: pd.DataFrame | None) -> pd.DataFrame | None:
         if "reviews" in products_df.columns:
             logger.info("Processing column 'reviews'...")
 
-            # Count number of reviews and add as new column
-            count_reviews = lambda review_list: (
-                len(review_list) if isinstance(review_list, list) else 0
+            # Review counts and joined comments in one pass over reviews
+            products_df["nr_of_reviews"], products_df["review_comments"] = (
+                aggregate_reviews(products_df["reviews"])
             )
-            products_df["nr_of_reviews"] = products_df["reviews"].apply(count_reviews)
-            logger.info("Column 'nr_of_reviews' created with review counts.")
-
-            # Function for extraction comments -> list of str
-            get_comments = lambda review_list: (
-                [
-                    review.get("comment", "")
-                    for review in review_list
-                    if isinstance(review, dict)
-                ]
-                if isinstance(review_list, list)
-                else []
-            )
-
-            # Create a column with comments (on the copy)
-            products_df["review_comments"] = products_df["reviews"].apply(get_comments)
-            logger.info("Column 'review_comments' created.")
-
-            # Joining comments to one string
-            products_df["review_comments"] = products_df["review_comments"].apply(
-                lambda comments: " | ".join(comments)
-            )
-            logger.info("Column 'review_comments' joined to str.")
+            logger.info("Columns 'nr_of_reviews' and 'review_comments' created.")
 
             # --- Drop reviews column ---
             products_df = products_df.drop(columns=["reviews"])
@@ -182,6 +178,148 @@ def transform_products(products_df: pd.DataFrame | None) -> pd.DataFrame | None:
         return None
 
 
+def aggregate_reviews(reviews: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Count reviews and join their comments (" | ") in a single pass.
+
+    Returns:
+    tuple: Series with number of reviews and Series with joined comments.
+    """
+    counts, comments = [], []
+    for review_list in reviews.tolist():
+        if isinstance(review_list, list):
+            counts.append(len(review_list))
+            comments.append(
+                " | ".join(
+                    review.get("comment") or ""
+                    for review in review_list
+                    if isinstance(review, dict)
+                )
+            )
+        else:
+            counts.append(0)
+            comments.append("")
+    return (
+        pd.Series(counts, index=reviews.index, dtype="int64"),
+        pd.Series(comments, index=reviews.index, dtype=object),
+    )
+
+
+def _explode_nested(
+    df_raw: pd.DataFrame, list_column: str, parent_column: str, columns: dict
+) -> pd.DataFrame | None:
+    """Normalize column with lists of dicts to one row per dict.
+
+    Vectorized: lists are exploded and all dicts are converted to columns
+    (source key -> target name in columns) in one pass, first column holds
+    value of parent_column. Returns None if there is no nested record.
+    """
+    # One row per nested record, empty lists explode to NaN
+    exploded = df_raw[["id", list_column]].explode(list_column, ignore_index=True)
+    exploded = exploded[exploded[list_column].notna()]
+    if exploded.empty:
+        return None
+
+    nested_df = pd.DataFrame.from_records(
+        exploded[list_column].tolist(), columns=list(columns)
+    ).rename(columns=columns)
+    nested_df.insert(0, parent_column, exploded["id"].to_numpy())
+    return nested_df
+
+
+# Source keys of reviews -> product_reviews columns
+PRODUCT_REVIEW_COLUMNS = {
+    "rating": "rating",
+    "comment": "comment",
+    "date": "review_date",
+    "reviewerName": "reviewer_name",
+    "reviewerEmail": "reviewer_email",
+}
+
+
+def transform_product_reviews(products_df: pd.DataFrame | None) -> pd.DataFrame | None:
+    """Normalize nested 'reviews' of raw products DataFrame to product_reviews table."""
+    if products_df is None:
+        return None
+    review_columns = ["product_id", *PRODUCT_REVIEW_COLUMNS.values()]
+    try:
+        logger.info("Data normalization for 'product_reviews'...")
+        if "reviews" not in products_df.columns:
+            logger.warning("Column 'reviews' was not found.")
+            return pd.DataFrame(columns=review_columns)
+
+        products_df = products_df.drop_duplicates(subset=["id"])
+        is_list = products_df["reviews"].map(
+            lambda review_list: isinstance(review_list, list)
+        )
+        reviews_df = _explode_nested(
+            products_df[is_list], "reviews", "product_id", PRODUCT_REVIEW_COLUMNS
+        )
+        if reviews_df is None:
+            logger.warning("No reviews found, 'product_reviews' is empty.")
+            return pd.DataFrame(columns=review_columns)
+
+        # Datatype change, dates are stored as naive UTC
+        reviews_df["product_id"] = pd.to_numeric(reviews_df["product_id"]).astype(
+            "Int64"
+        )
+        reviews_df["rating"] = pd.to_numeric(
+            reviews_df["rating"], errors="coerce"
+        ).astype("Int64")
+        reviews_df["review_date"] = pd.to_datetime(
+            reviews_df["review_date"], errors="coerce", utc=True
+        ).dt.tz_convert(None)
+        return reviews_df
+
+    except Exception as e:
+        logger.error("Error during product reviews transformation: %s", e)
+        return None
+
+
+# Source keys of products in cart -> cart_items columns
+CART_ITEM_COLUMNS = {
+    "id": "product_id",
+    "title": "title",
+    "quantity": "quantity",
+    "price": "price",  # price of product
+    "total": "total",  # total price for product (quantity * price)
+    "discountPercentage": "discount_percentage",
+    "discountedTotal": "discounted_price",  # discoundet product price
+}
+
+
+def build_cart_items(carts_df_raw: pd.DataFrame) -> pd.DataFrame:
+    """Normalize nested 'products' lists of carts to cart_items DataFrame.
+
+    Vectorized: lists are exploded to one row per item and item dicts are
+    converted to columns in one pass (no iteration over DataFrame rows).
+    """
+    item_columns = ["cart_id", *CART_ITEM_COLUMNS.values()]
+    if "products" not in carts_df_raw.columns:
+        logger.warning("Column 'products' was not found in carts data.")
+        return pd.DataFrame(columns=item_columns)
+
+    # Check if products of cart are a list
+    is_list = carts_df_raw["products"].map(lambda products: isinstance(products, list))
+    for cart_id in carts_df_raw.loc[~is_list, "id"]:
+        logger.warning("Cart Id %d is not a valid list of product.", cart_id)
+
+    cart_items = _explode_nested(
+        carts_df_raw[is_list], "products", "cart_id", CART_ITEM_COLUMNS
+    )
+    if cart_items is None:
+        logger.warning(
+            "Items in carts was not found, 'cart_items' could not be created."
+        )
+        return pd.DataFrame(columns=item_columns)  # Empty DF, if items was not found
+
+    # Datatype change
+    cart_items["product_id"] = pd.to_numeric(cart_items["product_id"]).astype("Int64")
+    cart_items["quantity"] = pd.to_numeric(cart_items["quantity"]).astype("Int64")
+    for column in ["price", "total", "discount_percentage", "discounted_price"]:
+        cart_items[column] = pd.to_numeric(cart_items[column])
+    return cart_items
+
+
 def transform_carts(
     carts_df_raw: pd.DataFrame | None,
 ) -> tuple[pd.DataFrame | None, pd.DataFrame | None]:
@@ -194,29 +332,8 @@ def transform_carts(
         logger.info("Carts data transofrmation...")
         # PART 1: info about carts
         logger.info("Cleaning data for 'carts' table...")
-        # Columns pick for carts
-        cols_for_carts = [
-            "id",  # Cart ID
-            "userId",  # Users ID
-            "total",  # Total Price for the cart
-            "discountedTotal",  # Total Price after Discount
-            "totalProducts",  # Product Count
-            "totalQuantity",  # Quantity Count
-        ]
-
-        # Select only colums which exists in df
-        cols_to_select = [col for col in cols_for_carts if col in carts_df_raw.columns]
-        carts_cleaned = carts_df_raw[cols_to_select].copy()
-        carts_cleaned = carts_cleaned.rename(
-            columns={
-                "id": "cart_id",
-                "userId": "user_id",
-                "total": "cart_total",
-                "discountedTotal": "discounted_total",
-                "totalProducts": "total_products",
-                "totalQuantity": "total_quantity",
-            }
-        )
+        # Picking columns and renaming them to snake_case
+        carts_cleaned = select_entity_columns(carts_df_raw, "carts")
         # data types change for carts_cleaned
         if "user_id" in carts_cleaned.columns:
             carts_cleaned["user_id"] = pd.to_numeric(
@@ -239,74 +356,7 @@ def transform_carts(
 
         # PART 2: Making carts_items_cleanes
         logger.info("Data normalization for 'cart_items'...")
-        cart_items_list = []
-        for _, cart_row in carts_df_raw.iterrows():  # iteration over original df
-            cart_id = cart_row["id"]
-            # Check if collumn exists and its a list
-            if "products" in cart_row and isinstance(cart_row["products"], list):
-                for product in cart_row[
-                    "products"
-                ]:  # iteration over list of products in selected cart
-                    cart_items_list.append(
-                        {
-                            "cart_id": cart_id,
-                            "product_id": product.get("id"),
-                            "title": product.get("title"),
-                            "quantity": product.get("quantity"),
-                            "price": product.get("price"),  # price of product
-                            "total": product.get(
-                                "total"
-                            ),  # total price for product (quantity * price)
-                            "discount_percentage": product.get("discountPercentage"),
-                            "discounted_price": product.get(
-                                "discountedTotal"
-                            ),  # discoundet product price
-                        }
-                    )
-            else:
-                logger.warning("Cart Id %d is not a valid list of product.", cart_id)
-
-        # Create DataFrame for cart items
-        if not cart_items_list:
-            logger.warning(
-                "Items in carts was not found, 'cart_items' could not be created."
-            )
-            cart_items_cleaned = pd.DataFrame(
-                columns=[
-                    "cart_id",
-                    "product_id",
-                    "title",
-                    "quantity",
-                    "price",
-                    "total",
-                    "discount_percentage",
-                    "discounted_price",
-                ]
-            )  # Empty DF, if items was not found
-        else:
-            cart_items_cleaned = pd.DataFrame(cart_items_list)
-            # Columns rename and datatype change for cart_items
-            cart_items_cleaned = cart_items_cleaned.rename(
-                columns={
-                    "discount_percentage": "discount_percentage",
-                    "discounted_price": "discounted_price",
-                }
-            )
-            # Datatype change
-            cart_items_cleaned["product_id"] = pd.to_numeric(
-                cart_items_cleaned["product_id"]
-            ).astype("Int64")
-            cart_items_cleaned["quantity"] = pd.to_numeric(
-                cart_items_cleaned["quantity"]
-            ).astype("Int64")
-            cart_items_cleaned["price"] = pd.to_numeric(cart_items_cleaned["price"])
-            cart_items_cleaned["total"] = pd.to_numeric(cart_items_cleaned["total"])
-            cart_items_cleaned["discount_percentage"] = pd.to_numeric(
-                cart_items_cleaned["discount_percentage"]
-            )
-            cart_items_cleaned["discounted_price"] = pd.to_numeric(
-                cart_items_cleaned["discounted_price"]
-            )
+        cart_items_cleaned = build_cart_items(carts_df_raw)
 
         return carts_cleaned, cart_items_cleaned
 
@@ -316,6 +366,134 @@ def transform_carts(
         return None, None
 
 
+def transform_entity_tables(
+    entity_name: str, df_raw: pd.DataFrame, with_reviews: bool = False
+) -> dict | None:
+    """Apply transformation of entity to its raw DataFrame.
+
+    Args:
+        entity_name: users, products or carts.
+        df_raw: Raw DataFrame of entity.
+        with_reviews: Create also 'product_reviews' table for products.
+
+    Returns:
+    dict: Table name -> cleaned DataFrame (None value if transformation of the
+    table failed) or None if no transformation is defined for entity.
+    """
+    if entity_name == "users":
+        return {"users": transform_users(df_raw)}
+    if entity_name == "products":
+        tables = {"products": transform_products(df_raw)}
+        if with_reviews:
+            tables["product_reviews"] = transform_product_reviews(df_raw)
+        return tables
+    if entity_name == "carts":
+        return dict(zip(["carts", "cart_items"], transform_carts(df_raw)))
+    logger.warning("No transformation defined for entity '%s'.", entity_name)
+    return None
+
+
+def transform_entity(name, file_path, data_list=None) -> dict:
+    """Transform one extracted entity.
+
+    Args:
+        name: Entity name (users, products, carts).
+        file_path: Path to raw file of entity.
+        data_list: Extracted records (in-memory handoff), raw file is read if None.
+
+    Returns:
+    dict: Table name -> cleaned DataFrame (empty if transformation failed).
+    """
+    cleaned_dataframes = {}
+    logger.info("Data tranformation of %s from file %s", name, file_path)
+    try:
+        if data_list is not None:
+            # In-memory handoff, no raw file round-trip
+            df_raw = convert_list_to_dataframe(data_list, name)
+        else:
+            # Loading raw file directly to DataFrame (format from config.RAW_FORMAT)
+            df_raw = read_raw_dataframe(file_path, name, fields=ENTITY_FIELDS.get(name))
+        if df_raw is None:
+            logger.error("Data conversion of %s to DataFrame failed.", name)
+            return cleaned_dataframes
+        if df_raw.empty:
+            logger.warning("In file %s data for '%s' not found.", file_path, name)
+            return cleaned_dataframes
+
+        # Aplication of specific transformation
+        cleaned_dataframes = (
+            transform_entity_tables(name, df_raw, config.LOAD_PRODUCT_REVIEWS) or {}
+        )
+
+        # Log shapes after transformations
+        for table_name, df_cleaned in list(cleaned_dataframes.items()):
+            if df_cleaned is None:
+                del cleaned_dataframes[table_name]
+                continue
+            logger.info(
+                "Transformation of '%s' finished. Shape: %s\n",
+                table_name,
+                df_cleaned.shape,
+            )
+
+    except Exception as e:
+        # Detailed log with traceback
+        logger.error(
+            "Unexpected error during transformation for %s: %s",
+            name,
+            e,
+            exc_info=True,
+        )
+    return cleaned_dataframes
+
+
+def iter_transform_chunks(entity_name: str, batches, with_reviews: bool = False):
+    """Chunked transformation: transform batches of raw records one by one.
+
+    Every batch goes through the same conversion and transform functions as
+    whole entity, so chunks have the same columns mappings and dtypes.
+    Product duplicates are removed across chunks.
+
+    Args:
+        entity_name: users, products or carts.
+        batches: Iterable of record batches (lists of dicts).
+        with_reviews: Create also 'product_reviews' chunks for products.
+
+    Yields:
+    dict: Table name -> cleaned DataFrame chunk.
+
+    Raises:
+    RuntimeError: If transformation of a chunk failed.
+    """
+    seen_product_ids = set()
+    for chunk_nr, batch in enumerate(batches, start=1):
+        df_raw = convert_list_to_dataframe(batch, entity_name)
+        if df_raw is None:
+            continue
+
+        if entity_name == "products":
+            # Drop duplicates ID across chunks
+            df_raw = df_raw[~df_raw["id"].isin(seen_product_ids)]
+            seen_product_ids.update(df_raw["id"].tolist())
+        chunk = transform_entity_tables(entity_name, df_raw, with_reviews)
+        if chunk is None:
+            return
+
+        failed = [table for table, df in chunk.items() if df is None]
+        if failed:
+            raise RuntimeError(
+                f"Transformation of chunk {chunk_nr} of '{entity_name}' failed"
+                f" for tables: {failed}"
+            )
+        logger.debug(
+            "Chunk %d of '%s' transformed: %s",
+            chunk_nr,
+            entity_name,
+            {table: len(df) for table, df in chunk.items()},
+        )
+        yield chunk
+
+
 if __name__ == "__main__":
     # basic logging for separate module testing
     logging.basicConfig(
@@ -0,0 +1,134 @@
+"""Tests of change data capture (src/cdc.py) against digest index of previous run"""
+
+import pandas as pd
+import pytest
+
+from src.cdc import ChangeCapture
+
+
+def users(**changes) -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "user_id": [1, 2, 3],
+            "first_name": ["Emily", "Michael", "Sophia"],
+            "email": ["emily@x.com", "michael@x.com", "sophia@x.com"],
+            "age": [28, 35, 42],
+        }
+    )
+    for user_id, values in changes.items():
+        for column, value in values.items():
+            df.loc[df["user_id"] == int(user_id[1:]), column] = value
+    return df
+
+
+def cart_items() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "cart_id": [1, 1, 2],
+            "product_id": [10, 11, 10],
+            "quantity": [1, 2, 3],
+            "price": [9.99, 5.0, 9.99],
+        }
+    )
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "cdc_digests.json")
+
+
+def previous_run(index_path, **tables) -> ChangeCapture:
+    """Diff tables as previous run did and save its index, return next run."""
+    cdc = ChangeCapture(index_path)
+    for table_name, df in tables.items():
+        cdc.diff(table_name, df)
+    cdc.save()
+    return ChangeCapture(index_path)
+
+
+def test_first_run_without_index_emits_all_rows(index_path):
+    changed, counts = ChangeCapture(index_path).diff("users", users())
+
+    assert changed["user_id"].tolist() == [1, 2, 3]
+    assert counts == {"inserted": 3, "updated": 0, "unchanged": 0}
+
+
+def test_unchanged_snapshot_produces_empty_diff(index_path):
+    cdc = previous_run(index_path, users=users())
+
+    changed, counts = cdc.diff("users", users())
+
+    assert changed.empty
+    assert counts == {"inserted": 0, "updated": 0, "unchanged": 3}
+    assert cdc.deleted_keys("users") == []
+
+
+def test_changed_row_is_emitted_as_update(index_path):
+    cdc = previous_run(index_path, users=users())
+
+    changed, counts = cdc.diff("users", users(u2={"email": "mike@x.com"}))
+
+    assert changed.to_dict("records") == [
+        {"user_id": 2, "first_name": "Michael", "email": "mike@x.com", "age": 35}
+    ]
+    assert counts == {"inserted": 0, "updated": 1, "unchanged": 2}
+
+
+def test_new_row_is_emitted_as_insert(index_path):
+    cdc = previous_run(index_path, users=users())
+    df = pd.concat(
+        [users(), pd.DataFrame([{"user_id": 4, "first_name": "Liam", "age": 20}])],
+        ignore_index=True,
+    )
+
+    changed, counts = cdc.diff("users", df)
+
+    assert changed["user_id"].tolist() == [4]
+    assert counts == {"inserted": 1, "updated": 0, "unchanged": 3}
+
+
+def test_removed_key_is_deleted(index_path):
+    cdc = previous_run(index_path, users=users())
+
+    changed, _ = cdc.diff("users", users().query("user_id != 3"))
+
+    assert changed.empty
+    assert cdc.deleted_keys("users") == [3]
+
+
+def test_deleted_keys_of_tables_not_diffed_are_not_reported(index_path):
+    cdc = previous_run(index_path, users=users())
+
+    assert cdc.deleted_keys("users") == []
+
+
+def test_child_rows_are_emitted_per_changed_parent(index_path):
+    cdc = previous_run(index_path, cart_items=cart_items())
+    df = cart_items()
+    df.loc[1, "quantity"] = 5  # Second item of cart 1
+
+    changed, counts = cdc.diff("cart_items", df)
+
+    assert changed["cart_id"].tolist() == [1, 1]
+    assert counts == {"inserted": 0, "updated": 1, "unchanged": 1}
+
+
+def test_reset_treats_all_rows_as_new(index_path):
+    cdc = previous_run(index_path, users=users())
+    cdc.reset()
+
+    changed, counts = cdc.diff("users", users())
+
+    assert len(changed) == 3
+    assert counts["inserted"] == 3
+
+
+def test_index_is_replaced_only_by_save(index_path):
+    previous_run(index_path, users=users())
+    cdc = ChangeCapture(index_path)
+    cdc.diff("users", users(u1={"age": 29}))
+    # Run failed, index was not saved: change is captured again
+
+    changed, _ = ChangeCapture(index_path).diff("users", users(u1={"age": 29}))
+
+    assert changed["user_id"].tolist() == [1]
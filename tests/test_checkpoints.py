@@ -0,0 +1,140 @@
+"""Tests of checkpoint store (src/checkpoints.py) and resume of failed pipeline run"""
+
+import os
+import sqlite3
+import sys
+
+import pandas as pd
+import pytest
+
+import config
+import src.load_coordinator
+from src.checkpoints import CheckpointStore
+from src.pipeline import run_pipeline
+
+# Generated dataset and local dummyjson API of benchmarks
+sys.path.insert(0, os.path.join(os.path.dirname(config.__file__), "benchmarks"))
+from datagen import (
+    generate_dataset,
+)  # noqa: E402  pylint: disable=wrong-import-position
+from dummy_api import (
+    DummyJsonServer,
+)  # noqa: E402  pylint: disable=wrong-import-position
+
+LOADED_TABLES = ["users", "products", "carts", "cart_items"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CheckpointStore(
+        str(tmp_path / "pipeline_checkpoint.json"), str(tmp_path / "checkpoints")
+    )
+
+
+def test_new_run_forgets_completed_stages(store):
+    assert not store.start_run()
+    store.complete("ddl", schema_applied=True)
+    store.finish_run(False)
+
+    assert not store.start_run(resume=False)
+    assert store.completed("ddl") is None
+
+
+def test_resumed_run_keeps_completed_stages(store):
+    store.start_run()
+    run_id = store.run_id
+    store.complete("ddl", schema_applied=True)
+    store.finish_run(False)
+
+    assert store.start_run(resume=True)
+    assert store.run_id == run_id
+    assert store.completed("ddl") == {"schema_applied": True, "artifacts": {}}
+
+
+def test_succeeded_run_is_not_resumed(store):
+    store.start_run()
+    store.complete("ddl")
+    store.finish_run(True)
+
+    assert not store.start_run(resume=True)
+    assert store.completed("ddl") is None
+
+
+def test_changed_artifact_repeats_stage(store, tmp_path):
+    raw_file = tmp_path / "users.ndjson"
+    raw_file.write_text('{"id": 1}\n')
+    store.start_run()
+    store.complete("extract:users", {"raw": str(raw_file)}, changed=True)
+    assert store.completed("extract:users")["changed"]
+
+    raw_file.write_text('{"id": 2}\n')
+
+    assert store.completed("extract:users") is None
+
+
+def test_saved_tables_are_loaded_back(store):
+    store.start_run()
+    df = pd.DataFrame({"user_id": [1, 2], "first_name": ["Emily", "Michael"]})
+    store.save_tables("transform:users", {"users": df})
+
+    tables = CheckpointStore(store.path, store.artifacts_dir).load_tables(
+        "transform:users"
+    )
+
+    pd.testing.assert_frame_equal(tables["users"], df)
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Pipeline settings of a run against local API in tmp_path (append load
+    mode, tables recreated by every new run)."""
+    dataset = generate_dataset(users=30, products=20, carts=10, seed=7)
+    settings = {
+        "DATA_DIR": str(tmp_path / "data"),
+        "LOG_DIR": str(tmp_path / "logs"),
+        "DB_TYPE": "sqlite",
+        "LOAD_MODE": "append",
+        "DDL_MODE": "always",
+        "CDC_ENABLED": False,
+        "CHECKPOINT_ENABLED": True,
+        "LOAD_ATOMIC": False,
+        "TASK_MAX_RETRIES": 0,
+    }
+    for name, value in settings.items():
+        monkeypatch.setattr(config, name, value, raising=False)
+    with DummyJsonServer(dataset) as server:
+        monkeypatch.setattr(config, "API_ENDPOINTS", server.endpoints, raising=False)
+        yield dataset
+
+
+def table_counts() -> dict:
+    path = config.DB_CONNECTION_STRING.removeprefix("sqlite:///")
+    with sqlite3.connect(path) as connection:
+        return {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in LOADED_TABLES
+        }
+
+
+def test_resume_after_failed_cart_items_load_does_not_duplicate_rows(
+    pipeline, monkeypatch
+):
+    assert run_pipeline()
+    expected = table_counts()
+    assert expected["carts"] == len(pipeline["carts"])
+
+    # carts are committed, then cart_items fail (load:carts does not complete)
+    load_dataframe_to_db = src.load_coordinator.load_dataframe_to_db
+
+    def failing_cart_items(**kwargs):
+        if kwargs["table_name"] == "cart_items":
+            return False
+        return load_dataframe_to_db(**kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(src.load_coordinator, "load_dataframe_to_db", failing_cart_items)
+        assert not run_pipeline()
+    assert table_counts() == {**expected, "cart_items": 0}
+
+    assert run_pipeline(resume=True)
+    assert table_counts() == expected
@@ -0,0 +1,78 @@
+"""Tests of settings derived from other settings (config.py)"""
+
+import os
+from dataclasses import fields
+
+import pytest
+
+import config
+
+
+@pytest.fixture
+def override(monkeypatch):
+    """Settings resolved again from environment without .env file and module
+    overrides (monkeypatch.setattr of missing constant pins its resolved value)."""
+    monkeypatch.setattr(config, "DOTENV_PATH", os.devnull + ".missing")
+    for item in fields(config.Settings):
+        monkeypatch.delitem(vars(config), item.name.upper(), raising=False)
+    for name in list(os.environ):
+        if name.startswith("ETL_") or name == "SQLITE_DB_FILENAME":
+            monkeypatch.delenv(name)
+    config.get_settings.cache_clear()
+
+    def override(name, value):
+        """Override module constant (removed again after test)."""
+        monkeypatch.setitem(vars(config), name, value)
+
+    yield override
+    config.get_settings.cache_clear()
+
+
+def test_paths_follow_overridden_data_and_log_dir(override, tmp_path):
+    override("DATA_DIR", str(tmp_path / "data"))
+    override("LOG_DIR", str(tmp_path / "logs"))
+
+    assert config.DB_CONNECTION_STRING == (
+        f"sqlite:///{tmp_path / 'data' / 'ecommerce_pipeline_default.db'}"
+    )
+    assert config.CHECKPOINT_DIR == str(tmp_path / "data" / "checkpoints")
+    assert config.CLEANED_DIR == str(tmp_path / "data" / "cleaned")
+    assert config.PROMETHEUS_TEXTFILE == str(
+        tmp_path / "logs" / "metrics" / "etl_pipeline.prom"
+    )
+    assert config.LOGGING_CONFIG["handlers"]["file"]["filename"] == str(
+        tmp_path / "logs" / "etl_pipeline.log"
+    )
+    # Settings object itself is not changed by module overrides
+    assert config.get_settings().checkpoint_dir == os.path.join(
+        config.PROJECT_ROOT_DIR, "data", "checkpoints"
+    )
+
+
+def test_explicit_setting_is_kept_when_base_is_overridden(
+    override, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("ETL_CLEANED_DIR", str(tmp_path / "cleaned"))
+    override("DATA_DIR", str(tmp_path / "data"))
+    override("METRICS_DIR", str(tmp_path / "metrics"))
+
+    assert config.CLEANED_DIR == str(tmp_path / "cleaned")
+    assert config.CHECKPOINT_DIR == str(tmp_path / "data" / "checkpoints")
+    assert config.PROMETHEUS_TEXTFILE == str(tmp_path / "metrics" / "etl_pipeline.prom")
+
+
+def test_data_and_log_dir_from_environment(override, monkeypatch, tmp_path):
+    monkeypatch.setenv("ETL_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("ETL_LOG_DIR", str(tmp_path / "logs"))
+
+    assert config.DATA_DIR == str(tmp_path / "data")
+    assert config.CHECKPOINT_DIR == str(tmp_path / "data" / "checkpoints")
+    assert config.METRICS_DIR == str(tmp_path / "logs" / "metrics")
+
+
+def test_ddl_mode_follows_overridden_load_mode(override):
+    assert config.DDL_MODE == "always"
+
+    override("LOAD_MODE", "upsert")
+
+    assert config.DDL_MODE == "migrate"
@@ -0,0 +1,78 @@
+"""Tests of paginated extraction (src/extract.py) against fake API pages"""
+
+import os
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+import config
+from src import extract
+from src.extract import PaginationError, extract_endpoint, fetch_pages
+from src.extract_cache import ExtractCache
+
+URL = "http://api.test/users"
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Fake paginated endpoint serving 'records' and reporting 'total' (number
+    of records unless set otherwise)."""
+    state = {"records": [{"id": i} for i in range(1, 6)], "total": None}
+
+    def fetch_from_api(url, page_meta=None, **_):
+        query = dict(parse_qsl(urlsplit(url).query))
+        skip, limit = int(query["skip"]), int(query["limit"])
+        records = state["records"]
+        total = len(records) if state["total"] is None else state["total"]
+        return {"users": records[skip : skip + limit], "total": total}
+
+    monkeypatch.setattr(extract, "fetch_from_api", fetch_from_api)
+    monkeypatch.setitem(vars(config), "API_PAGE_SIZE", 2)
+    monkeypatch.setitem(vars(config), "API_MAX_IN_FLIGHT_PAGES", 2)
+    return state
+
+
+def test_all_pages_are_fetched(api):
+    pages = list(fetch_pages(URL, "users"))
+
+    assert pages == [api["records"][0:2], api["records"][2:4], api["records"][4:]]
+
+
+def test_fewer_records_than_total_raises(api):
+    api["total"] = 7
+
+    with pytest.raises(PaginationError, match="reports 7 records"):
+        list(fetch_pages(URL, "users"))
+
+
+def test_more_records_than_total_raises(api):
+    api["total"] = 4
+
+    with pytest.raises(PaginationError, match="but 5 were fetched"):
+        list(fetch_pages(URL, "users", page_size=10))
+
+
+def test_extraction_with_record_count_mismatch_fails(api, tmp_path):
+    cache = ExtractCache(str(tmp_path / "cache.json"))
+    assert extract_endpoint("users", URL, str(tmp_path), cache) == (
+        str(tmp_path / extract.raw_file_name("users")),
+        True,
+    )
+    api["records"] = api["records"][:3]
+    api["total"] = 5
+
+    assert extract_endpoint("users", URL, str(tmp_path), cache) == (None, False)
+    # Previous raw file and its cache entry are kept, no partial file is left
+    assert sorted(os.listdir(tmp_path)) == [extract.raw_file_name("users")]
+    assert cache.get(URL)["records"] == 5
+
+
+def test_in_memory_extraction_with_record_count_mismatch_fails(api, tmp_path):
+    api["total"] = 6
+    records = {}
+
+    assert extract_endpoint("users", URL, str(tmp_path), records=records) == (
+        None,
+        False,
+    )
+    assert not records
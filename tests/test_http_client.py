@@ -0,0 +1,202 @@
+"""Tests of shared HTTP client (src/http_client.py) against a local HTTP server"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from src import http_client
+from src.http_client import HttpClient, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleep (no real waiting in tests)."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ScriptedServer:
+    """Local HTTP server answering requests with scripted responses
+    (status, headers, body), the last one is repeated when script runs out."""
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []  # Headers of received requests
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                index = min(len(server.requests), len(server.responses)) - 1
+                status, headers, body = server.responses[index]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}/users"
+
+    def respond(self, *responses):
+        self.responses = [
+            (status, headers or {}, body) for status, headers, body in responses
+        ]
+
+
+@pytest.fixture
+def server():
+    server = ScriptedServer()
+    thread = threading.Thread(
+        target=server.httpd.serve_forever, args=(0.05,), daemon=True
+    )
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(
+        http_client,
+        "time",
+        SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep),
+    )
+    # Backoff with full jitter takes the whole delay
+    monkeypatch.setattr(http_client.random, "uniform", lambda low, high: high)
+    return clock
+
+
+def make_client(**settings) -> HttpClient:
+    defaults = {
+        "timeout": 5,
+        "max_retries": 4,
+        "backoff_base": 0.5,
+        "backoff_max": 10,
+        "pool_maxsize": 2,
+        "rate_limit": 0,
+        "rate_burst": 1,
+    }
+    return HttpClient(**{**defaults, **settings})
+
+
+OK = (200, None, b'{"users": []}')
+BUSY = (503, None, b"busy")
+
+
+def test_retries_with_exponential_backoff(server, clock):
+    server.respond(BUSY, BUSY, BUSY, OK)
+    client = make_client()
+
+    response = client.get(server.url)
+
+    assert response.status_code == 200
+    assert clock.sleeps == [0.5, 1.0, 2.0]
+    assert client.stats(server.url) == {
+        "requests": 4,
+        "retries": 3,
+        "bytes_received": 3 * len(b"busy") + len(OK[2]),
+    }
+
+
+def test_backoff_is_capped(server, clock):
+    server.respond(BUSY)
+    client = make_client(max_retries=5, backoff_base=1, backoff_max=3)
+
+    assert client.get(server.url) is None
+    assert clock.sleeps == [1, 2, 3, 3]
+    assert len(server.requests) == 5
+
+
+def test_not_retryable_status_is_not_retried(server, clock):
+    server.respond((404, None, b"not found"))
+
+    assert make_client().get(server.url) is None
+    assert len(server.requests) == 1
+    assert clock.sleeps == []
+
+
+def test_retry_after_seconds_is_honored(server, clock):
+    server.respond((429, {"Retry-After": "4"}, b"slow down"), OK)
+
+    response = make_client().get(server.url)
+
+    assert response.status_code == 200
+    assert clock.sleeps == [4.0]
+
+
+def test_retry_after_is_capped_by_backoff_max(server, clock):
+    server.respond((503, {"Retry-After": "120"}, b"busy"), OK)
+
+    assert make_client(backoff_max=10).get(server.url).status_code == 200
+    assert clock.sleeps == [10]
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = SimpleNamespace(headers={"Retry-After": format_datetime(retry_at)})
+
+    assert 25 < HttpClient.retry_after(response) <= 30
+    assert HttpClient.retry_after(SimpleNamespace(headers={})) is None
+    assert HttpClient.retry_after(SimpleNamespace(headers={"Retry-After": "x"})) is None
+
+
+def test_not_modified_response_is_returned(server, clock):
+    server.respond((304, {"ETag": '"v1"'}, b""))
+
+    response = make_client().get(server.url, headers={"If-None-Match": '"v1"'})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v1"'
+    assert server.requests[0]["If-None-Match"] == '"v1"'
+    assert len(server.requests) == 1
+    assert clock.sleeps == []
+
+
+def test_token_bucket_allows_burst_then_limits_rate(clock):
+    bucket = TokenBucket(rate=4, capacity=2)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.25, 0.25]
+    assert clock.now == 0.5
+
+
+def test_token_bucket_refills_while_idle(clock):
+    bucket = TokenBucket(rate=4, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10  # Refill is capped by capacity
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.25]
+
+
+def test_requests_are_rate_limited_per_host(server, clock):
+    server.respond(OK)
+    client = make_client(rate_limit=2, rate_burst=1)
+
+    for _ in range(3):
+        assert client.get(server.url).status_code == 200
+
+    assert clock.sleeps == [0.5, 0.5]
+    assert len(server.requests) == 3
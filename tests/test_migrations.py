@@ -0,0 +1,93 @@
+"""Tests of schema migration manager (src/migrations.py) on SQLite"""
+
+import os
+import shutil
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+import config
+from src.migrations import MigrationManager
+
+DDL_FILE = "schema_sqlite_ddl.sql"
+USER_ROW = {
+    "user_id": 1,
+    "first_name": "Emily",
+    "last_name": "Johnson",
+    "email": "emily.johnson@x.dummyjson.com",
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'etl.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def base_only_sql_dir(tmp_path):
+    """SQL folder with base DDL script only (schema before any migration)."""
+    sql_dir = tmp_path / "sql"
+    sql_dir.mkdir()
+    shutil.copy(os.path.join(config.SQL_DIR, DDL_FILE), sql_dir)
+    return str(sql_dir)
+
+
+def user_columns(engine) -> set:
+    return {column["name"] for column in inspect(engine).get_columns("users")}
+
+
+def insert_user(engine):
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO users (user_id, first_name, last_name, email)"
+                " VALUES (:user_id, :first_name, :last_name, :email)"
+            ),
+            USER_ROW,
+        )
+
+
+def test_migration_keeps_rows_of_existing_database(engine, base_only_sql_dir):
+    # Database created and loaded before address columns were added
+    assert MigrationManager(engine, base_only_sql_dir, "sqlite").migrate(DDL_FILE)
+    insert_user(engine)
+    assert "city" not in user_columns(engine)
+
+    schema_applied = MigrationManager(engine, config.SQL_DIR, "sqlite").migrate(
+        DDL_FILE
+    )
+
+    assert not schema_applied
+    assert {"city", "state", "postal_code"} <= user_columns(engine)
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT user_id, email, city FROM users")
+        ).fetchall()
+    assert rows == [(1, USER_ROW["email"], None)]
+
+
+def test_migrations_are_applied_once(engine):
+    manager = MigrationManager(engine, config.SQL_DIR, "sqlite")
+    assert manager.migrate(DDL_FILE)
+    insert_user(engine)
+
+    assert not manager.migrate(DDL_FILE)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM users")).scalar() == 1
+
+
+def test_forced_migrate_recreates_tables_with_migrations(engine):
+    manager = MigrationManager(engine, config.SQL_DIR, "sqlite")
+    manager.migrate(DDL_FILE)
+    insert_user(engine)
+
+    assert manager.migrate(DDL_FILE, force=True)
+
+    assert {"city", "state", "postal_code"} <= user_columns(engine)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT COUNT(*) FROM users")).scalar() == 0
+    # Recorded state matches recreated tables, next migrate keeps them
+    insert_user(engine)
+    assert not manager.migrate(DDL_FILE)
@@ -0,0 +1,146 @@
+"""Tests of DAG task scheduler (src/scheduler.py) and timeouts of pipeline tasks"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+import config
+from src.pipeline import PipelineTasks
+from src.scheduler import FAILED, SKIPPED, SUCCEEDED, TIMED_OUT, TaskScheduler
+
+
+def flaky(failures: int, result="done"):
+    """Function failing its first calls."""
+    calls = []
+
+    def func():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise RuntimeError(f"failure {len(calls)}")
+        return result
+
+    func.calls = calls
+    return func
+
+
+def test_dependencies_and_results():
+    scheduler = TaskScheduler(max_workers=2, retry_delay=0)
+    scheduler.add_task("extract", lambda: 2)
+    scheduler.add_task("load", lambda: scheduler.result("extract") * 3, ["extract"])
+
+    assert scheduler.run()
+    assert scheduler.result("load") == 6
+
+
+def test_failed_task_is_retried_after_backoff():
+    func = flaky(failures=2)
+    scheduler = TaskScheduler(max_workers=1, retry_delay=0.05)
+    scheduler.add_task("extract", func, retries=2)
+
+    assert scheduler.run()
+    gaps = [later - earlier for earlier, later in zip(func.calls, func.calls[1:])]
+    assert gaps[0] >= 0.05 and gaps[1] >= 0.1
+
+
+def test_failed_task_skips_dependent_tasks():
+    scheduler = TaskScheduler(max_workers=2, retry_delay=0)
+    scheduler.add_task("extract", flaky(failures=5), retries=1)
+    scheduler.add_task("load", lambda: None, ["extract"])
+
+    assert not scheduler.run()
+    assert scheduler.states == {"extract": FAILED, "load": SKIPPED}
+
+
+def test_backoff_of_retry_does_not_count_to_timeout():
+    scheduler = TaskScheduler(max_workers=1, retry_delay=0.3)
+    scheduler.add_task("extract", flaky(failures=1), retries=1, timeout=0.2)
+
+    assert scheduler.run()
+    assert scheduler.states == {"extract": SUCCEEDED}
+
+
+def test_queue_time_does_not_count_to_timeout():
+    scheduler = TaskScheduler(max_workers=1, retry_delay=0)
+    scheduler.add_task("slow", lambda: time.sleep(0.3))
+    scheduler.add_task("quick", lambda: None, timeout=0.2)
+
+    assert scheduler.run()
+    assert scheduler.states == {"slow": SUCCEEDED, "quick": SUCCEEDED}
+
+
+def test_running_attempt_times_out():
+    release = threading.Event()
+    scheduler = TaskScheduler(max_workers=2, retry_delay=0)
+    scheduler.add_task("extract", release.wait, retries=1, timeout=0.1)
+    scheduler.add_task("load", lambda: None, ["extract"])
+
+    assert not scheduler.run()
+    release.set()
+    assert scheduler.states == {"extract": TIMED_OUT, "load": SKIPPED}
+
+
+@pytest.fixture
+def task_timeout(monkeypatch):
+    monkeypatch.setattr(config, "TASK_TIMEOUT", 0.1, raising=False)
+    monkeypatch.setattr(config, "TASK_MAX_RETRIES", 0, raising=False)
+    monkeypatch.setattr(config, "TRANSFORM_CHUNK_SIZE", 0, raising=False)
+
+
+def pipeline_tasks(load_target, slow_load_seconds):
+    """Tasks of users entity with stubbed extract/transform and slow load."""
+    scheduler = TaskScheduler(max_workers=2, retry_delay=0)
+    tasks = PipelineTasks(scheduler, load_target, None, schema_applied=True)
+    tasks.extract = lambda name, url: (None, True)
+    tasks.transform = lambda name: {}
+    tasks.loaded = threading.Event()
+
+    def load(name):
+        time.sleep(slow_load_seconds)
+        tasks.loaded.set()
+
+    tasks.load = load
+    tasks.add_entity("users", "http://localhost/users", ["users"])
+    return tasks
+
+
+def test_load_over_shared_connection_is_not_timed_out(task_timeout, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'etl.db'}")
+    with engine.connect() as connection:
+        tasks = pipeline_tasks(connection, slow_load_seconds=0.3)
+
+        assert tasks.run()
+        # Run returned after the load finished, connection is free again
+        assert tasks.loaded.is_set()
+        assert tasks.scheduler.states["load:users"] == SUCCEEDED
+    engine.dispose()
+
+
+def test_load_over_engine_is_timed_out(task_timeout, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'etl.db'}")
+    tasks = pipeline_tasks(engine, slow_load_seconds=0.5)
+
+    assert not tasks.run()
+    assert tasks.scheduler.states["load:users"] == TIMED_OUT
+    assert tasks.scheduler.states["extract:users"] == SUCCEEDED
+    tasks.loaded.wait()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("atomic, load_retries", [(False, 2), (True, 0)])
+def test_upsert_load_is_not_retried_in_atomic_load(
+    monkeypatch, tmp_path, atomic, load_retries
+):
+    monkeypatch.setattr(config, "LOAD_ATOMIC", atomic, raising=False)
+    monkeypatch.setattr(config, "TASK_MAX_RETRIES", 2, raising=False)
+    monkeypatch.setattr(config, "TRANSFORM_CHUNK_SIZE", 0, raising=False)
+    engine = create_engine(f"sqlite:///{tmp_path / 'etl.db'}")
+    with engine.connect() as connection:
+        scheduler = TaskScheduler()
+        tasks = PipelineTasks(scheduler, connection, None, False, load_mode="upsert")
+        tasks.add_entity("users", "http://localhost/users", ["users"])
+
+        assert scheduler._tasks["load:users"].retries == load_retries
+        assert scheduler._tasks["extract:users"].retries == 2
+    engine.dispose()
@@ -0,0 +1,175 @@
+"""Tests of upsert load mode (src/load.py) on SQLite"""
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+import config
+from src.load import load_dataframe_to_db
+from src.migrations import MigrationManager
+
+LOAD_ORDER = ["users", "products", "product_reviews", "carts", "cart_items"]
+
+
+def source_tables() -> dict:
+    return {
+        "users": pd.DataFrame(
+            {
+                "user_id": [1, 2, 3],
+                "first_name": ["Emily", "Michael", "Sophia"],
+                "last_name": ["Johnson", "Williams", "Brown"],
+                "email": ["emily@x.com", "michael@x.com", "sophia@x.com"],
+                "age": [28, 35, 42],
+            }
+        ),
+        "products": pd.DataFrame(
+            {
+                "id": [10, 11],
+                "title": ["Mascara", "Eyeshadow"],
+                "category": ["beauty", "beauty"],
+                "price": [9.99, 19.99],
+                "stock": [5, 44],
+            }
+        ),
+        "product_reviews": pd.DataFrame(
+            {
+                "product_id": [10, 10, 11],
+                "rating": [5, 2, 4],
+                "comment": ["Great", "Poor", "Good"],
+                "reviewer_name": ["Eleanor", "Lucas", "Ava"],
+            }
+        ),
+        "carts": pd.DataFrame(
+            {
+                "cart_id": [100, 101],
+                "user_id": [1, 2],
+                "cart_total": [39.97, 19.99],
+                "total_products": [2, 1],
+                "total_quantity": [3, 1],
+            }
+        ),
+        "cart_items": pd.DataFrame(
+            {
+                "cart_id": [100, 100, 101],
+                "product_id": [10, 11, 11],
+                "title": ["Mascara", "Eyeshadow", "Eyeshadow"],
+                "quantity": [2, 1, 1],
+                "price": [9.99, 19.99, 19.99],
+            }
+        ),
+    }
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'etl.db'}")
+    MigrationManager(engine, config.SQL_DIR, "sqlite").migrate(
+        "schema_sqlite_ddl.sql", force=True
+    )
+    yield engine
+    engine.dispose()
+
+
+def upsert(engine, tables: dict, method: str):
+    for table_name in LOAD_ORDER:
+        assert load_dataframe_to_db(
+            tables[table_name], table_name, engine, if_exists="upsert", method=method
+        )
+
+
+def rows(engine, query: str) -> list:
+    with engine.connect() as connection:
+        return connection.execute(text(query)).fetchall()
+
+
+def counts(engine) -> dict:
+    return {
+        table_name: rows(engine, f"SELECT COUNT(*) FROM {table_name}")[0][0]
+        for table_name in LOAD_ORDER
+    }
+
+
+@pytest.fixture(params=["bulk", "to_sql"])
+def method(request):
+    return request.param
+
+
+def test_repeated_upsert_does_not_duplicate_rows(engine, method):
+    upsert(engine, source_tables(), method)
+    first = counts(engine)
+    item_ids = rows(engine, "SELECT item_id FROM cart_items ORDER BY item_id")
+
+    upsert(engine, source_tables(), method)
+
+    assert first == {
+        "users": 3,
+        "products": 2,
+        "product_reviews": 3,
+        "carts": 2,
+        "cart_items": 3,
+    }
+    assert counts(engine) == first
+    # Unchanged children are not replaced
+    assert rows(engine, "SELECT item_id FROM cart_items ORDER BY item_id") == item_ids
+    # Staging tables are temporary, nothing is left in the database
+    assert not rows(engine, "SELECT name FROM sqlite_master WHERE name LIKE '%stage'")
+
+
+def test_changed_row_is_updated(engine, method):
+    upsert(engine, source_tables(), method)
+    tables = source_tables()
+    tables["users"].loc[1, "email"] = "mike@x.com"
+
+    upsert(engine, tables, method)
+
+    assert rows(engine, "SELECT user_id, email FROM users ORDER BY user_id") == [
+        (1, "emily@x.com"),
+        (2, "mike@x.com"),
+        (3, "sophia@x.com"),
+    ]
+    assert counts(engine)["users"] == 3
+
+
+def test_children_of_changed_parents_are_replaced(engine, method):
+    upsert(engine, source_tables(), method)
+    untouched_item = rows(engine, "SELECT item_id FROM cart_items WHERE cart_id = 101")
+    tables = source_tables()
+    # Eyeshadow removed from cart 100, review of product 10 removed
+    tables["cart_items"] = tables["cart_items"].drop(index=1)
+    tables["product_reviews"] = tables["product_reviews"].drop(index=1)
+
+    upsert(engine, tables, method)
+
+    assert rows(
+        engine, "SELECT cart_id, product_id, quantity FROM cart_items ORDER BY cart_id"
+    ) == [(100, 10, 2), (101, 11, 1)]
+    assert (
+        rows(engine, "SELECT item_id FROM cart_items WHERE cart_id = 101")
+        == untouched_item
+    )
+    assert rows(
+        engine, "SELECT product_id, comment FROM product_reviews ORDER BY product_id"
+    ) == [(10, "Great"), (11, "Good")]
+
+
+def test_new_children_are_added(engine, method):
+    upsert(engine, source_tables(), method)
+    tables = source_tables()
+    tables["cart_items"] = pd.concat(
+        [
+            tables["cart_items"],
+            pd.DataFrame(
+                [{"cart_id": 101, "product_id": 10, "quantity": 4, "price": 9.99}]
+            ),
+        ],
+        ignore_index=True,
+    )
+
+    upsert(engine, tables, method)
+
+    assert rows(
+        engine,
+        "SELECT product_id, quantity FROM cart_items WHERE cart_id = 101"
+        " ORDER BY product_id",
+    ) == [(10, 4), (11, 1)]
+    assert counts(engine)["cart_items"] == 4